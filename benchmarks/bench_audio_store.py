@@ -0,0 +1,153 @@
+"""Peak memory of buffering a long document's audio, and codec cost.
+
+Buffers 30 minutes of speech the way TTSEngine.synthesize receives it,
+sentence by sentence, and reports the peak traced memory (tracemalloc)
+for the old approach (keep every sentence, then np.concatenate) and for
+an AudioStore with each buffer_compression codec. Then reports the
+encode and decode time per block against the block's playing time, and
+the largest error of near_lossless.
+
+Speech compresses differently from test signals, so pass a WAV of a real
+voice where possible (record one with ``python -m readtome --sink wav``);
+it is repeated up to the length. Without one, a synthetic voiced signal
+is used.
+
+Usage:
+    python benchmarks/bench_audio_store.py [--minutes 30] [--wav FILE]
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+import wave
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from readtome.audio_store import BLOCK_SAMPLES, CODECS, AudioStore  # noqa: E402
+
+SENTENCE_SECONDS = 4.0
+
+
+def read_wav(path: Path) -> tuple[np.ndarray, int]:
+    with wave.open(str(path), "rb") as f:
+        if f.getsampwidth() != 2:
+            sys.exit(f"{path} is not 16-bit PCM")
+        samples = np.frombuffer(f.readframes(f.getnframes()), dtype=np.int16)
+        return samples[::f.getnchannels()].copy(), f.getframerate()
+
+
+def synthetic_voice(seconds: float, sr: int = 22050) -> np.ndarray:
+    """Harmonics of a gliding pitch through two moving formants, in syllables."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * sr)) / sr
+    f0 = 150 + 40 * np.sin(2 * np.pi * 0.3 * t) + 15 * np.sin(2 * np.pi * 2.1 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / sr
+    formants = (
+        (650 + 200 * np.sin(2 * np.pi * 1.3 * t), 90),
+        (1700 + 500 * np.sin(2 * np.pi * 0.9 * t + 1), 120),
+    )
+    voiced = np.zeros_like(t)
+    for h in range(1, 40):
+        f = h * f0
+        gain = sum(1 / (1 + ((f - fc) / bw) ** 2) for fc, bw in formants) + 0.05
+        voiced += np.where(f < sr / 2, gain / h, 0) * np.sin(h * phase)
+    syllables = np.clip(np.sin(2 * np.pi * 4 * t), 0, None) ** 0.7
+    pauses = (np.sin(2 * np.pi * t / SENTENCE_SECONDS) > -0.9).astype(float)
+    signal = voiced * syllables * pauses + 0.003 * rng.standard_normal(len(t))
+    return np.rint(signal / np.max(np.abs(signal)) * 0.9 * 32767).astype(np.int16)
+
+
+def sentences(clip: np.ndarray, sr: int, total: int):
+    """Fresh arrays of about a sentence each, cycling through the clip."""
+    step = int(sr * SENTENCE_SECONDS)
+    produced = 0
+    while produced < total:
+        start = produced % len(clip)
+        piece = clip[start:start + min(step, total - produced)].copy()
+        produced += len(piece)
+        yield piece
+
+
+def peak_mb(buffer, clip: np.ndarray, sr: int, total: int) -> float:
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    result = buffer(sentences(clip, sr, total))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return peak / 1e6
+
+
+def concatenated(pieces):
+    chunks = list(pieces)
+    return np.concatenate(chunks)
+
+
+def chunked(codec: str):
+    def buffer(pieces):
+        store = AudioStore(codec)
+        for piece in pieces:
+            store.append(piece)
+        return store
+    return buffer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=float, default=30)
+    parser.add_argument("--wav", type=Path, help="16-bit WAV of a real voice")
+    args = parser.parse_args()
+
+    if args.wav:
+        clip, sr = read_wav(args.wav)
+    else:
+        sr = 22050
+        clip = synthetic_voice(60, sr)
+    total = int(args.minutes * 60 * sr)
+    print(f"{args.minutes:.0f} min at {sr} Hz ({total * 2 / 1e6:.1f} MB as int16), "
+          f"{'synthetic' if not args.wav else args.wav.name}")
+
+    print(f"  {'buffer':24} {'peak':>9} {'held':>9}")
+    print(f"  {'concatenate (before)':24} {peak_mb(concatenated, clip, sr, total):7.1f}MB "
+          f"{total * 2 / 1e6:7.1f}MB")
+    for codec in CODECS:
+        store = chunked(codec)(sentences(clip, sr, total))
+        held = store.nbytes / 1e6
+        del store
+        print(f"  {'AudioStore ' + codec:24} {peak_mb(chunked(codec), clip, sr, total):7.1f}MB "
+              f"{held:7.1f}MB")
+
+    block_seconds = BLOCK_SAMPLES / sr
+    print(f"\nper {BLOCK_SAMPLES}-sample block ({block_seconds * 1000:.0f}ms of audio)")
+    print(f"  {'codec':14} {'ratio':>6} {'encode':>9} {'decode':>9} {'decode max':>11} "
+          f"{'x realtime':>11} {'max error':>10}")
+    sample = clip[:min(len(clip), sr * 60)]
+    blocks = -(-len(sample) // BLOCK_SAMPLES)
+    for codec in CODECS[1:]:
+        t0 = time.perf_counter()
+        store = AudioStore.from_array(sample, codec)
+        encode = (time.perf_counter() - t0) / blocks
+        # Time each block as the player would pull it
+        times, decoded = [], []
+        reader = store.blocks()
+        while True:
+            t0 = time.perf_counter()
+            block = next(reader, None)
+            if block is None:
+                break
+            times.append(time.perf_counter() - t0)
+            decoded.append(block)
+        error = np.max(np.abs(np.concatenate(decoded).astype(np.int32) - sample))
+        decode = float(np.mean(times))
+        print(
+            f"  {codec:14} {sample.nbytes / store.nbytes:5.2f}x {encode * 1e6:7.0f}us "
+            f"{decode * 1e6:7.0f}us {max(times) * 1e6:9.0f}us "
+            f"{block_seconds / decode:10.0f}x {error:10d}"
+        )
+
+
+if __name__ == "__main__":
+    main()
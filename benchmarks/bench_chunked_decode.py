@@ -0,0 +1,112 @@
+"""First-audio latency and accuracy of chunked (clause-level) decoding.
+
+Synthesizes one long sentence with the configured voice twice per run,
+once whole and once clause by clause (``chunked_decode``), and reports
+time to first audio and total synthesis time for each. Sampling noise
+is disabled so both decodes are deterministic, then the chunked output
+is checked against the full decode: overall duration, loudness and
+long-term average spectrum must stay within tolerance (exit code 1 if
+not).
+
+Usage:
+    python benchmarks/bench_chunked_decode.py [--runs 5] [--text "..."]
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from readtome.config import Config  # noqa: E402
+from readtome.tts_engine import TTSEngine  # noqa: E402
+
+# About 60 words, with the commas a long sentence usually has
+DEFAULT_TEXT = (
+    "When the storm finally passed over the valley late in the evening, "
+    "the farmers who had been waiting anxiously in their kitchens since noon "
+    "walked out into the soaked fields, counted the broken fences and fallen "
+    "branches one by one, and decided, after a long and tired discussion, "
+    "that the harvest could still be saved if everyone started early tomorrow."
+)
+
+# Tolerances for the chunked decode against the full decode
+_MAX_DURATION_DIFF = 0.10   # Fraction of the full decode's length
+_MAX_LEVEL_DIFF_DB = 1.5    # RMS loudness
+_MAX_LTAS_DIFF_DB = 3.0     # Mean long-term spectrum difference
+
+
+def synthesize(engine: TTSEngine, text: str) -> tuple[float, float, np.ndarray, int]:
+    engine.clear_sentence_cache()  # Time synthesis, not replays of the last run
+    t0 = time.perf_counter()
+    first = None
+    chunks = []
+    sr = engine.sample_rate
+    for samples, sr, _ in engine.synthesize_stream(text):
+        if first is None:
+            first = time.perf_counter() - t0
+        chunks.append(samples)
+    return first, time.perf_counter() - t0, np.concatenate(chunks).astype(np.float32), sr
+
+
+def ltas_db(audio: np.ndarray, frame: int = 1024) -> np.ndarray:
+    """Long-term average spectrum, which doesn't need the two signals aligned."""
+    frames = np.lib.stride_tricks.sliding_window_view(audio, frame)[::frame // 2]
+    power = np.mean(np.abs(np.fft.rfft(frames * np.hanning(frame), axis=1)) ** 2, axis=0)
+    return 10 * np.log10(power + 1e-9)
+
+
+def rms_db(audio: np.ndarray) -> float:
+    return 20 * np.log10(np.sqrt(np.mean(audio ** 2)) + 1e-9)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--text", default=DEFAULT_TEXT)
+    args = parser.parse_args()
+
+    from piper.config import SynthesisConfig
+
+    config = Config.load()
+    config.resolve_model_paths(Config.get_base_dir())
+    config.trim_silence = False
+    engine = TTSEngine(config)
+    engine.load_model()
+    # Deterministic output, so the two decodes differ only by chunking
+    engine._make_syn_config = lambda speed=None: SynthesisConfig(
+        noise_scale=0.0, noise_w_scale=0.0,
+    )
+    print(f"{len(args.text.split())} words, voice {Path(config.model_path).stem}")
+
+    results = {}
+    for chunked in (False, True):
+        config.chunked_decode = chunked
+        synthesize(engine, args.text)  # Warm-up
+        runs = [synthesize(engine, args.text) for _ in range(args.runs)]
+        label = "chunked" if chunked else "full"
+        first = statistics.median(r[0] for r in runs)
+        total = statistics.median(r[1] for r in runs)
+        print(f"  {label:8} first audio {first * 1000:7.0f}ms, total {total * 1000:7.0f}ms")
+        results[label] = runs[-1]
+
+    full, chunked = results["full"][2], results["chunked"][2]
+    sr = results["full"][3]
+    duration_diff = abs(len(chunked) - len(full)) / len(full)
+    level_diff = abs(rms_db(chunked) - rms_db(full))
+    ltas_diff = float(np.mean(np.abs(ltas_db(chunked) - ltas_db(full))))
+    print(f"  duration {len(full) / sr:.2f}s full vs {len(chunked) / sr:.2f}s chunked "
+          f"({duration_diff:.1%}), level diff {level_diff:.2f} dB, "
+          f"spectrum diff {ltas_diff:.2f} dB")
+
+    ok = (duration_diff <= _MAX_DURATION_DIFF and level_diff <= _MAX_LEVEL_DIFF_DB
+          and ltas_diff <= _MAX_LTAS_DIFF_DB)
+    print("  accuracy:", "PASS" if ok else "FAIL")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Idle and speaking cost: thread wakeups per second and CPU time.
+
+Starts the app's background machinery (voice loaded, config watcher,
+idle timer) without the tray icon or global hotkey, then measures over a
+window while idle and while speaking through a real-time null sink.
+Wakeups are counted as context switches of all the process's threads
+(from /proc on Linux, or psutil elsewhere if it is installed); the
+measuring thread's own sleep accounts for about one.
+
+Usage:
+    python benchmarks/bench_idle.py [--seconds 60] [--text FILE]
+"""
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from readtome.app import ReadToMeApp  # noqa: E402
+from readtome.sinks import NullSink  # noqa: E402
+
+DEFAULT_TEXT = (
+    "The quick brown fox jumps over the lazy dog. "
+    "Highlight text anywhere on your screen, press a keyboard shortcut, "
+    "and hear it spoken back to you. No internet connection is required, "
+    "because the neural voice runs entirely on this machine."
+)
+
+
+def context_switches() -> int | None:
+    """Voluntary + involuntary context switches of every thread in this process."""
+    if sys.platform.startswith("linux"):
+        total = 0
+        for status in Path("/proc/self/task").glob("*/status"):
+            try:
+                for line in status.read_text().splitlines():
+                    if "ctxt_switches:" in line:
+                        total += int(line.split()[1])
+            except OSError:
+                pass  # Thread exited while we were reading
+        return total
+    try:
+        import psutil
+    except ImportError:
+        return None
+    switches = psutil.Process().num_ctx_switches()
+    return switches.voluntary + switches.involuntary
+
+
+def measure(seconds: float) -> tuple[float | None, float]:
+    """(wakeups per second, CPU seconds per second) over the window."""
+    switches0, cpu0 = context_switches(), time.process_time()
+    time.sleep(seconds)
+    switches1, cpu1 = context_switches(), time.process_time()
+    rate = None if switches0 is None else (switches1 - switches0) / seconds
+    return rate, (cpu1 - cpu0) / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=60)
+    parser.add_argument("--text", type=Path, help="Read text from this file")
+    args = parser.parse_args()
+
+    text = args.text.read_text(encoding="utf-8") if args.text else DEFAULT_TEXT
+    app = ReadToMeApp(sink=NullSink(realtime=True))
+    app._load_model()
+    app._store.start()
+
+    results = {}
+    time.sleep(1)  # Let startup work settle
+    results["idle"] = measure(args.seconds)
+
+    speaking = threading.Event()
+    speaking.set()
+
+    def speak_loop():
+        while speaking.is_set():
+            app._speak_text(text)
+
+    thread = threading.Thread(target=speak_loop, daemon=True)
+    thread.start()
+    results["speaking"] = measure(args.seconds)
+    speaking.clear()
+    app._player.stop()
+    thread.join()
+    app._store.stop()
+
+    print(f"{args.seconds:.0f}s windows")
+    for label, (wakeups, cpu) in results.items():
+        wakeups_text = "n/a (install psutil)" if wakeups is None else f"{wakeups:8.1f}/s"
+        print(f"  {label:9} wakeups {wakeups_text}, CPU {cpu * 100:5.1f}%")
+
+
+if __name__ == "__main__":
+    main()
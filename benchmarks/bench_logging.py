@@ -0,0 +1,98 @@
+"""Benchmark per-chunk logging overhead on the speech hot path.
+
+Emits the debug records the synthesis/playback loops log for each chunk
+and times them under three setups: debug logging off, debug logging to a
+synchronous FileHandler (the old setup), and debug logging through the
+queued, rotating setup from readtome.logs. Pass --log-dir to put the log
+on a slow disk (e.g. a network share) to see the difference in p99.
+Between chunks the loop sleeps for --gap-ms, standing in for synthesis
+(which releases the GIL), so the listener thread gets to run as it would
+in the app.
+
+Usage:
+    python benchmarks/bench_logging.py [--chunks 5000] [--gap-ms 0.5] [--log-dir DIR]
+"""
+import argparse
+import atexit
+import logging
+import logging.handlers
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from readtome.logs import LOG_FORMAT, setup_logging  # noqa: E402
+
+logger = logging.getLogger("readtome.bench")
+
+
+def log_chunk(chunk_num: int, samples: np.ndarray, sr: int, key: str):
+    """The per-chunk records of _stream_blocks and synthesize_stream, guarded the same way."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Sentence synthesized in %.2fs (rolling %.1fx realtime, %s)",
+            0.123, 4.5, Path(key).stem,
+        )
+        logger.debug(
+            "Chunk %d: %d samples (%.1fs audio)",
+            chunk_num, len(samples), len(samples) / sr,
+        )
+
+
+def run(chunks: int, gap_seconds: float) -> np.ndarray:
+    samples = np.zeros(22050 * 3, dtype=np.int16)
+    key = "models/en_US-amy-medium.onnx"
+    timings = np.empty(chunks)
+    for i in range(chunks):
+        t0 = time.perf_counter()
+        log_chunk(i, samples, 22050, key)
+        timings[i] = time.perf_counter() - t0
+        time.sleep(gap_seconds)
+    return timings * 1e6
+
+
+def configure(mode: str, log_file: Path):
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+    if mode == "queued":
+        return setup_logging(log_file, logging.DEBUG)
+    handler = logging.FileHandler(log_file, encoding="utf-8")
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    root.addHandler(handler)
+    root.setLevel(logging.INFO if mode == "off" else logging.DEBUG)
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=5000)
+    parser.add_argument("--gap-ms", type=float, default=0.5)
+    parser.add_argument("--log-dir", type=Path, default=None)
+    args = parser.parse_args()
+
+    log_dir = args.log_dir or Path(tempfile.mkdtemp(prefix="readtome-bench-"))
+    print(f"{args.chunks} chunks, log in {log_dir}")
+    for mode in ("off", "sync", "queued"):
+        log_file = log_dir / f"bench-{mode}.log"
+        listener = configure(mode, log_file)
+        us = run(args.chunks, args.gap_ms / 1000)
+        t0 = time.perf_counter()
+        if listener is not None:
+            listener.stop()  # Drain the queue, to show the deferred cost
+            atexit.unregister(listener.stop)
+        drain = time.perf_counter() - t0
+        line = (f"  {mode:7} per chunk: median {np.median(us):6.2f}us, "
+                f"p99 {np.percentile(us, 99):6.2f}us, max {us.max():8.1f}us")
+        if listener is not None:
+            line += f" (listener drained in {drain * 1000:.0f}ms off the hot path)"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Text normalization throughput and how much it removes.
+
+Normalizes a mix of prose, markdown, URLs, code blocks and log output
+(or your own file) repeated up to several sizes, and reports throughput
+per size, so a rule that stops being linear shows up as falling MB/s.
+Also reports the share of characters removed from one copy of the text.
+
+Usage:
+    python benchmarks/bench_normalize.py [--sizes 0.1 1 4] [--text FILE]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from readtome.normalize import RULES, normalize_text  # noqa: E402
+
+DEFAULT_TEXT = """\
+## Getting started
+Highlight text anywhere on your screen, press a **keyboard shortcut**, and
+hear it spoken back to you. See [the docs](https://github.com/example/readtome/blob/main/README.md#usage)
+or https://example.com/very/long/path?with=query&and=more for details.
+```python
+def speak(text):
+    return engine.synthesize(text)
+```
+2026-03-01 09:12:44,120 INFO [worker-3] Request handled in 12ms
+2026-03-01 09:12:44,348 INFO [worker-3] Request handled in 12ms
+2026-03-01 09:12:45,007 WARNING [main] Cache miss for key user:1234
+==============================================================
+- [x] Works offline
+- [ ] Runs on a `GPU`
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=float, nargs="+", default=[0.1, 1, 4], help="MB")
+    parser.add_argument("--text", type=Path, help="Read text from this file")
+    args = parser.parse_args()
+
+    sample = args.text.read_text(encoding="utf-8") if args.text else DEFAULT_TEXT
+    rules = ",".join(RULES)
+    removed = 1 - len(normalize_text(sample, rules)) / len(sample)
+    print(f"{removed:.1%} of the sample's characters removed")
+    for mb in args.sizes:
+        # Number the copies so repeated-line removal can't shortcut the work
+        parts, size, i = [], 0, 0
+        while size < mb * 1_000_000:
+            part = sample.replace("12ms", f"{i}ms")
+            parts.append(part)
+            size += len(part)
+            i += 1
+        text = "".join(parts)
+        t0 = time.perf_counter()
+        normalize_text(text, rules)
+        elapsed = time.perf_counter() - t0
+        print(
+            f"  {len(text) / 1e6:6.2f} MB  {elapsed * 1000:8.1f}ms  "
+            f"{len(text) / elapsed / 1e6:6.1f} MB/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
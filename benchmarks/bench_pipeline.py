@@ -0,0 +1,76 @@
+"""End-to-end speaking pipeline latency without audio hardware.
+
+Loads the configured voice and runs ReadToMeApp._speak_streaming against a
+capture sink (as fast as possible) or a null sink (real-time pacing), then
+reports time to first audio and total time per run.
+
+Usage:
+    python benchmarks/bench_pipeline.py [--sink capture|null] [--runs 5] [--text FILE]
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from readtome.app import ReadToMeApp  # noqa: E402
+from readtome.sinks import CaptureSink, NullSink  # noqa: E402
+
+DEFAULT_TEXT = (
+    "The quick brown fox jumps over the lazy dog. "
+    "Highlight text anywhere on your screen, press a keyboard shortcut, "
+    "and hear it spoken back to you. No internet connection is required, "
+    "because the neural voice runs entirely on this machine."
+)
+
+
+class _TimingNullSink(NullSink):
+    """Null sink that records when the first block arrives."""
+
+    def __init__(self):
+        super().__init__(realtime=True)
+        self.t_first_write: float | None = None
+
+    def open(self, sample_rate: int):
+        super().open(sample_rate)
+        self.t_first_write = None
+
+    def write(self, samples):
+        if self.t_first_write is None:
+            self.t_first_write = time.perf_counter()
+        super().write(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sink", choices=("capture", "null"), default="capture")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--text", type=Path, help="Read text from this file")
+    args = parser.parse_args()
+
+    text = args.text.read_text(encoding="utf-8") if args.text else DEFAULT_TEXT
+    sink = CaptureSink() if args.sink == "capture" else _TimingNullSink()
+    app = ReadToMeApp(sink=sink)
+    app._load_model()
+
+    first, total = [], []
+    for _ in range(args.runs):
+        t0 = time.perf_counter()
+        app._speak_streaming(text)
+        total.append(time.perf_counter() - t0)
+        if isinstance(sink, CaptureSink):
+            t_first = sink.streams[-1][2]
+        else:
+            t_first = sink.t_first_write
+        first.append(t_first - t0)
+
+    print(f"{len(text)} chars, {args.runs} runs, sink={args.sink}")
+    print(f"  first audio: median {statistics.median(first) * 1000:.0f}ms, "
+          f"max {max(first) * 1000:.0f}ms")
+    print(f"  total:       median {statistics.median(total):.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Edit-and-reread speedup from reusing unchanged sentences' audio.
+
+Reads a paragraph with the configured voice, changes one word in one
+sentence, and reads it again, as when proofreading. Each re-read is timed
+twice: from scratch (sentence cache cleared) and incrementally (only the
+edited sentence synthesized). Reports time to first audio and total
+synthesis time for both.
+
+Usage:
+    python benchmarks/bench_reread.py [--edits 5] [--text FILE]
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from readtome.config import Config  # noqa: E402
+from readtome.tts_engine import TTSEngine  # noqa: E402
+
+DEFAULT_TEXT = (
+    "The quick brown fox jumps over the lazy dog. "
+    "Highlight text anywhere on your screen, press a keyboard shortcut, "
+    "and hear it spoken back to you. No internet connection is required, "
+    "because the neural voice runs entirely on this machine. "
+    "It works well on small virtual machines without a graphics card. "
+    "Voices are available in many languages and quality levels. "
+    "You can change the speed and pitch from the tray menu at any time."
+)
+
+_REPLACEMENTS = ["small", "bright", "quiet", "second", "simple", "modern"]
+
+
+def read(engine: TTSEngine, text: str) -> tuple[float, float]:
+    t0 = time.perf_counter()
+    first = None
+    for _ in engine.synthesize_stream(text):
+        if first is None:
+            first = time.perf_counter() - t0
+    return first, time.perf_counter() - t0
+
+
+def edit_one_word(text: str, rng: random.Random) -> str:
+    words = text.split(" ")
+    i = rng.randrange(len(words))
+    if words[i].endswith((".", ",")):
+        words[i] = rng.choice(_REPLACEMENTS) + words[i][-1]
+    else:
+        words[i] = rng.choice(_REPLACEMENTS)
+    return " ".join(words)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--edits", type=int, default=5)
+    parser.add_argument("--text", type=Path, help="Read text from this file")
+    args = parser.parse_args()
+
+    text = args.text.read_text(encoding="utf-8") if args.text else DEFAULT_TEXT
+    config = Config.load()
+    config.resolve_model_paths(Config.get_base_dir())
+    engine = TTSEngine(config)
+    engine.load_model()
+    read(engine, text)  # Warm-up
+
+    rng = random.Random(0)
+    cold, incremental = [], []
+    for _ in range(args.edits):
+        edited = edit_one_word(text, rng)
+        engine.clear_sentence_cache()
+        cold.append(read(engine, edited))
+        read(engine, text)  # Back to the original as "previous utterance"
+        incremental.append(read(engine, edited))
+        read(engine, text)
+
+    print(f"{len(text)} chars, {args.edits} single-word edits")
+    for label, runs in (("from scratch", cold), ("incremental", incremental)):
+        first = statistics.median(r[0] for r in runs)
+        total = statistics.median(r[1] for r in runs)
+        print(f"  {label:13} first audio {first * 1000:7.0f}ms, total {total * 1000:7.0f}ms")
+    speedup = statistics.median(r[1] for r in cold) / statistics.median(r[1] for r in incremental)
+    print(f"  re-read speedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Resampler throughput per chunk and accuracy.
+
+Streams a two-tone test signal through readtome.resample.Resampler in
+chunks of the sizes the player sees (0.1 s stretched blocks up to whole
+sentences), from common voice rates at each pitch preset to the output
+rate. Reports microseconds per chunk, speed as a multiple of real time
+and the signal-to-error ratio against an ideal signal at the output rate.
+
+Usage:
+    python benchmarks/bench_resample.py [--out-rate 48000] [--seconds 10]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from readtome.config import PITCH_PRESETS  # noqa: E402
+from readtome.resample import Resampler  # noqa: E402
+
+VOICE_RATES = (16000, 22050)
+CHUNK_SECONDS = (0.1, 0.5, 2.0)
+TONES = ((440.0, 8000.0), (3100.0, 4000.0))  # (Hz, amplitude)
+
+
+def tones(rate: float, n: int) -> np.ndarray:
+    t = np.arange(n) / rate
+    return sum(a * np.sin(2 * np.pi * f * t) for f, a in TONES)
+
+
+def run(src_rate: float, out_rate: int, seconds: float, chunk_seconds: float):
+    """(microseconds per chunk, x realtime, SNR dB)."""
+    signal = np.rint(tones(src_rate, int(src_rate * seconds))).astype(np.int16)
+    step = max(1, int(src_rate * chunk_seconds))
+    resampler = Resampler(src_rate, out_rate)
+    parts = []
+    t0 = time.perf_counter()
+    for i in range(0, len(signal), step):
+        parts.append(resampler.process(signal[i:i + step]))
+    parts.append(resampler.flush())
+    elapsed = time.perf_counter() - t0
+    out = np.concatenate(parts).astype(np.float64)
+
+    # Compare away from the edges; any error in the ratio shows up as drift
+    ideal = tones(out_rate, len(out))
+    mid = slice(out_rate // 10, len(out) - out_rate // 10)
+    error = out[mid] - ideal[mid]
+    snr = 10 * np.log10(np.mean(ideal[mid] ** 2) / np.mean(error ** 2))
+    chunks = -(-len(signal) // step)
+    return elapsed / chunks * 1e6, seconds / elapsed, snr
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out-rate", type=int, default=48000)
+    parser.add_argument("--seconds", type=float, default=10)
+    args = parser.parse_args()
+
+    print(f"to {args.out_rate} Hz, {args.seconds:.0f}s of audio per run")
+    print(f"  {'from':>14} {'chunk':>6} {'us/chunk':>10} {'x realtime':>11} {'SNR':>8}")
+    for voice_rate in VOICE_RATES:
+        for name, pitch in PITCH_PRESETS.items():
+            src_rate = voice_rate * pitch
+            for chunk in CHUNK_SECONDS:
+                us, speed, snr = run(src_rate, args.out_rate, args.seconds, chunk)
+                print(
+                    f"  {src_rate:8.0f} Hz {pitch:3.1f}x {chunk:5.1f}s {us:10.0f} "
+                    f"{speed:10.0f}x {snr:6.1f}dB"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Per-process memory with private vs shared model weights.
+
+Starts 1, 10 and 30 instances of the engine at once (each loads the voice
+and synthesizes a sentence, then waits), first loading the voice
+normally and then from its shared-weights copy, and reads each
+instance's memory from /proc/<pid>/smaps_rollup (Linux only):
+
+  USS  unique set size - memory only this process uses (Private_*)
+  PSS  proportional set size - unique memory plus its share of pages
+       mapped by several processes; summed over all instances it is what
+       they cost the machine together
+
+Make the shared copy first with ``readtome share-weights``.
+
+Usage:
+    python benchmarks/bench_shared_weights.py [--counts 1 10 30] [--model VOICE.onnx]
+"""
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from readtome.config import Config  # noqa: E402
+
+SENTENCE = "Highlight text anywhere on your screen and hear it spoken back to you."
+
+
+def worker(mode: str, model: str):
+    """Load the voice, synthesize once, report ready and wait for stdin to close."""
+    from readtome.tts_engine import TTSEngine
+
+    config = Config.load()
+    config.shared_weights = mode == "shared"
+    engine = TTSEngine(config)
+    engine.load_model(model)
+    engine.synthesize(SENTENCE)
+    print("ready", flush=True)
+    sys.stdin.read()
+
+
+def smaps_kb(pid: int) -> dict[str, int]:
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup", encoding="ascii") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return fields
+
+
+def measure(mode: str, model: str, count: int) -> tuple[float, float, float]:
+    """(mean USS MB, mean PSS MB, total PSS MB) for ``count`` instances."""
+    procs = [
+        subprocess.Popen(
+            [sys.executable, __file__, "--worker", mode, model],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+        )
+        for _ in range(count)
+    ]
+    try:
+        for proc in procs:
+            if proc.stdout.readline().strip() != "ready":
+                raise RuntimeError(f"{mode} instance failed to load {model}")
+        uss, pss = [], []
+        for proc in procs:
+            fields = smaps_kb(proc.pid)
+            uss.append((fields["Private_Clean"] + fields["Private_Dirty"]) / 1024)
+            pss.append(fields["Pss"] / 1024)
+    finally:
+        for proc in procs:
+            proc.stdin.close()
+        for proc in procs:
+            proc.wait()
+    return sum(uss) / count, sum(pss) / count, sum(pss)
+
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == "--worker":
+        worker(sys.argv[2], sys.argv[3])
+        return
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[1, 10, 30])
+    parser.add_argument("--model", help="Voice .onnx file (default: current voice)")
+    args = parser.parse_args()
+
+    if not sys.platform.startswith("linux"):
+        sys.exit("Needs /proc/<pid>/smaps_rollup (Linux)")
+    config = Config.load()
+    config.resolve_model_paths(Config.get_base_dir())
+    model = args.model or config.model_path
+    shared = Config.shared_variant(config.model_file_for(model))
+    if not shared.exists():
+        sys.exit(f"{shared.name} not found; run `readtome share-weights {model}` first")
+
+    print(f"{Path(model).name}, weights in {Path(f'{shared}.data').stat().st_size / 1e6:.1f} MB")
+    print(f"  {'weights':8} {'instances':>9} {'USS/proc':>10} {'PSS/proc':>10} {'PSS total':>10}")
+    for mode in ("private", "shared"):
+        for count in args.counts:
+            uss, pss, total = measure(mode, model, count)
+            print(f"  {mode:8} {count:9} {uss:8.1f}MB {pss:8.1f}MB {total:8.0f}MB")
+
+
+if __name__ == "__main__":
+    main()
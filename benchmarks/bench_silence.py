@@ -0,0 +1,64 @@
+"""Benchmark per-chunk latency of silence trimming.
+
+Builds sentence-sized chunks with leading/trailing silence and inner
+pauses (like Piper output) and times trim_silence() on each.
+
+Usage:
+    python benchmarks/bench_silence.py [--chunks 500] [--sample-rate 22050]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from readtome.silence import trim_silence  # noqa: E402
+
+
+def make_chunk(rng: np.random.Generator, sr: int) -> np.ndarray:
+    """A 2-8 s 'sentence': voiced bursts separated by pauses, padded with silence."""
+    parts = [np.zeros(int(sr * rng.uniform(0.1, 0.4)), dtype=np.float32)]
+    for _ in range(rng.integers(2, 6)):
+        n = int(sr * rng.uniform(0.4, 1.5))
+        t = np.arange(n) / sr
+        parts.append(6000 * np.sin(2 * np.pi * rng.uniform(100, 250) * t))
+        parts.append(np.zeros(int(sr * rng.uniform(0.05, 0.9)), dtype=np.float32))
+    parts.append(np.zeros(int(sr * rng.uniform(0.2, 0.6)), dtype=np.float32))
+    audio = np.concatenate(parts) + rng.normal(0, 3, sum(len(p) for p in parts))
+    return audio.astype(np.int16)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=500)
+    parser.add_argument("--sample-rate", type=int, default=22050)
+    parser.add_argument("--gap-ms", type=int, default=200)
+    parser.add_argument("--max-pause-ms", type=int, default=400)
+    args = parser.parse_args()
+
+    sr = args.sample_rate
+    rng = np.random.default_rng(0)
+    chunks = [make_chunk(rng, sr) for _ in range(args.chunks)]
+
+    timings = []
+    audio_in = audio_out = 0
+    for chunk in chunks:
+        t0 = time.perf_counter()
+        trimmed, _ = trim_silence(chunk, sr, args.gap_ms, args.max_pause_ms)
+        timings.append(time.perf_counter() - t0)
+        audio_in += len(chunk)
+        audio_out += len(trimmed)
+
+    ms = np.array(timings) * 1000
+    print(f"{args.chunks} chunks, {audio_in / sr:.0f}s of audio @ {sr}Hz")
+    print(f"  per chunk: median {np.median(ms):.3f}ms, p99 {np.percentile(ms, 99):.3f}ms")
+    print(f"  throughput: {audio_in / sr / sum(timings):.0f}x realtime")
+    print(f"  listening time saved: {(audio_in - audio_out) / sr:.1f}s "
+          f"({100 * (audio_in - audio_out) / audio_in:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
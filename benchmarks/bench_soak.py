@@ -0,0 +1,414 @@
+"""Soak test: hours of simulated hotkey traffic, checked for resource growth.
+
+Drives ReadToMeApp headlessly: the global hotkey, the clipboard and the
+sound card are replaced by in-process fakes, so "pressing" the hotkey
+copies a generated selection through the real capture and speaking code.
+Simulated time runs ahead of the wall clock: audio is consumed as fast as
+it is synthesized and idle gaps are skipped (an idle unload is triggered
+directly where the timer would have fired). Traffic mixes single reads,
+bursts of rapid interrupts, long texts, voice switches and idle periods.
+
+Threads, RSS and tracemalloc's traced memory are sampled at quiet points
+with the voice loaded. The run fails (exit code 1) if any of them grows
+past its bound relative to the first sample after warm-up, or if the
+user's clipboard was not restored after a capture; it stops at once if a
+voice fails to load. Runs in a temporary home directory so config.json
+and the performance history are untouched.
+
+Usage:
+    python benchmarks/bench_soak.py [--hours 4] [--seed 0] [--clipboard-error-rate 0]
+        [--max-thread-growth 3] [--max-rss-growth-mb 150] [--max-traced-growth-mb 25]
+"""
+import argparse
+import os
+import queue
+import random
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+PARAGRAPHS = (
+    "The quick brown fox jumps over the lazy dog.",
+    "Highlight text anywhere on your screen, press a keyboard shortcut, and hear it spoken back to you.",
+    "No internet connection is required, because the neural voice runs entirely on this machine.",
+    "It works well on small virtual machines without a graphics card.",
+    "Voices are available in many languages and quality levels.",
+    "You can change the speed and pitch from the tray menu at any time.",
+    "See **the release notes** at https://github.com/example/readtome/releases/latest for details.",
+    "2026-03-01 09:12:44,120 INFO [worker-3] Request handled in 12 milliseconds.",
+    "Meanwhile, the committee postponed its decision until the budget had been reviewed again.",
+    "Numbers such as 3.14, 1,024 and 42 are read out the way you would say them.",
+)
+
+# Traffic mix: (event, weight)
+EVENTS = (("read", 50), ("interrupts", 20), ("long", 8), ("switch", 4), ("idle", 8))
+
+
+# ── Fake backends ────────────────────────────────────────────────────
+
+
+class FakeClipboard:
+    """pyperclip stand-in; copy/paste fail at ``error_rate``, like a busy clipboard."""
+
+    def __init__(self, rng: random.Random, error_rate: float):
+        self._rng = rng
+        self._error_rate = error_rate
+        self._lock = threading.Lock()
+        self._text = ""
+
+    def _maybe_fail(self):
+        if self._error_rate and self._rng.random() < self._error_rate:
+            raise RuntimeError("clipboard is locked by another application")
+
+    def copy(self, text: str):
+        self._maybe_fail()
+        with self._lock:
+            self._text = text
+
+    def paste(self) -> str:
+        self._maybe_fail()
+        with self._lock:
+            return self._text
+
+
+class _KeyEvent:
+    def __init__(self, event_type: str, name: str):
+        self.event_type = event_type
+        self.name = name
+
+
+class FakeKeyboard:
+    """``keyboard`` stand-in: "pressing" fires hooks and hotkeys like the real one.
+
+    Hotkey callbacks run one at a time on a listener thread and hooks run
+    synchronously, as in the keyboard library. Sending ctrl+c copies the
+    current ``selection`` to the clipboard.
+    """
+
+    KEY_UP = "up"
+    KeyboardEvent = _KeyEvent
+
+    def __init__(self, clipboard: FakeClipboard):
+        self._clipboard = clipboard
+        self._pressed_events: dict[int, _KeyEvent] = {}
+        self._hotkeys: dict[str, object] = {}
+        self._hooks: list = []
+        self._lock = threading.Lock()
+        self._callbacks: queue.SimpleQueue = queue.SimpleQueue()
+        threading.Thread(target=self._listener, name="fake-keyboard", daemon=True).start()
+        self.selection = ""
+
+    def _listener(self):
+        while True:
+            self._callbacks.get()()
+
+    def add_hotkey(self, hotkey, callback, suppress=False):
+        self._hotkeys[hotkey] = callback
+
+    def remove_hotkey(self, hotkey):
+        del self._hotkeys[hotkey]
+
+    def hook(self, callback, suppress=False):
+        with self._lock:
+            self._hooks.append(callback)
+        return callback
+
+    def unhook(self, callback):
+        with self._lock:
+            self._hooks.remove(callback)
+
+    def send(self, combo: str):
+        if combo == "ctrl+c":
+            try:
+                self._clipboard.copy(self.selection)
+            except RuntimeError:
+                pass  # The target app's copy failed; nothing new on the clipboard
+
+    def read_hotkey(self, suppress=False):
+        raise RuntimeError("not supported in the soak test")
+
+    def press(self, combo: str):
+        names = combo.split("+")
+        for code, name in enumerate(names):
+            self._pressed_events[code] = _KeyEvent("down", name)
+            self._dispatch(self._pressed_events[code])
+        callback = self._hotkeys.get(combo)
+        if callback is not None:
+            self._callbacks.put(callback)
+        for code, name in enumerate(names):
+            del self._pressed_events[code]
+            self._dispatch(_KeyEvent("up", name))
+
+    def _dispatch(self, event: _KeyEvent):
+        with self._lock:
+            hooks = list(self._hooks)
+        for hook in hooks:
+            hook(event)
+
+
+# ── Harness ──────────────────────────────────────────────────────────
+
+
+def isolate_home() -> Path:
+    """Point the home directory at a temp dir, keeping the user's voice settings."""
+    real_config = Path.home() / ".readtome" / "config.json"
+    home = Path(tempfile.mkdtemp(prefix="readtome-soak-"))
+    (home / ".readtome").mkdir()
+    if real_config.exists():
+        shutil.copy(real_config, home / ".readtome" / "config.json")
+    os.environ["HOME"] = os.environ["USERPROFILE"] = str(home)
+    return home
+
+
+def make_text(rng: random.Random, sentences: int) -> str:
+    return " ".join(rng.choice(PARAGRAPHS) for _ in range(sentences))
+
+
+class VoiceLoadFailed(RuntimeError):
+    """A voice failed to load; the app won't speak, so waiting is pointless."""
+
+
+def watch_voice_loads(app) -> threading.Event:
+    """Wrap the app's voice loading; the returned event is set when a load fails.
+
+    ReadToMeApp._load_model logs the error and returns, leaving the voice
+    unloaded (or, on a switch, the previous voice in place).
+    """
+    failed = threading.Event()
+    load_model = app._load_model
+
+    def _load_model(model_path: str | None = None):
+        load_model(model_path)
+        if not app._voice_loaded or (model_path and app._config.model_path != model_path):
+            failed.set()
+
+    app._load_model = _load_model
+    return failed
+
+
+def wait_quiet(app, pressed_at: float = 0.0, timeout: float = 600.0,
+               load_failed: threading.Event | None = None) -> bool:
+    """Wait for captures (of presses since ``pressed_at``), voice loads and speech.
+
+    Raises VoiceLoadFailed as soon as ``load_failed`` is set.
+    """
+    hotkey = app._hotkey
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if load_failed is not None and load_failed.is_set():
+            raise VoiceLoadFailed(f"Voice failed to load: {app._config.model_path}")
+        captured = (hotkey.last_pressed_at or 0.0) >= pressed_at and not hotkey._copy_lock.locked()
+        worker = app._worker_thread
+        if worker is not None and worker.is_alive():
+            worker.join(min(1.0, deadline - time.monotonic()))
+        elif captured and app._voice_loaded and app._pending_text is None:
+            # The worker is started just after the capture is recorded
+            time.sleep(0.05)
+            worker = app._worker_thread
+            if worker is None or not worker.is_alive():
+                return True
+        else:
+            time.sleep(0.02)  # Test harness: polling the app's state is fine here
+    return False
+
+
+class Soak:
+    def __init__(self, app, keyboard: FakeKeyboard, clipboard: FakeClipboard, rng: random.Random,
+                 load_failed: threading.Event):
+        self.app = app
+        self.load_failed = load_failed
+        self.keyboard = keyboard
+        self.clipboard = clipboard
+        self.rng = rng
+        self.sim_seconds = 0.0
+        self.events = Counter()
+        self.presses = 0
+        self.clipboard_failures = 0
+
+    def set_user_clipboard(self) -> str | None:
+        """Put a unique marker on the clipboard, as if the user had copied it."""
+        marker = f"user clipboard #{self.presses}"
+        try:
+            self.clipboard.copy(marker)
+        except RuntimeError:
+            return None
+        return marker
+
+    def press(self, text: str) -> float:
+        """One hotkey press with ``text`` selected; returns when it was pressed."""
+        self.presses += 1
+        self.keyboard.selection = text
+        pressed_at = time.perf_counter()
+        self.keyboard.press(self.app._hotkey.current_hotkey)
+        return pressed_at
+
+    def check_clipboard(self, marker: str | None):
+        if marker is None:
+            return
+        try:
+            restored = self.clipboard.paste()
+        except RuntimeError:
+            return
+        if restored != marker:
+            self.clipboard_failures += 1
+
+    def run_event(self, event: str, voices: list):
+        app, rng = self.app, self.rng
+        self.events[event] += 1
+        if event in ("read", "interrupts", "long"):
+            marker = self.set_user_clipboard()
+            if event == "read":
+                pressed_at = self.press(make_text(rng, rng.randint(1, 6)))
+                self.sim_seconds += rng.expovariate(1 / 45)
+            elif event == "long":
+                pressed_at = self.press(make_text(rng, rng.randint(40, 80)))
+                self.sim_seconds += rng.uniform(180, 600)
+            else:
+                # Each press interrupts the speech (or the capture) before it
+                for _ in range(rng.randint(2, 5)):
+                    pressed_at = self.press(make_text(rng, rng.randint(2, 8)))
+                    time.sleep(rng.uniform(0.05, 0.5))
+                self.sim_seconds += rng.uniform(5, 30)
+            wait_quiet(app, pressed_at, load_failed=self.load_failed)
+            self.check_clipboard(marker)
+        elif event == "switch" and len(voices) > 1:
+            target = rng.choice([v for v in voices if v != app._config.model_path])
+            app._change_voice(target)
+            deadline = time.monotonic() + 120
+            while (app._config.model_path != target and not self.load_failed.is_set()
+                   and time.monotonic() < deadline):
+                time.sleep(0.05)
+            wait_quiet(app, load_failed=self.load_failed)
+            self.sim_seconds += 5
+        elif event == "idle":
+            minutes = rng.uniform(5, 90)
+            self.sim_seconds += minutes * 60
+            limit = app._config.idle_unload_minutes or 30
+            if minutes >= limit:
+                app._on_idle_timeout()  # Where the idle timer would have fired
+
+
+def sample(app) -> dict:
+    from readtome.memstats import get_rss
+
+    current, _ = tracemalloc.get_traced_memory()
+    return {
+        "threads": threading.active_count(),
+        "rss": get_rss(),
+        "traced": current,
+        "snapshot": tracemalloc.take_snapshot(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=float, default=4, help="Simulated hours of use")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sample-minutes", type=float, default=15, help="Simulated minutes between samples")
+    parser.add_argument("--warmup-minutes", type=float, default=30, help="Simulated minutes before the baseline")
+    parser.add_argument("--clipboard-error-rate", type=float, default=0.0)
+    parser.add_argument("--max-thread-growth", type=int, default=3)
+    parser.add_argument("--max-rss-growth-mb", type=float, default=150)
+    parser.add_argument("--max-traced-growth-mb", type=float, default=25)
+    parser.add_argument("--max-clipboard-failures", type=int, default=0)
+    args = parser.parse_args()
+
+    home = isolate_home()
+    # Imported after the home directory moved, as some paths are module constants
+    from readtome.app import ReadToMeApp
+    from readtome.memstats import format_mb
+    from readtome.sinks import NullSink
+
+    rng = random.Random(args.seed)
+    clipboard = FakeClipboard(random.Random(args.seed + 1), args.clipboard_error_rate)
+    keyboard = FakeKeyboard(clipboard)
+    tracemalloc.start()
+    app = ReadToMeApp(sink=NullSink(realtime=False), keyboard_backend=keyboard, clipboard=clipboard)
+    load_failed = watch_voice_loads(app)
+    app._load_model()
+    if load_failed.is_set():
+        app._quit(None, None)
+        shutil.rmtree(home, ignore_errors=True)
+        sys.exit(f"FAIL: voice failed to load: {app._config.model_path}")
+    app._store.start()
+    app._hotkey.register()
+    voices = [v.path for v in app._voices.refresh()]
+
+    names, weights = zip(*EVENTS)
+    baseline = last = None
+    next_sample = args.warmup_minutes * 60
+    print(f"Simulating {args.hours:g}h of use (home: {home})")
+    print(f"  {'sim time':>8} {'events':>7} {'threads':>8} {'RSS':>10} {'traced':>10}")
+    t0 = time.perf_counter()
+    load_error = None
+    try:
+        soak = Soak(app, keyboard, clipboard, rng, load_failed)
+        while soak.sim_seconds < args.hours * 3600:
+            soak.run_event(rng.choices(names, weights)[0], voices)
+            if (soak.sim_seconds < next_sample or not wait_quiet(app, load_failed=load_failed)
+                    or not app._voice_loaded):
+                continue
+            next_sample = soak.sim_seconds + args.sample_minutes * 60
+            # Only the baseline and the latest sample are kept, as each holds
+            # a tracemalloc snapshot of tens of MB; the previous one is freed
+            # before RSS is read
+            if last is not baseline:
+                last = None
+            last = sample(app)
+            baseline = baseline or last
+            print(
+                f"  {soak.sim_seconds / 3600:7.2f}h {sum(soak.events.values()):7d} "
+                f"{last['threads']:8d} {format_mb(last['rss']):>10} "
+                f"{format_mb(last['traced']):>10}"
+            )
+    except VoiceLoadFailed as e:
+        load_error = e
+    finally:
+        app._quit(None, None)
+    if load_error:
+        # Nothing more can be spoken, so the growth checks are skipped
+        shutil.rmtree(home, ignore_errors=True)
+        sys.exit(f"FAIL: {load_error}")
+    elapsed = time.perf_counter() - t0
+
+    print(f"{sum(soak.events.values())} events ({dict(soak.events)}), "
+          f"{soak.presses} hotkey presses in {elapsed:.0f}s wall time")
+    failures = []
+    if soak.clipboard_failures > args.max_clipboard_failures:
+        failures.append(f"clipboard not restored after {soak.clipboard_failures} captures")
+    if last is not baseline:
+        growth = {
+            "threads": (last["threads"] - baseline["threads"], args.max_thread_growth, str),
+            "RSS": ((last["rss"] - baseline["rss"]) / 2**20, args.max_rss_growth_mb, "{:.1f} MB".format),
+            "traced memory": ((last["traced"] - baseline["traced"]) / 2**20,
+                              args.max_traced_growth_mb, "{:.1f} MB".format),
+        }
+        for name, (grown, bound, fmt) in growth.items():
+            print(f"  {name} growth since warm-up: {fmt(grown)} (bound {fmt(bound)})")
+            if grown > bound:
+                failures.append(f"{name} grew by {fmt(grown)}")
+        print("Top allocation growth since warm-up:")
+        for stat in last["snapshot"].compare_to(baseline["snapshot"], "lineno")[:10]:
+            print(f"  {stat}")
+        if last["threads"] > baseline["threads"]:
+            print("Threads:", dict(Counter(re.sub(r"\d+", "N", t.name) for t in threading.enumerate())))
+    else:
+        print("Not enough samples after warm-up to check growth (run longer)")
+
+    shutil.rmtree(home, ignore_errors=True)
+    if failures:
+        print("FAIL: " + "; ".join(failures))
+        sys.exit(1)
+    print("PASS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Startup time: time-to-hotkey, time-to-tray and time-to-ready.
+
+Launches the app with --startup-report several times, reads the report
+it prints once the voice is loaded, then closes it. Reports the median
+of each milestone and of the slowest imports. Needs a desktop session
+(the tray icon and global hotkey are real); extra arguments after --
+are passed to the app, e.g. ``-- --sink null``.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5] [--timeout 60] [-- APP_ARGS...]
+"""
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+_LINE = re.compile(r"^  (\S.*?)\s+(\d+(?:\.\d+)?)$")
+
+
+def launch(app_args: list[str], timeout: float) -> tuple[dict, dict, str]:
+    """Run the app once; ({milestone: ms}, {module: ms}, why it's incomplete) from its report."""
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "readtome", "--startup-report", *app_args],
+        cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+    )
+    # The app never exits by itself; give up on it after the timeout
+    timer = threading.Timer(timeout, proc.kill)
+    timer.start()
+    milestones, imports, section = {}, {}, None
+    incomplete = "no startup report (no desktop session?)"
+    try:
+        for line in proc.stdout:
+            line = line.rstrip()
+            if line.startswith("Startup report"):
+                section = milestones
+                incomplete = line.partition(" - incomplete: ")[2]
+            elif line.startswith("Imports"):
+                section = imports
+            elif section is not None:
+                match = _LINE.match(line)
+                if match:
+                    section[match.group(1)] = float(match.group(2))
+                if section is imports and line.lstrip().startswith("total"):
+                    break
+                if section is milestones and not match and not line.endswith("-"):
+                    break
+    finally:
+        timer.cancel()
+        proc.kill()
+        proc.wait()
+    return milestones, imports, incomplete
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--top", type=int, default=10, help="Imports to list")
+    args, app_args = parser.parse_known_args()
+    if app_args[:1] == ["--"]:
+        app_args = app_args[1:]
+
+    runs = []
+    for i in range(args.runs):
+        milestones, imports, incomplete = launch(app_args, args.timeout)
+        if incomplete or "time-to-ready" not in milestones:
+            print(f"run {i + 1}: {incomplete or 'not ready'}")
+            continue
+        runs.append((milestones, imports))
+    if not runs:
+        sys.exit(1)
+
+    print(f"{len(runs)} launches, median ms")
+    for name in ("time-to-hotkey-registered", "time-to-tray", "time-to-ready"):
+        values = [m[name] for m, _ in runs if name in m]
+        if values:
+            print(f"  {name:28} {statistics.median(values):8.0f}")
+    modules = {name for _, imports in runs for name in imports} - {"total", "(other)"}
+    medians = {
+        name: statistics.median(imports.get(name, 0.0) for _, imports in runs)
+        for name in modules
+    }
+    print("Slowest imports")
+    for name, ms in sorted(medians.items(), key=lambda kv: kv[1], reverse=True)[:args.top]:
+        print(f"  {name:28} {ms:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark the streaming WSOLA time-stretcher.
+
+Feeds synthetic speech-like audio through TimeStretcher in the same block
+size the app uses and reports throughput as a multiple of real time.
+
+Usage:
+    python benchmarks/bench_timestretch.py [--seconds 60] [--sample-rate 22050]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from readtome.timestretch import TimeStretcher, iter_blocks  # noqa: E402
+
+
+def make_speechlike(seconds: float, sr: int) -> np.ndarray:
+    """Harmonic tone with a wandering pitch and syllable-rate envelope."""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * sr)) / sr
+    f0 = 140 + 30 * np.sin(2 * np.pi * 0.7 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / sr
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 8))
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t) ** 2
+    noise = 0.05 * rng.standard_normal(len(t))
+    return (6000 * envelope * (voiced + noise)).astype(np.int16)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=60.0)
+    parser.add_argument("--sample-rate", type=int, default=22050)
+    args = parser.parse_args()
+
+    sr = args.sample_rate
+    audio = make_speechlike(args.seconds, sr)
+    block = int(sr * 0.1)
+
+    print(f"{args.seconds:.0f}s of audio @ {sr}Hz, {block}-sample blocks")
+    for rate in (0.75, 1.25, 1.5, 2.0):
+        stretcher = TimeStretcher(sr)
+        out_len = 0
+        worst = 0.0
+        t0 = time.perf_counter()
+        for b in iter_blocks(audio, block):
+            tb = time.perf_counter()
+            out_len += len(stretcher.process(b, rate))
+            worst = max(worst, time.perf_counter() - tb)
+        out_len += len(stretcher.flush())
+        elapsed = time.perf_counter() - t0
+        print(
+            f"  rate {rate:4.2f}: {args.seconds / elapsed:6.0f}x realtime, "
+            f"worst block {worst * 1000:5.2f}ms, "
+            f"length ratio {out_len / len(audio):.3f} (expected {1 / rate:.3f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,18 @@
-import argparse
-import logging
-import sys
-import traceback
-from pathlib import Path
+import time
+
+# Taken before anything else is imported, for --startup-report
+_T0 = time.perf_counter()
+
+import argparse  # noqa: E402
+import logging  # noqa: E402
+import multiprocessing  # noqa: E402
+import sys  # noqa: E402
+import traceback  # noqa: E402
+from pathlib import Path  # noqa: E402
+
+from readtome.config import SINK_NAMES  # noqa: E402
+from readtome.logs import setup_logging  # noqa: E402
+from readtome.startup import NO_REPORT, StartupTimer  # noqa: E402
 
 
 def _get_log_dir() -> Path:
@@ -13,29 +23,60 @@ def _get_log_dir() -> Path:
 
 
 def main():
+    # The quantize report measures each variant in a spawned process
+    multiprocessing.freeze_support()
+
     parser = argparse.ArgumentParser(description="ReadToMe TTS")
     parser.add_argument(
         "--debug", "-d", action="store_true", help="Enable debug logging"
     )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="Profile each utterance's pipeline stages into ~/.readtome/profiles",
+    )
+    parser.add_argument(
+        "--sink", choices=SINK_NAMES,
+        help="Audio output backend (overrides config; not saved)",
+    )
+    parser.add_argument(
+        "--sink-path", default="",
+        help="Output directory for the wav sink",
+    )
+    parser.add_argument(
+        "--startup-report", action="store_true",
+        help="Print time-to-tray, time-to-hotkey and time-to-ready with an import breakdown",
+    )
+    commands = parser.add_subparsers(dest="command")
+    quantize = commands.add_parser(
+        "quantize", help="Write int8-quantized copies of voice models",
+    )
+    quantize.add_argument(
+        "models", nargs="*", help="Voice .onnx files (default: current voice)",
+    )
+    quantize.add_argument(
+        "--no-report", action="store_true",
+        help="Skip the fp32 vs int8 load time / RSS / speed report",
+    )
+    share_weights = commands.add_parser(
+        "share-weights",
+        help="Write copies of voice models whose weights all instances on a machine share",
+    )
+    share_weights.add_argument(
+        "models", nargs="*", help="Voice .onnx files (default: current voice)",
+    )
+    perf_report = commands.add_parser(
+        "perf-report", help="Summarize recorded speech performance",
+    )
+    perf_report.add_argument(
+        "--days", type=int, default=7, help="Window for the percentiles (default: 7)",
+    )
     args = parser.parse_args()
+    startup = StartupTimer(_T0, track_imports=True) if args.startup_report else NO_REPORT
 
     log_level = logging.DEBUG if args.debug else logging.INFO
     log_file = _get_log_dir() / "readtome.log"
 
-    handlers: list[logging.Handler] = [
-        logging.FileHandler(log_file, encoding="utf-8"),
-    ]
-
-    # If launched from a console (e.g. cmd /k ReadToMe.exe --debug),
-    # also print to stdout so the user can see output in real time.
-    if args.debug:
-        handlers.append(logging.StreamHandler(sys.stdout))
-
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        handlers=handlers,
-    )
+    setup_logging(log_file, log_level, console=args.debug)
 
     # Silence noisy third-party debug loggers
     logging.getLogger("PIL").setLevel(logging.INFO)
@@ -43,10 +84,35 @@ def main():
     logger = logging.getLogger(__name__)
     logger.info("ReadToMe starting (debug=%s, log=%s)", args.debug, log_file)
 
+    if args.command == "quantize":
+        from readtome.quantize import run
+
+        sys.exit(run(args.models, report=not args.no_report))
+
+    if args.command == "share-weights":
+        from readtome.shared_weights import run
+
+        sys.exit(run(args.models))
+
+    if args.command == "perf-report":
+        from readtome.perf_history import report
+
+        print(report(days=args.days))
+        return
+
     from readtome.app import ReadToMeApp
 
-    app = ReadToMeApp()
-    app.run()
+    sink = None
+    if args.sink:
+        from readtome.sinks import create_sink
+
+        sink = create_sink(args.sink, args.sink_path)
+    try:
+        app = ReadToMeApp(sink=sink, profile=args.profile, startup=startup)
+        app.run()
+    finally:
+        # A no-op after a complete start; otherwise reports what was reached
+        startup.finish("exited during startup")
 
 
 if __name__ == "__main__":
@@ -1,24 +1,67 @@
 import logging
 import threading
 import time
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-from readtome.audio_player import AudioPlayer
 from readtome.config import Config
+from readtome.config_store import ConfigStore
 from readtome.hotkey import HotkeyManager
+from readtome.memstats import format_mb, get_peak_rss, get_rss, release_free_memory
+from readtome.normalize import normalize_text
+from readtome.profiling import PROFILE_DIR, ProfileSession, Profiler, no_stage
+from readtome.startup import NO_REPORT
 from readtome.tray import TrayIcon
-from readtome.tts_engine import TTSEngine
+from readtome.voice_index import VoiceIndex, voice_key
+
+# numpy, ONNX Runtime, sounddevice, sqlite3 and urllib are imported on
+# first use, off the main thread, so the tray icon and hotkey come up
+# without waiting for them (see _ensure_engine)
+if TYPE_CHECKING:
+    from readtome.audio_player import AudioPlayer
+    from readtome.perf_history import PerfHistory
+    from readtome.sinks import AudioSink
+    from readtome.tts_engine import TTSEngine
+    from readtome.voice_manager import VoiceManager
 
 logger = logging.getLogger(__name__)
 
+# Audio is fed to the player in blocks of this length so speed changes
+# reach the time-stretcher (and the speaker) almost immediately.
+_BLOCK_SECONDS = 0.1
+
+# Speaking rate used to estimate the time text normalization saved when
+# the utterance itself didn't finish (at speed 1.0)
+_CHARS_PER_SECOND = 15.0
+
+# Settings read only at startup; a live edit to these is saved but not applied
+_RESTART_FIELDS = {"memory_budget_mb", "rtf_degrade_below", "rtf_recover_above"}
+
 
 class ReadToMeApp:
-    def __init__(self):
+    def __init__(self, sink: "AudioSink | None" = None, profile: bool = False,
+                 startup=NO_REPORT, keyboard_backend=None, clipboard=None):
+        self._startup = startup
         self._config = Config.load()
         self._config.resolve_model_paths(Config.get_base_dir())
-
-        self._tts = TTSEngine(self._config)
-        self._player = AudioPlayer()
-        self._hotkey = HotkeyManager(self._config.hotkey, self._on_text_captured)
+        self._store = ConfigStore(self._config, on_change=self._on_config_changed)
+        # A sink passed in (e.g. --sink) overrides audio_sink in config.json
+        self._sink_override = sink is not None
+
+        # Created by _ensure_engine on the model loading thread
+        self._sink = sink
+        self._engine_lock = threading.Lock()
+        self._tts: "TTSEngine | None" = None
+        self._player: "AudioPlayer | None" = None
+        self._voices = VoiceIndex(Config.get_models_dir())
+        self._profiler = Profiler(enabled=profile)
+        # keyboard_backend / clipboard replace the real ones for headless
+        # runs (see benchmarks/bench_soak.py)
+        self._hotkey = HotkeyManager(
+            self._config.hotkey, self._on_text_captured, profiler=self._profiler,
+            keyboard_backend=keyboard_backend, clipboard=clipboard,
+        )
         self._tray = TrayIcon(
             on_quit=self._quit,
             on_toggle_pause=self._toggle_pause,
@@ -28,48 +71,174 @@ class ReadToMeApp:
             on_change_pitch=self._change_pitch,
             on_toggle_startup=self._toggle_startup,
             on_check_update=self._check_for_updates,
+            on_download_voice=self._download_voice,
+            on_refresh_voice_catalog=self._refresh_voice_catalog,
+            on_toggle_profiling=self._toggle_profiling,
             is_paused=lambda: self._paused,
+            is_profiling=lambda: self._profiler.enabled,
             get_status=self._get_status_text,
-            get_voices=Config.list_available_voices,
-            get_current_voice=lambda: self._config.model_path,
+            get_voices=self._voices.refresh,
+            get_current_voice=lambda: voice_key(self._config.model_path),
             get_current_speed=lambda: self._config.speed,
             get_current_pitch=lambda: self._config.pitch,
+            get_downloadable_voices=self._get_downloadable_voices,
+            get_voice_label=self._voice_label,
         )
 
         self._paused = False
         self._speaking = False
         self._worker_thread: threading.Thread | None = None
 
+        # Idle unloading: the model lock keeps an unload from racing speech
+        self._model_lock = threading.Lock()
+        self._idle_timer: threading.Timer | None = None
+        self._idle_unloaded = False
+        self._pending_text: str | None = None
+        self._rss_idle = get_rss()
+        self._rss_loaded = 0
+
+    @cached_property
+    def _voice_manager(self) -> "VoiceManager":
+        from readtome.voice_manager import VoiceManager
+
+        return VoiceManager(Config.get_models_dir())
+
+    @cached_property
+    def _perf(self) -> "PerfHistory":
+        from readtome.perf_history import PerfHistory
+
+        return PerfHistory()
+
+    def _create_sink(self) -> "AudioSink":
+        """Build the audio sink named in the config, falling back to sounddevice."""
+        from readtome.sinks import create_sink
+
+        try:
+            return create_sink(self._config.audio_sink, self._config.audio_sink_path)
+        except ValueError as e:
+            logger.warning("%s, using sounddevice", e)
+            return create_sink("sounddevice")
+
     def run(self):
         """Main entry point."""
+        # Engine imports and the voice load overlap with bringing up the
+        # hotkey and tray; text captured before the voice is ready is queued
         model_thread = threading.Thread(target=self._load_model, daemon=True)
         model_thread.start()
+        self._store.start()
 
         self._hotkey.register()
-        self._tray.run()  # Blocks main thread
+        self._startup.mark("hotkey")
+        self._tray.run(on_visible=lambda: self._startup.mark("tray"))  # Blocks main thread
+
+    def _ensure_engine(self):
+        """Import and create the TTS engine and audio player on first use."""
+        with self._engine_lock:
+            if self._tts is not None:
+                return
+            from readtome.audio_player import AudioPlayer
+            from readtome.tts_engine import TTSEngine
+
+            self._player = AudioPlayer(sink=self._sink or self._create_sink())
+            self._sink = None
+            self._tts = TTSEngine(self._config)
+
+    @property
+    def _voice_loaded(self) -> bool:
+        return self._tts is not None and self._tts.is_loaded
 
     def _load_model(self, model_path: str | None = None):
         self._tray.update_tooltip("ReadToMe - Loading voice...")
         try:
-            self._tts.load_model(model_path)
+            self._ensure_engine()
+            with self._model_lock:
+                self._tts.load_model(model_path)
+                self._idle_unloaded = False
+                self._rss_loaded = get_rss()
             self._update_ready_tooltip()
-            logger.info("Model loaded, ready to use")
+            logger.info("Model loaded, ready to use (%s)", self._memory_summary())
+            self._startup.mark("ready")
         except Exception as e:
             logger.error("Failed to load model: %s", e)
             self._tray.update_tooltip(f"ReadToMe - ERROR: {e}")
+            self._pending_text = None
+            self._startup.finish("voice failed to load")
+            return
+
+        self._restart_idle_timer()
+        text, self._pending_text = self._pending_text, None
+        if text:
+            logger.debug("Speaking text queued while the voice loaded")
+            self._on_text_captured(text)
+
+    # ── Idle unloading / memory ──────────────────────────────────────────
+
+    def _restart_idle_timer(self):
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+        minutes = self._config.idle_unload_minutes
+        if minutes > 0:
+            self._idle_timer = threading.Timer(minutes * 60, self._on_idle_timeout)
+            self._idle_timer.daemon = True
+            self._idle_timer.start()
+
+    def _on_idle_timeout(self):
+        """Release the voice after idle_unload_minutes without speech."""
+        with self._model_lock:
+            if self._speaking or not self._voice_loaded:
+                return
+            rss_before = get_rss()
+            self._tts.unload()
+            self._idle_unloaded = True
+            self._rss_idle = get_rss()
+        logger.info(
+            "Idle for %d min, voice unloaded: RSS %s -> %s (peak %s)",
+            self._config.idle_unload_minutes, format_mb(rss_before),
+            format_mb(self._rss_idle), format_mb(get_peak_rss()),
+        )
+        self._tray.update_tooltip("ReadToMe - Idle (voice reloads on next use)")
+
+    def _check_memory_budget(self):
+        budget = self._config.memory_budget_mb * 1024 * 1024
+        if not budget:
+            return
+        rss = get_rss()
+        if rss > budget:
+            logger.warning(
+                "RSS %s is over the %s memory budget, releasing free memory",
+                format_mb(rss), format_mb(budget),
+            )
+            release_free_memory()
+
+    def _memory_summary(self) -> str:
+        return (
+            f"RSS {format_mb(get_rss())}: idle {format_mb(self._rss_idle)}, "
+            f"loaded {format_mb(self._rss_loaded)}, peak {format_mb(get_peak_rss())}"
+        )
 
     def _update_ready_tooltip(self):
         hotkey_display = self._hotkey.current_hotkey.replace("+", "+").title()
-        voice_name = self._config.get_voice_display_name()
+        voice_name = self._voice_label(self._config.model_path)
         self._tray.update_tooltip(f"ReadToMe - {voice_name} ({hotkey_display})")
 
     def _on_text_captured(self, text: str):
         """Called from hotkey thread when text is captured."""
+        session = self._profiler.take_pending()
         if self._paused:
             logger.debug("Hotkey pressed but app is paused, ignoring")
+            self._profiler.discard(session)
             return
-        if not self._tts.is_loaded:
-            logger.warning("Model not loaded yet, ignoring hotkey")
+        if not self._voice_loaded:
+            self._profiler.discard(session)
+            # Speak it as soon as the voice is ready; reload if it was idled out
+            self._pending_text = text
+            if self._idle_unloaded:
+                self._idle_unloaded = False
+                logger.info("Reloading voice after idle unload")
+                threading.Thread(target=self._load_model, daemon=True).start()
+            else:
+                logger.info("Voice still loading, text queued")
             return
 
         # If already speaking, stop current and start new
@@ -79,42 +248,90 @@ class ReadToMeApp:
             if self._worker_thread:
                 self._worker_thread.join(timeout=2.0)
 
+        hotkey_timing = (self._hotkey.last_pressed_at, self._hotkey.last_capture_seconds)
         self._worker_thread = threading.Thread(
-            target=self._speak_text, args=(text,), daemon=True
+            target=self._speak_text, args=(text, session, hotkey_timing), daemon=True
         )
         self._worker_thread.start()
 
-    def _speak_text(self, text: str):
+    def _speak_text(self, text: str, session: ProfileSession | None = None,
+                    hotkey_timing: tuple[float | None, float] = (None, 0.0)):
         """Runs in worker thread. Synthesizes and plays audio."""
         self._speaking = True
         self._tray.update_tooltip("ReadToMe - Speaking...")
-        text_preview = text[:80] + ("..." if len(text) > 80 else "")
-        logger.debug("Speaking text (%d chars): %s", len(text), text_preview)
+        if logger.isEnabledFor(logging.DEBUG):
+            text_preview = text[:80] + ("..." if len(text) > 80 else "")
+            logger.debug("Speaking text (%d chars): %s", len(text), text_preview)
+        stats = {}
+        stage = session.stage if session else no_stage
         try:
-            self._speak_streaming(text)
+            with stage("normalize"):
+                spoken = normalize_text(text, self._config.text_normalization)
+            with self._model_lock:
+                self._speak_streaming(spoken, stage, stats)
+            self._log_normalization(len(text) - len(spoken), spoken, stats)
+            self._record_perf(spoken, stats, hotkey_timing)
         except Exception as e:
             logger.error("TTS error: %s", e, exc_info=True)
         finally:
+            self._profiler.finish(session)
             self._speaking = False
             if self._tts.is_loaded:
                 self._update_ready_tooltip()
-
-    def _speak_streaming(self, text: str):
-        """Stream synthesis: play each sentence chunk as it's generated."""
+            self._check_memory_budget()
+            self._restart_idle_timer()
+
+    def _speak_streaming(self, text: str, stage=no_stage, stats: dict | None = None):
+        """Stream synthesis: play each sentence chunk as it's generated.
+
+        Chunks are synthesized at the speed in effect when speech started.
+        If the speed is changed mid-utterance, the remaining audio (already
+        synthesized or not) is time-stretched to the new speed on the fly.
+        ``stage`` is a ProfileSession.stage when the utterance is profiled;
+        timings for the performance history are filled into ``stats``.
+        """
         self._player.reset()
+        t_start = time.perf_counter()
+        with stage("playback"):
+            self._player.play_stream(self._stream_blocks(text, stage, stats))
+        if stats is not None:
+            stats["t_start"] = t_start
+            stats["total_seconds"] = time.perf_counter() - t_start
+
+    def _stream_blocks(self, text: str, stage=no_stage, stats: dict | None = None):
+        """Yield (block, sample_rate) pairs for the player, stretched to speed.
+
+        Pitch is applied by labelling the blocks with the voice's rate times
+        the pitch; the player resamples them to its output rate. Like the
+        speed, it is read per block, so pitch changes apply mid-utterance.
+        """
+        from readtome.audio_store import AudioStore
+        from readtome.silence import trim_silence, trim_silence_blocks
+        from readtome.timestretch import TimeStretcher, iter_blocks
+
+        synth_speed = self._config.speed
+        stretcher: "TimeStretcher | None" = None
         chunk_num = 0
         t_start = time.perf_counter()
         t_first_chunk = None
-
-        for samples, sr in self._tts.synthesize_stream(text):
+        sr = self._tts.sample_rate
+        seconds_saved = 0.0
+        audio_seconds = 0.0
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        sentence_start = True
+        for samples, sr, sentence_end in self._tts.synthesize_stream(
+            text, speed=synth_speed, stage=stage,
+        ):
             chunk_num += 1
+            audio_seconds += len(samples) / sr
             if t_first_chunk is None:
                 t_first_chunk = time.perf_counter() - t_start
                 logger.debug(
                     "First chunk in %.2fs (%d samples, %.1fs audio @ %dHz)",
                     t_first_chunk, len(samples), len(samples) / sr, sr,
                 )
-            else:
+            elif debug:
                 logger.debug(
                     "Chunk %d: %d samples (%.1fs audio)",
                     chunk_num, len(samples), len(samples) / sr,
@@ -124,13 +341,115 @@ class ReadToMeApp:
                 logger.debug("Stop requested, breaking at chunk %d", chunk_num)
                 break
 
-            self._player.play(samples, sr)
+            # Replayed sentences stay compressed and are decoded a block
+            # at a time as they are stretched
+            stored = isinstance(samples, AudioStore)
+            pieces = samples.blocks() if stored else (samples,)
+            if self._config.trim_silence:
+                with stage("postprocess"):
+                    # Clauses of a chunked sentence keep their inner edges
+                    trim = dict(
+                        gap_ms=self._config.sentence_gap_ms, max_pause_ms=self._config.max_pause_ms,
+                        lead=sentence_start, tail=sentence_end,
+                    )
+                    if stored:
+                        pieces, removed = trim_silence_blocks(samples.blocks, sr, **trim)
+                    else:
+                        samples, removed = trim_silence(samples, sr, **trim)
+                        pieces = (samples,)
+                seconds_saved += removed / sr / (self._config.speed / synth_speed)
+            sentence_start = sentence_end
+
+            if stretcher is None or stretcher.sample_rate != sr:
+                # The sample rate changes when the watchdog swaps voices
+                if stretcher is not None:
+                    yield stretcher.flush(), stretcher.sample_rate * self._config.pitch
+                stretcher = TimeStretcher(sr)
+            for piece in pieces:
+                if self._player.is_stopped:
+                    break
+                for block in iter_blocks(piece, int(sr * _BLOCK_SECONDS)):
+                    if self._player.is_stopped:
+                        break
+                    # Read the speed per block so menu changes apply right away
+                    rate = self._config.speed / synth_speed
+                    with stage("postprocess"):
+                        out = stretcher.process(block, rate)
+                    yield out, sr * self._config.pitch
+
+        if stretcher is not None and not self._player.is_stopped:
+            yield stretcher.flush(), sr * self._config.pitch
 
         t_total = time.perf_counter() - t_start
         logger.debug("Streaming complete: %d chunks in %.2fs", chunk_num, t_total)
+        if stats is not None:
+            stats.update(
+                first_chunk_seconds=t_first_chunk, chunks=chunk_num, synth_speed=synth_speed,
+                audio_seconds=audio_seconds, stopped=self._player.is_stopped,
+            )
+        if seconds_saved > 0:
+            logger.info("Silence trimming saved %.2fs of listening time", seconds_saved)
+
+    def _log_normalization(self, removed: int, spoken: str, stats: dict):
+        """Log characters removed by text normalization and the time that saved."""
+        if removed <= 0:
+            return
+        if spoken and stats.get("audio_seconds") and not stats.get("stopped"):
+            # This utterance's own speaking rate, in listening time
+            seconds_per_char = (
+                stats["audio_seconds"] / len(spoken) / (self._config.speed / stats["synth_speed"])
+            )
+        else:
+            seconds_per_char = 1 / (_CHARS_PER_SECOND * self._config.speed)
+        logger.info(
+            "Text normalization removed %d chars, saving ~%.1fs of listening time",
+            removed, removed * seconds_per_char,
+        )
+
+    def _record_perf(self, text: str, stats: dict, hotkey_timing: tuple[float | None, float]):
+        """Queue this utterance's timings for the performance history."""
+        if "t_start" not in stats or "chunks" not in stats:
+            return
+        pressed_at, capture_seconds = hotkey_timing
+        first_chunk = stats["first_chunk_seconds"]
+        synth_seconds = self._tts.stream_synth_seconds
+
+        def ms(seconds):
+            return None if seconds is None else seconds * 1000
+
+        self._perf.record(
+            ts=time.time() - stats["total_seconds"],
+            voice=Path(self._config.model_path).stem,
+            speed=self._config.speed,
+            text_chars=len(text),
+            chunks=stats["chunks"],
+            capture_ms=ms(capture_seconds) if pressed_at is not None else None,
+            hotkey_to_audio_ms=(
+                ms(stats["t_start"] + first_chunk - pressed_at)
+                if pressed_at is not None and first_chunk is not None else None
+            ),
+            first_chunk_ms=ms(first_chunk),
+            synth_ms=ms(synth_seconds),
+            total_ms=ms(stats["total_seconds"]),
+            audio_seconds=stats["audio_seconds"],
+            # Only freshly synthesized audio: sentences replayed from the
+            # previous utterance took no inference time
+            rtf=self._tts.stream_synth_audio_seconds / synth_seconds if synth_seconds > 0 else None,
+            stopped=int(stats["stopped"]),
+        )
 
     # ── Voice / Speed / Pitch handlers ───────────────────────────────────
 
+    def _voice_label(self, model_path: str) -> str:
+        """Display name for a voice from the index, marking int8 variants."""
+        info = self._voices.get(model_path)
+        if info is None:
+            return self._config.voice_label(model_path) if model_path else "Unknown"
+        label = info.display_name
+        if self._config.prefer_quantized and info.has_quantized:
+            label += " (int8)"
+        return label
+
     def _change_voice(self, model_path: str):
         """Switch to a different voice model. Reloads in background."""
         if model_path == self._config.model_path:
@@ -147,17 +466,97 @@ class ReadToMeApp:
 
     def _do_change_voice(self, model_path: str):
         self._load_model(model_path)
-        self._config.save()
+        self._store.save()
 
     def _change_speed(self, speed: float):
+        # Picked up by _stream_blocks on the next block if speech is playing
         logger.info("Speed changed to %.2f", speed)
         self._config.speed = speed
-        self._config.save()
+        self._store.save()
 
     def _change_pitch(self, pitch: float):
+        # Like speed, picked up by _stream_blocks on the next block
         logger.info("Pitch changed to %.2f", pitch)
         self._config.pitch = pitch
-        self._config.save()
+        self._store.save()
+
+    # ── Live config reload ───────────────────────────────────────────────
+
+    def _on_config_changed(self, changes: dict):
+        """Apply settings edited in config.json while running (store thread).
+
+        Only what the changed fields need is redone: speed, pitch, silence
+        and fallback settings are read live and need nothing; a new voice
+        reloads the model, a new hotkey rebinds it, and so on.
+        """
+        logger.info(
+            "config.json changed: %s",
+            ", ".join(f"{name}={new!r}" for name, (_, new) in changes.items()),
+        )
+        if "hotkey" in changes:
+            self._hotkey.rebind(self._config.hotkey)
+        if changes.keys() & {"model_path", "prefer_quantized", "shared_weights"}:
+            if self._speaking:
+                self._player.stop()
+            threading.Thread(target=self._load_model, daemon=True).start()
+        if (changes.keys() & {"audio_sink", "audio_sink_path"} and not self._sink_override
+                and self._player is not None):
+            # Before the player exists it is created from the new settings
+            self._player.sink = self._create_sink()
+        if "idle_unload_minutes" in changes and self._voice_loaded:
+            self._restart_idle_timer()
+        restart = sorted(changes.keys() & _RESTART_FIELDS)
+        if restart:
+            logger.info("%s will take effect after a restart", ", ".join(restart))
+        self._tray.update_menu()
+        if self._voice_loaded:
+            self._update_ready_tooltip()
+
+    # ── Voice downloads ──────────────────────────────────────────────────
+
+    def _get_downloadable_voices(self) -> list[dict] | None:
+        """Catalog voices in the current voice's language, or None if no catalog yet."""
+        if self._voice_manager.cached_catalog() is None:
+            return None
+        # Piper voice files are named <language>-<speaker>-<quality>.onnx
+        language = Path(self._config.model_path).stem.split("-")[0] or None
+        voices = self._voice_manager.available_voices(language)
+        for voice in voices:
+            voice["downloading"] = self._voice_manager.is_downloading(voice["key"])
+        return voices
+
+    def _refresh_voice_catalog(self):
+        thread = threading.Thread(target=self._do_refresh_voice_catalog, daemon=True)
+        thread.start()
+
+    def _do_refresh_voice_catalog(self):
+        try:
+            self._voice_manager.fetch_catalog()
+        except Exception as e:
+            logger.error("Failed to fetch voice catalog: %s", e)
+            return
+        self._tray.update_menu()
+
+    def _download_voice(self, key: str):
+        """Download a voice in the background, then refresh the Voice menu."""
+        logger.info("Downloading voice: %s", key)
+        thread = threading.Thread(target=self._do_download_voice, args=(key,), daemon=True)
+        thread.start()
+
+    def _do_download_voice(self, key: str):
+        from readtome.voice_manager import AlreadyDownloading
+
+        self._tray.update_tooltip(f"ReadToMe - Downloading voice {key}...")
+        errors = self._voice_manager.download([key])
+        error = errors.get(key)
+        if isinstance(error, AlreadyDownloading):
+            self._tray.update_tooltip(f"ReadToMe - Voice {key} is still downloading")
+            return
+        if error is not None:
+            self._tray.update_tooltip(f"ReadToMe - Voice download failed: {error}")
+        else:
+            self._tray.update_tooltip(f"ReadToMe - Installed voice {key}")
+        self._tray.update_menu()
 
     # ── Other handlers ───────────────────────────────────────────────────
 
@@ -178,32 +577,45 @@ class ReadToMeApp:
         if new_hotkey is None:
             logger.warning("Invalid shortcut — must be at least a 2-key combination")
             self._tray.update_tooltip("ReadToMe - Invalid shortcut, keeping old one")
-            time.sleep(2)
-            self._update_ready_tooltip()
+            timer = threading.Timer(2, self._update_ready_tooltip)
+            timer.daemon = True
+            timer.start()
             return
 
         self._hotkey.rebind(new_hotkey)
         self._config.hotkey = new_hotkey
-        self._config.save()
+        self._store.save()
         logger.info("Shortcut changed to: %s (saved to config)", new_hotkey)
         self._update_ready_tooltip()
 
+    def _toggle_profiling(self, icon, item):
+        self._profiler.enabled = not self._profiler.enabled
+        logger.info(
+            "Speech profiling %s (profiles in %s)",
+            "enabled" if self._profiler.enabled else "disabled", PROFILE_DIR,
+        )
+
     def _toggle_pause(self, icon, item):
         self._paused = not self._paused
         if self._paused:
-            self._player.stop()
+            if self._player is not None:
+                self._player.stop()
             self._tray.update_tooltip("ReadToMe - Paused")
         else:
             self._update_ready_tooltip()
 
     def _get_status_text(self):
-        if not self._tts.is_loaded:
+        if self._idle_unloaded:
+            status = "Idle (voice unloaded)"
+        elif not self._voice_loaded:
             return "Loading model..."
-        if self._paused:
-            return "Paused"
-        if self._speaking:
-            return "Speaking..."
-        return "Ready"
+        elif self._paused:
+            status = "Paused"
+        elif self._speaking:
+            status = "Speaking..."
+        else:
+            status = "Ready"
+        return f"{status} - {self._memory_summary()}"
 
     def _check_for_updates(self, icon, item):
         """Check GitHub for a newer release. Runs in background thread."""
@@ -215,6 +627,12 @@ class ReadToMeApp:
         check_for_update()
 
     def _quit(self, icon, item):
-        self._player.stop()
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+        self._store.stop()
+        if self._player is not None:
+            self._player.close()
+        if "_perf" in self.__dict__:  # Only if anything was recorded
+            self._perf.close()
         self._hotkey.unregister()
         self._tray.stop()
@@ -2,52 +2,140 @@ import logging
 import threading
 
 import numpy as np
-import sounddevice as sd
+
+from readtome.audio_store import AudioStore
+from readtome.resample import Resampler
+from readtome.sinks import AudioSink, SoundDeviceSink
 
 logger = logging.getLogger(__name__)
 
+# Longest block handed to the sink in one write. Writes block until the
+# sink has room, so this bounds how long a stop request can go unnoticed.
+_MAX_WRITE_SECONDS = 0.1
+
 
 class AudioPlayer:
-    def __init__(self, sample_rate: int = 24000):
+    def __init__(self, sample_rate: int = 24000, sink: AudioSink | None = None):
         self._sample_rate = sample_rate
+        self._sink = sink or SoundDeviceSink()
         self._lock = threading.Lock()
         self._playing = False
         self._stop_event = threading.Event()
 
-    def play(self, samples: np.ndarray, sample_rate: int | None = None):
-        """Play audio. Blocks until done or stopped."""
+    @property
+    def sink(self) -> AudioSink:
+        return self._sink
+
+    @sink.setter
+    def sink(self, sink: AudioSink):
+        # play_stream holds its own reference, so this applies from the
+        # next utterance (and the old sink is released when it is done)
+        with self._lock:
+            old, self._sink = self._sink, sink
+            playing = self._playing
+        if not playing and old is not sink:
+            old.release()
+
+    def close(self):
+        """Stop playback and release the sink's device."""
+        self.stop()
+        with self._lock:
+            playing = self._playing
+        if not playing:
+            self._sink.release()
+
+    def play(self, samples: np.ndarray | AudioStore, sample_rate: int | None = None):
+        """Play audio. Blocks until done or stopped.
+
+        An AudioStore is played block by block, each decompressed as it
+        is reached.
+        """
         sr = sample_rate or self._sample_rate
         duration = len(samples) / sr
         logger.debug("Playing %.1fs of audio (%d samples @ %dHz)", duration, len(samples), sr)
+        if isinstance(samples, AudioStore):
+            self.play_stream((block, sr) for block in samples.blocks())
+        else:
+            self.play_stream([(samples, sr)])
+
+    def play_stream(self, blocks):
+        """Play (samples, sample_rate) blocks gaplessly through one stream.
+
+        Unlike calling ``play()`` per chunk, consecutive blocks are written
+        into a single open sink stream, so the caller can feed small blocks
+        (and change how they are processed between blocks) without clicks or
+        gaps. The stream runs at the sink's native rate (or the first
+        block's rate if it has none); blocks at any other rate, such as a
+        pitch-shifted or fallback voice, are resampled to it. The sample
+        rate may be fractional. Blocks until the last block has played or a
+        stop is requested.
+        """
         with self._lock:
             self._playing = True
-            self._stop_event.clear()
+        sink = self._sink
+        stream_sr = None
+        resampler: Resampler | None = None
         try:
-            sd.play(samples, sr)
-            while sd.get_stream().active:
+            for samples, sr in blocks:
                 if self._stop_event.is_set():
-                    sd.stop()
-                    logger.debug("Playback interrupted by stop event")
                     break
-                sd.sleep(50)
-        except Exception as e:
-            logger.error("Playback error: %s", e, exc_info=True)
+                if not len(samples):
+                    continue
+                try:
+                    if stream_sr is None:
+                        stream_sr = sink.native_rate or round(sr)
+                        sink.open(stream_sr)
+                    if resampler is None and sr != stream_sr:
+                        resampler = Resampler(sr, stream_sr)
+                    elif resampler is not None and resampler.src_rate != sr:
+                        # Keeps the filter history, so a pitch change is seamless
+                        resampler = resampler.retuned(sr)
+                    if resampler is not None:
+                        samples = resampler.process(samples)
+                    self._write(sink, samples, stream_sr)
+                except Exception as e:
+                    logger.error("Playback error: %s", e, exc_info=True)
+                    self._stop_event.set()
+            if stream_sr is not None:
+                if self._stop_event.is_set():
+                    sink.abort()
+                    logger.debug("Playback interrupted by stop event")
+                else:
+                    if resampler is not None:
+                        self._write(sink, resampler.flush(), stream_sr)
+                    sink.drain()  # Let queued audio finish before returning
+        except Exception:
+            # ``blocks`` is usually produced on the fly (synthesis, trimming,
+            # stretching) and can fail; stop the stream instead of leaving
+            # it running, and let the caller handle the error
+            if stream_sr is not None:
+                sink.abort()
+            raise
         finally:
+            if stream_sr is not None:
+                sink.close()
             with self._lock:
                 self._playing = False
+            if sink is not self._sink:
+                sink.release()  # Replaced while playing
+
+    def _write(self, sink: AudioSink, samples: np.ndarray, sample_rate: int):
+        """Write to the sink in short pieces so a stop is noticed quickly."""
+        samples = np.ascontiguousarray(samples, dtype=np.int16)
+        step = max(1, int(sample_rate * _MAX_WRITE_SECONDS))
+        for i in range(0, len(samples), step):
+            if self._stop_event.is_set():
+                return
+            sink.write(samples[i:i + step])
 
     def play_chunks(self, chunk_iterator):
         """Play streaming chunks sequentially. Supports interruption."""
-        for samples, sample_rate in chunk_iterator:
-            if self._stop_event.is_set():
-                break
-            self.play(samples, sample_rate)
+        self.play_stream(chunk_iterator)
 
     def stop(self):
         """Interrupt current playback. Thread-safe."""
         logger.debug("Stop requested")
         self._stop_event.set()
-        sd.stop()
 
     def reset(self):
         """Clear the stop flag so new playback can proceed."""
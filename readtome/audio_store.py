@@ -0,0 +1,195 @@
+import logging
+from typing import Iterator, NamedTuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Values of the buffer_compression setting
+CODECS = ("off", "lossless", "near_lossless")
+
+# Samples per stored block (about 0.19s at 22050 Hz); every block but the
+# last of a store is exactly this long
+BLOCK_SAMPLES = 4096
+# Samples sharing one bit width inside a block; small enough that quiet
+# stretches between words pack tightly
+_GROUP = 128
+# Low bits dropped by near_lossless: errors of at most 4 (of 32768), a
+# noise floor around -83 dBFS
+_NEAR_LOSSLESS_SHIFT = 3
+# Fixed polynomial predictors tried per block (0 = raw, 1 = first
+# difference, 2 = second difference); the cheapest one is kept
+_MAX_ORDER = 2
+
+
+class _Packed(NamedTuple):
+    """One compressed block: residuals of a fixed predictor, bit-packed."""
+    length: int
+    shift: int
+    head: tuple   # The first ``order`` samples, which seed the predictor
+    widths: bytes  # Bits per residual, one per _GROUP samples
+    bits: bytes
+
+
+class AudioStore:
+    """Int16 audio held as fixed-size blocks instead of one growing array.
+
+    Appending copies samples into blocks once; nothing is concatenated, so
+    a long utterance never needs a second full-size copy. With a codec
+    other than "off", each block is compressed as soon as it is full and
+    decompressed only when it is read back, one block at a time. Both
+    codecs are vectorized: per block, a fixed predictor (picked per block)
+    turns samples into small residuals, which are bit-packed at the width
+    each group of 128 samples needs. "lossless" reproduces the input
+    exactly; "near_lossless" first rounds samples to a multiple of 8.
+    """
+
+    def __init__(self, codec: str = "off"):
+        if codec not in CODECS:
+            logger.warning("Unknown buffer compression %r, using lossless", codec)
+            codec = "lossless"
+        self.codec = codec
+        self._shift = _NEAR_LOSSLESS_SHIFT if codec == "near_lossless" else 0
+        self._blocks: list = []
+        self._tail = np.zeros(0, dtype=np.int16)
+        self._length = 0
+
+    @classmethod
+    def from_array(cls, samples: np.ndarray, codec: str = "off") -> "AudioStore":
+        """A store for a finished clip; its final, shorter block is compressed too."""
+        store = cls(codec)
+        store.append(samples)
+        if store.codec != "off" and len(store._tail):
+            store._seal(store._tail)
+            store._tail = store._tail[:0]
+        return store
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held for the audio itself (excluding per-block overhead)."""
+        total = self._tail.nbytes
+        for block in self._blocks:
+            total += block.nbytes if isinstance(block, np.ndarray) else len(block.widths) + len(block.bits)
+        return total
+
+    def append(self, samples: np.ndarray):
+        samples = np.asarray(samples, dtype=np.int16)
+        self._length += len(samples)
+        start = 0
+        if len(self._tail):
+            start = BLOCK_SAMPLES - len(self._tail)
+            self._tail = np.concatenate((self._tail, samples[:start]))
+            if len(self._tail) < BLOCK_SAMPLES:
+                return
+            self._seal(self._tail)
+        full_end = start + (len(samples) - start) // BLOCK_SAMPLES * BLOCK_SAMPLES
+        for i in range(start, full_end, BLOCK_SAMPLES):
+            self._seal(samples[i:i + BLOCK_SAMPLES])
+        # Copied, so the store never keeps the caller's array alive
+        self._tail = samples[full_end:].copy()
+
+    def _seal(self, block: np.ndarray):
+        if self.codec == "off":
+            self._blocks.append(block.copy())
+        else:
+            self._blocks.append(_encode(block, self._shift))
+
+    def blocks(self) -> Iterator[np.ndarray]:
+        """Yield the audio block by block, decompressing each as it is reached."""
+        for block in self._blocks:
+            yield block if isinstance(block, np.ndarray) else _decode(block)
+        if len(self._tail):
+            yield self._tail
+
+    def to_array(self) -> np.ndarray:
+        """The whole audio as one array, decoded straight into place."""
+        out = np.empty(self._length, dtype=np.int16)
+        pos = 0
+        for block in self.blocks():
+            out[pos:pos + len(block)] = block
+            pos += len(block)
+        return out
+
+
+def _residuals(x: np.ndarray, order: int) -> np.ndarray:
+    """Prediction residuals after the first ``order`` samples, zigzag-coded."""
+    r = np.diff(x, n=order) if order else x
+    return ((r << 1) ^ (r >> 31)).astype(np.uint32)
+
+
+def _group_widths(u: np.ndarray) -> np.ndarray:
+    """Bits needed by the largest residual of each _GROUP samples."""
+    padded = np.zeros(-(-len(u) // _GROUP) * _GROUP, dtype=np.uint32)
+    padded[:len(u)] = u
+    peaks = padded.reshape(-1, _GROUP).max(axis=1)
+    return np.frexp(peaks.astype(np.float64))[1].astype(np.uint8)
+
+
+def _encode(block: np.ndarray, shift: int) -> _Packed:
+    x = block.astype(np.int32)
+    if shift:
+        x = (x + (1 << (shift - 1))) >> shift
+    best = None
+    for order in range(min(_MAX_ORDER, len(x) - 1) + 1):
+        u = _residuals(x, order)
+        widths = _group_widths(u)
+        cost = int(widths.astype(np.int64).sum()) * _GROUP
+        if best is None or cost < best[0]:
+            best = (cost, order, u, widths)
+    _, order, u, widths = best
+
+    # Residuals are packed back to back, least significant bit first, each
+    # at its group's width. No two share a bit, so adding them up is the
+    # same as OR-ing them in: first per starting byte (bincount; exact in
+    # float64 as each sum is below 2**32), then each byte collects its
+    # part of the words that start up to three bytes earlier.
+    offsets = _bit_offsets(widths, len(u))
+    start = offsets[:-1]
+    shifted = (u.astype(np.uint64) << (start & 7).astype(np.uint64)).astype(np.float64)
+    size = int(-(-offsets[-1] // 8))
+    words = np.zeros(size + 3, dtype=np.uint64)
+    words[3:] = np.bincount(start >> 3, weights=shifted, minlength=size)[:size]
+    packed = (
+        (words[3:] & 0xFF) + (words[2:-1] >> 8 & 0xFF)
+        + (words[1:-2] >> 16 & 0xFF) + (words[:-3] >> 24)
+    )
+    return _Packed(
+        length=len(x), shift=shift, head=tuple(int(v) for v in x[:order]),
+        widths=widths.tobytes(), bits=packed.astype(np.uint8).tobytes(),
+    )
+
+
+def _bit_offsets(widths: np.ndarray, n: int) -> np.ndarray:
+    """Bit offset of each of ``n`` residuals, plus the end offset last."""
+    per_sample = np.repeat(widths.astype(np.int64), _GROUP)[:n]
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(per_sample, out=offsets[1:])
+    return offsets
+
+
+def _decode(packed: _Packed) -> np.ndarray:
+    order = len(packed.head)
+    n = packed.length - order
+    widths = np.frombuffer(packed.widths, dtype=np.uint8)
+    offsets = _bit_offsets(widths, n)
+    # The 32-bit little-endian word starting at each byte; the one at a
+    # residual's first byte holds all of its bits
+    data = np.zeros(len(packed.bits) + 4, dtype=np.uint32)
+    data[:len(packed.bits)] = np.frombuffer(packed.bits, dtype=np.uint8)
+    words = data[:-3] | data[1:-2] << 8 | data[2:-1] << 16 | data[3:] << 24
+    start = offsets[:-1]
+    words = words[start >> 3]
+    masks = (np.uint32(1) << np.repeat(widths, _GROUP)[:n].astype(np.uint32)) - np.uint32(1)
+    u = (words >> (start & 7).astype(np.uint32)) & masks
+    x = (u >> 1).astype(np.int32) ^ -(u & 1).astype(np.int32)
+
+    # Undo each difference, seeded with that difference of the head samples
+    head = np.array(packed.head, dtype=np.int32)
+    for level in reversed(range(order)):
+        x = np.cumsum(np.concatenate((np.diff(head, n=level)[:1], x)), dtype=np.int32)
+    if packed.shift:
+        x = x << packed.shift
+    return np.clip(x, -32768, 32767).astype(np.int16)
@@ -1,5 +1,6 @@
 import json
 import logging
+import os
 import sys
 from dataclasses import dataclass
 from pathlib import Path
@@ -9,6 +10,21 @@ logger = logging.getLogger(__name__)
 # Default Piper voice model (high-quality US English female)
 DEFAULT_MODEL = "en_US-amy-medium.onnx"
 
+# Int8 variants written by `readtome quantize` sit next to the original as
+# <name>.int8.onnx (+ .int8.onnx.json).
+QUANTIZED_SUFFIX = ".int8.onnx"
+
+# Shared-weights copies written by `readtome share-weights`: the optimized
+# graph as <name>.shared.onnx with its weights in <name>.shared.onnx.data.
+SHARED_SUFFIX = ".shared.onnx"
+
+# Piper voice quality tiers, lightest first. Voice files are named
+# <language>-<speaker>-<quality>.onnx.
+QUALITY_TIERS = ("x_low", "low", "medium", "high")
+
+# Audio output backends (see readtome.sinks)
+SINK_NAMES = ("sounddevice", "wav", "null", "null-fast")
+
 # Pitch is applied as a sample rate multiplier during playback.
 # > 1.0 = higher pitch, < 1.0 = lower pitch.
 PITCH_PRESETS = {
@@ -34,22 +50,61 @@ class Config:
     speed: float = 1.0
     pitch: float = 1.0
     model_path: str = ""
+    # Silence trimming between/within synthesized sentences
+    trim_silence: bool = True
+    sentence_gap_ms: int = 200
+    max_pause_ms: int = 0  # 0 = leave pauses inside a sentence untouched
+    # Audio output: "sounddevice", "wav", "null" or "null-fast"
+    audio_sink: str = "sounddevice"
+    audio_sink_path: str = ""  # Output directory for the "wav" sink
+    # Load <voice>.int8.onnx instead of <voice>.onnx when one exists
+    prefer_quantized: bool = False
+    # Release the voice after this many idle minutes (0 = keep it loaded)
+    idle_unload_minutes: int = 0
+    # Soft RSS cap; when set, ONNX Runtime runs without its memory arena
+    # and pre-planned buffers, trading a little speed for lower peaks
+    memory_budget_mb: int = 0
+    # Load <voice>.shared.onnx when one exists, mapping its weights
+    # read-only from disk so every instance on the machine shares them
+    shared_weights: bool = False
+    # Lighter voice used while synthesis can't keep up with playback:
+    # "auto" = next lower quality tier of the same speaker, "" = disabled,
+    # or a voice file name / path
+    latency_fallback: str = "auto"
+    rtf_degrade_below: float = 1.2
+    rtf_recover_above: float = 2.0
+    # Synthesize long sentences clause by clause so speech starts sooner
+    chunked_decode: bool = False
+    # Cleanup applied to captured text before it is spoken, comma-separated
+    # (see readtome.normalize.RULES; "" = speak the text exactly as copied)
+    text_normalization: str = "code_blocks,log_prefixes,urls,markdown,symbols,repeated_lines"
+    # How audio kept in memory (kept for re-reads) is compressed:
+    # "off", "lossless" or "near_lossless" (see readtome.audio_store)
+    buffer_compression: str = "lossless"
 
     @classmethod
     def load(cls) -> "Config":
         config_path = cls._config_file()
         if config_path.exists():
             try:
-                data = json.loads(config_path.read_text())
-                return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+                return cls(**cls.read_fields())
             except Exception as e:
                 logger.warning("Failed to load config: %s, using defaults", e)
         return cls()
 
+    @classmethod
+    def read_fields(cls) -> dict:
+        """Known settings from config.json (raises if missing or malformed)."""
+        data = json.loads(cls._config_file().read_text())
+        return {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+
     def save(self):
+        """Write config.json atomically (temp file + rename)."""
         config_file = self._config_file()
         config_file.parent.mkdir(parents=True, exist_ok=True)
-        config_file.write_text(json.dumps(self.__dict__, indent=2))
+        tmp = config_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.__dict__, indent=2))
+        os.replace(tmp, config_file)
 
     @staticmethod
     def _config_file() -> Path:
@@ -67,6 +122,11 @@ class Config:
             return Path(sys._MEIPASS)
         return Path(__file__).parent.parent
 
+    @staticmethod
+    def get_cache_dir() -> Path:
+        """Per-user cache for derived files (e.g. optimized model graphs)."""
+        return Path.home() / ".readtome" / "cache"
+
     @staticmethod
     def get_models_dir() -> Path:
         return Config.get_base_dir() / "models"
@@ -77,12 +137,70 @@ class Config:
         models_dir = Config.get_models_dir()
         if not models_dir.exists():
             return []
-        voices = sorted(models_dir.glob("*.onnx"))
+        voices = sorted(
+            p for p in models_dir.glob("*.onnx")
+            if not p.name.endswith((QUANTIZED_SUFFIX, SHARED_SUFFIX))
+        )
         return voices
 
+    @staticmethod
+    def quantized_variant(model_path: str | Path) -> Path:
+        """Path of the int8 variant of a voice (which may not exist)."""
+        path = Path(model_path)
+        return path.with_name(path.name.removesuffix(".onnx") + QUANTIZED_SUFFIX)
+
+    @staticmethod
+    def shared_variant(model_path: str | Path) -> Path:
+        """Path of the shared-weights copy of a voice file (which may not exist)."""
+        path = Path(model_path)
+        return path.with_name(path.name.removesuffix(".onnx") + SHARED_SUFFIX)
+
+    def model_file_for(self, model_path: str | Path) -> str:
+        """The file to actually load for a voice, honoring prefer_quantized."""
+        if self.prefer_quantized:
+            variant = self.quantized_variant(model_path)
+            if variant.exists():
+                return str(variant)
+        return str(model_path)
+
+    @staticmethod
+    def lighter_variant(model_path: str | Path) -> Path | None:
+        """The nearest installed lower-quality tier of the same speaker."""
+        path = Path(model_path)
+        language, _, rest = path.stem.partition("-")
+        speaker, _, quality = rest.rpartition("-")
+        if not speaker or quality not in QUALITY_TIERS:
+            return None
+        for tier in reversed(QUALITY_TIERS[:QUALITY_TIERS.index(quality)]):
+            candidate = path.with_name(f"{language}-{speaker}-{tier}.onnx")
+            if candidate.exists():
+                return candidate
+        return None
+
+    def resolve_fallback_voice(self) -> str | None:
+        """Path of the latency fallback voice for the current voice, if any."""
+        if not self.latency_fallback or not self.model_path:
+            return None
+        if self.latency_fallback == "auto":
+            variant = self.lighter_variant(self.model_path)
+            return str(variant) if variant else None
+        path = Path(self.latency_fallback)
+        if not path.is_absolute():
+            path = self.get_models_dir() / path
+        if not path.exists() or path.resolve() == Path(self.model_path).resolve():
+            return None
+        return str(path)
+
+    def voice_label(self, model_path: str | Path) -> str:
+        """Menu label for a voice, marking ones that will load as int8."""
+        name = Path(model_path).stem
+        if self.model_file_for(model_path) != str(model_path):
+            name += " (int8)"
+        return name
+
     def get_voice_display_name(self) -> str:
         """Get a human-readable name from the model path."""
-        return Path(self.model_path).stem if self.model_path else "Unknown"
+        return self.voice_label(self.model_path) if self.model_path else "Unknown"
 
     # ── Start on Login (Windows registry) ─────────────────────────────
 
@@ -0,0 +1,139 @@
+import logging
+import threading
+import time
+from dataclasses import fields
+
+from readtome.config import Config
+from readtome.filewatch import FileWatcher
+
+logger = logging.getLogger(__name__)
+
+# Quiet period after the last change before config.json is written
+_DEBOUNCE_SECONDS = 0.5
+
+
+class ConfigStore:
+    """Saves a Config in the background and reloads external edits.
+
+    ``save()`` only marks the config dirty; a background thread writes it
+    (atomically, via ``Config.save``) once no further change has arrived
+    for the debounce period, so a burst of menu clicks costs one write and
+    the tray thread never waits on the disk. The same thread watches
+    config.json: fields edited by someone else are applied to the live
+    Config and reported to ``on_change`` as ``{name: (old, new)}``. With
+    nothing to save, the thread sleeps until the directory changes.
+    """
+
+    def __init__(self, config: Config, on_change=None, debounce: float = _DEBOUNCE_SECONDS):
+        self._config = config
+        self._on_change = on_change
+        self._debounce = debounce
+        self._lock = threading.Lock()
+        self._watcher = FileWatcher(Config._config_file())
+        self._dirty_since: float | None = None
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+        # config.json as last written or read by us, to tell which fields an
+        # external edit touched
+        self._synced = dict(config.__dict__)
+        self._file_stat = self._stat()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Write any pending change and stop the background thread."""
+        with self._lock:
+            self._stopped = True
+        self._watcher.wake()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+        self._watcher.close()
+
+    def save(self):
+        """Schedule a write of the current config."""
+        with self._lock:
+            self._dirty_since = time.monotonic()
+        self._watcher.wake()
+
+    def flush(self):
+        """Write now if there are unsaved changes."""
+        with self._lock:
+            if self._dirty_since is not None:
+                self._write()
+
+    @staticmethod
+    def _stat() -> tuple[int, int] | None:
+        try:
+            stat = Config._config_file().stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _write(self):
+        self._dirty_since = None
+        try:
+            self._config.save()
+        except OSError as e:
+            logger.error("Failed to save config: %s", e)
+            return
+        self._synced = dict(self._config.__dict__)
+        self._file_stat = self._stat()
+        logger.debug("Config saved")
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if self._stopped:
+                    return
+                timeout = None
+                if self._dirty_since is not None:
+                    timeout = self._dirty_since + self._debounce - time.monotonic()
+                    if timeout <= 0:
+                        self._write()
+                        continue
+            self._watcher.wait(timeout)
+            with self._lock:
+                if self._stopped:
+                    return
+                changes = self._reload()
+            if changes and self._on_change:
+                try:
+                    self._on_change(changes)
+                except Exception as e:
+                    logger.error("Failed to apply config change: %s", e, exc_info=True)
+
+    def _reload(self) -> dict:
+        """Merge fields edited outside the app into the live config."""
+        stat = self._stat()
+        if stat is None or stat == self._file_stat:
+            return {}
+        self._file_stat = stat
+        try:
+            data = Config.read_fields()
+        except Exception as e:
+            # Most likely an editor is half way through saving; the next
+            # modification will be picked up again
+            logger.warning("Ignoring unreadable config.json: %s", e)
+            return {}
+
+        defaults = {f.name: f.default for f in fields(Config)}
+        changes = {}
+        for name, value in data.items():
+            if value == self._synced.get(name):
+                continue  # Not edited externally
+            expected = type(defaults[name])
+            if expected is float and isinstance(value, int) and not isinstance(value, bool):
+                value = float(value)
+            if not isinstance(value, expected):
+                logger.warning("Ignoring config.json %s=%r: expected %s", name, value, expected.__name__)
+                continue
+            self._synced[name] = value
+            old = getattr(self._config, name)
+            if old != value:
+                setattr(self._config, name, value)
+                changes[name] = (old, value)
+        return changes
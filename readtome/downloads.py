@@ -0,0 +1,126 @@
+import hashlib
+import http.client
+import logging
+import os
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 65536
+_DOWNLOAD_ATTEMPTS = 5
+# Wait before resuming after an interruption: doubling from the first
+# value up to the second, so a flapping connection can't use up every
+# attempt within a second
+_RETRY_DELAY = 1.0
+_MAX_RETRY_DELAY = 16.0
+
+# Network errors after which a download is resumed rather than abandoned
+_RESUMABLE_ERRORS = (
+    urllib.error.URLError, http.client.HTTPException, ConnectionError, TimeoutError,
+)
+
+
+def download_resumable(
+    url: str,
+    dest_path: str | Path,
+    expected_digest: str | None = None,
+    algorithm: str = "sha256",
+    expected_size: int | None = None,
+) -> int:
+    """Download ``url`` to ``dest_path``, resuming and verifying as it goes.
+
+    Data is written to ``dest_path + ".part"``. If that file exists from an
+    earlier attempt, only the missing tail is requested with a Range
+    header. Dropped connections are retried from where they stopped. The
+    digest is computed while streaming; on a size or digest mismatch the
+    partial file is deleted and ValueError is raised. The finished file is
+    renamed into place, so ``dest_path`` only ever holds a complete
+    download. Returns the file size.
+    """
+    dest_path = str(dest_path)
+    part_path = dest_path + ".part"
+    hasher = hashlib.new(algorithm)
+    offset = 0
+    if os.path.exists(part_path):
+        with open(part_path, "rb") as f:
+            while chunk := f.read(_CHUNK_SIZE):
+                hasher.update(chunk)
+                offset += len(chunk)
+        logger.info("Resuming download at %d bytes", offset)
+
+    attempt = 0
+    while True:
+        headers = {"User-Agent": "ReadToMe-TTS"}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        req = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=120) as resp:
+                if offset and resp.status == 206:
+                    start = _content_range_start(resp.headers.get("Content-Range"))
+                    if start != offset:
+                        # Not the bytes we asked for: appending them would
+                        # corrupt the file, so fetch it whole instead
+                        logger.warning(
+                            "Server resumed at byte %s instead of %d, restarting download",
+                            start, offset,
+                        )
+                        hasher = hashlib.new(algorithm)
+                        offset = 0
+                        continue
+                elif offset:
+                    # Server ignored the Range header: start over
+                    logger.info("Server does not support resume, restarting download")
+                    hasher = hashlib.new(algorithm)
+                    offset = 0
+                length = resp.headers.get("Content-Length")
+                end = offset + int(length) if length else None
+                with open(part_path, "ab" if offset else "wb") as f:
+                    while chunk := resp.read(_CHUNK_SIZE):
+                        f.write(chunk)
+                        hasher.update(chunk)
+                        offset += len(chunk)
+                if end is not None and offset < end:
+                    # Connection closed early without raising
+                    raise http.client.IncompleteRead(b"", end - offset)
+            break
+        except urllib.error.HTTPError as e:
+            if e.code == 416 and offset:
+                # Requested range starts at the end: the partial file is complete
+                break
+            raise
+        except _RESUMABLE_ERRORS as e:
+            attempt += 1
+            if attempt >= _DOWNLOAD_ATTEMPTS:
+                raise
+            delay = min(_MAX_RETRY_DELAY, _RETRY_DELAY * 2 ** (attempt - 1))
+            logger.warning(
+                "Download interrupted at %d bytes (%s), resuming in %.0fs (attempt %d/%d)",
+                offset, e, delay, attempt + 1, _DOWNLOAD_ATTEMPTS,
+            )
+            time.sleep(delay)
+
+    actual = hasher.hexdigest()
+    if expected_size is not None and offset != expected_size:
+        os.remove(part_path)
+        raise ValueError(f"Size mismatch: expected {expected_size} bytes, got {offset}")
+    if expected_digest and actual != expected_digest.lower():
+        os.remove(part_path)
+        raise ValueError(
+            f"Checksum mismatch: expected {expected_digest}, got {actual}"
+        )
+    os.replace(part_path, dest_path)
+    logger.info("Downloaded %s: %d bytes, %s %s", Path(dest_path).name, offset, algorithm, actual)
+    return offset
+
+
+def _content_range_start(value: str | None) -> int | None:
+    """First byte of a ``Content-Range: bytes START-END/TOTAL`` header."""
+    unit, _, spec = (value or "").strip().partition(" ")
+    start = spec.partition("-")[0]
+    if unit != "bytes" or not start.isdigit():
+        return None
+    return int(start)
@@ -0,0 +1,147 @@
+import ctypes
+import logging
+import os
+import select
+import sys
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Used where no change notification API is available
+_FALLBACK_POLL_SECONDS = 5.0
+
+
+class FileWatcher:
+    """Sleeps until a file's directory changes, ``wake()`` is called or a timeout.
+
+    Uses directory change notifications (FindFirstChangeNotification on
+    Windows, inotify on Linux), so a thread waiting on it with no timeout
+    costs no wakeups at all. Elsewhere it falls back to waking every few
+    seconds. A return from ``wait()`` only means "check again": the caller
+    compares the file's stat itself.
+    """
+
+    def __init__(self, path: Path):
+        self._dir = Path(path).parent
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._impl = None
+        try:
+            if sys.platform == "win32":
+                self._impl = _WindowsWatch(self._dir)
+            elif sys.platform.startswith("linux"):
+                self._impl = _InotifyWatch(self._dir)
+        except OSError as e:
+            logger.debug("No change notifications for %s (%s), polling", self._dir, e)
+        if self._impl is None:
+            self._impl = _PollWatch()
+
+    def wait(self, timeout: float | None = None):
+        self._impl.wait(timeout)
+
+    def wake(self):
+        """Make a current or the next ``wait()`` return right away."""
+        self._impl.wake()
+
+    def close(self):
+        self._impl.close()
+
+
+class _PollWatch:
+    def __init__(self):
+        self._event = threading.Event()
+
+    def wait(self, timeout):
+        if timeout is None or timeout > _FALLBACK_POLL_SECONDS:
+            timeout = _FALLBACK_POLL_SECONDS
+        self._event.wait(timeout)
+        self._event.clear()
+
+    def wake(self):
+        self._event.set()
+
+    def close(self):
+        pass
+
+
+class _WindowsWatch:
+    _FILE_NOTIFY_CHANGE_FILE_NAME = 0x1
+    _INFINITE = 0xFFFFFFFF
+    _INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+    def __init__(self, directory: Path):
+        from ctypes import wintypes
+
+        k32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        k32.FindFirstChangeNotificationW.restype = wintypes.HANDLE
+        k32.FindFirstChangeNotificationW.argtypes = [wintypes.LPCWSTR, wintypes.BOOL, wintypes.DWORD]
+        k32.CreateEventW.restype = wintypes.HANDLE
+        k32.CreateEventW.argtypes = [ctypes.c_void_p, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR]
+        k32.WaitForMultipleObjects.restype = wintypes.DWORD
+        k32.WaitForMultipleObjects.argtypes = [
+            wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE), wintypes.BOOL, wintypes.DWORD,
+        ]
+        for name in ("FindNextChangeNotification", "FindCloseChangeNotification", "SetEvent", "CloseHandle"):
+            getattr(k32, name).argtypes = [wintypes.HANDLE]
+        self._k32 = k32
+
+        # File names only (creates, deletes, renames), as config saves are a
+        # rename; not LAST_WRITE, which the log file and the performance
+        # history database in the same directory trigger on every write
+        self._change = k32.FindFirstChangeNotificationW(
+            str(directory), False, self._FILE_NOTIFY_CHANGE_FILE_NAME,
+        )
+        if not self._change or self._change == self._INVALID_HANDLE_VALUE:
+            raise ctypes.WinError(ctypes.get_last_error())
+        self._wake = k32.CreateEventW(None, False, False, None)  # Auto-reset
+        self._handles = (wintypes.HANDLE * 2)(self._change, self._wake)
+
+    def wait(self, timeout):
+        ms = self._INFINITE if timeout is None else max(0, int(timeout * 1000))
+        result = self._k32.WaitForMultipleObjects(2, self._handles, False, ms)
+        if result == 0:  # WAIT_OBJECT_0: the directory changed
+            self._k32.FindNextChangeNotification(self._change)
+
+    def wake(self):
+        self._k32.SetEvent(self._wake)
+
+    def close(self):
+        self._k32.FindCloseChangeNotification(self._change)
+        self._k32.CloseHandle(self._wake)
+
+
+class _InotifyWatch:
+    _IN_CLOSE_WRITE = 0x8
+    _IN_MOVED_TO = 0x80
+    _IN_CREATE = 0x100
+
+    def __init__(self, directory: Path):
+        libc = ctypes.CDLL(None, use_errno=True)
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        # Not IN_MODIFY: the log file in the same directory is written
+        # continuously and would wake the watcher on every record
+        mask = self._IN_CLOSE_WRITE | self._IN_MOVED_TO | self._IN_CREATE
+        if libc.inotify_add_watch(self._fd, os.fsencode(directory), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, "inotify_add_watch failed")
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+
+    def wait(self, timeout):
+        readable, _, _ = select.select([self._fd, self._wake_r], [], [], timeout)
+        for fd in readable:
+            try:
+                while os.read(fd, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def wake(self):
+        os.write(self._wake_w, b"\0")
+
+    def close(self):
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            os.close(fd)
@@ -5,6 +5,8 @@ import time
 import keyboard
 import pyperclip
 
+from readtome.profiling import Profiler, no_stage
+
 logger = logging.getLogger(__name__)
 
 # Keys that the `keyboard` library treats as modifiers.
@@ -40,11 +42,29 @@ def _normalize_modifier(name: str) -> str:
 
 
 class HotkeyManager:
-    def __init__(self, hotkey: str, callback):
+    """Global hotkey that copies the selected text and passes it to ``callback``.
+
+    ``keyboard_backend`` and ``clipboard`` default to the ``keyboard`` and
+    ``pyperclip`` modules; the soak benchmark (benchmarks/bench_soak.py)
+    passes stand-ins with the same functions.
+    """
+
+    def __init__(self, hotkey: str, callback, profiler: Profiler | None = None,
+                 keyboard_backend=None, clipboard=None):
         self._hotkey = hotkey
         self._callback = callback
+        self._profiler = profiler
+        self._keyboard = keyboard_backend or keyboard
+        self._clipboard = clipboard or pyperclip
+        # perf_counter() time of the last hotkey press and how long its
+        # text capture took, for the performance history
+        self.last_pressed_at: float | None = None
+        self.last_capture_seconds = 0.0
         self._registered = False
         self._capturing = False
+        # Modifier-only presses each get their own thread; copies must not
+        # overlap, or one would "restore" the other's half-copied clipboard
+        self._copy_lock = threading.Lock()
         # For modifier-only hotkeys
         self._hook_handle = None
         self._required_mods: set[str] = set()
@@ -58,7 +78,7 @@ class HotkeyManager:
         if _is_modifier_only(self._hotkey):
             self._register_modifier_only()
         else:
-            keyboard.add_hotkey(self._hotkey, self._on_hotkey, suppress=True)
+            self._keyboard.add_hotkey(self._hotkey, self._on_hotkey, suppress=True)
         self._registered = True
         logger.info("Registered global hotkey: %s", self._hotkey)
 
@@ -67,7 +87,7 @@ class HotkeyManager:
         parts = [p.strip().lower() for p in self._hotkey.split("+")]
         self._required_mods = {_normalize_modifier(p) for p in parts}
         self._mod_fired = False
-        self._hook_handle = keyboard.hook(self._on_key_event, suppress=False)
+        self._hook_handle = self._keyboard.hook(self._on_key_event, suppress=False)
         logger.debug(
             "Modifier-only hotkey registered, watching for: %s",
             self._required_mods,
@@ -75,14 +95,14 @@ class HotkeyManager:
 
     def _unregister_modifier_only(self):
         if self._hook_handle is not None:
-            keyboard.unhook(self._hook_handle)
+            self._keyboard.unhook(self._hook_handle)
             self._hook_handle = None
             self._required_mods = set()
 
     def _get_held_modifiers(self) -> set[str]:
         """Get the set of normalized modifier names currently held down."""
         mods = set()
-        for scan_code, event in keyboard._pressed_events.items():
+        for scan_code, event in self._keyboard._pressed_events.items():
             name = event.name if hasattr(event, "name") and event.name else ""
             normalized = _normalize_modifier(name)
             if normalized:
@@ -114,7 +134,7 @@ class HotkeyManager:
                 self._unregister_modifier_only()
             else:
                 try:
-                    keyboard.remove_hotkey(self._hotkey)
+                    self._keyboard.remove_hotkey(self._hotkey)
                 except (KeyError, ValueError):
                     pass
             self._registered = False
@@ -146,7 +166,7 @@ class HotkeyManager:
             self.unregister()
 
             logger.debug("Waiting for user to press a key combination...")
-            combo = keyboard.read_hotkey(suppress=False)
+            combo = self._keyboard.read_hotkey(suppress=False)
             logger.info("Captured key combination: %s", combo)
 
             # Normalize: keyboard lib returns e.g. "ctrl+shift+s"
@@ -174,22 +194,48 @@ class HotkeyManager:
         """Called in keyboard listener thread when hotkey is pressed."""
         if self._capturing:
             return
-        text = self._capture_selected_text()
+        # A profile session (if profiling is on) starts at capture and is
+        # picked up by the speaking thread via Profiler.take_pending()
+        session = self._profiler.begin() if self._profiler else None
+        pressed_at = time.perf_counter()
+        with session.stage("capture") if session else no_stage("capture"):
+            with self._copy_lock:
+                text = self._capture_selected_text()
+        self.last_pressed_at = pressed_at
+        self.last_capture_seconds = time.perf_counter() - pressed_at
         if text and text.strip():
             logger.info("Captured %d characters of text", len(text))
             self._callback(text.strip())
         else:
             logger.debug("No text captured from clipboard")
+            if session:
+                self._profiler.discard(session)
+
+    def _wait_for_key_release(self, timeout: float):
+        """Block until no keys are held (or the timeout), without polling."""
+        released = threading.Event()
+
+        def on_event(event):
+            if event.event_type == self._keyboard.KEY_UP and not self._keyboard._pressed_events:
+                released.set()
+
+        hook = self._keyboard.hook(on_event)
+        try:
+            # Checked after hooking, so a release in between isn't missed
+            if self._keyboard._pressed_events:
+                released.wait(timeout)
+        finally:
+            self._keyboard.unhook(hook)
 
     def _capture_selected_text(self) -> str:
         """Simulate Ctrl+C and read clipboard."""
         try:
-            old_clipboard = pyperclip.paste()
+            old_clipboard = self._clipboard.paste()
         except Exception:
             old_clipboard = ""
 
         try:
-            pyperclip.copy("")
+            self._clipboard.copy("")
         except Exception:
             pass
 
@@ -197,21 +243,19 @@ class HotkeyManager:
         # For modifier-only hotkeys the user may still be holding keys,
         # and sending ctrl+c while other modifiers are held results in
         # alt+shift+ctrl+c (etc.) which doesn't copy.
-        deadline = time.monotonic() + 1.0  # 1 second timeout
-        while keyboard._pressed_events and time.monotonic() < deadline:
-            time.sleep(0.02)
+        self._wait_for_key_release(timeout=1.0)
         time.sleep(0.05)
-        keyboard.send("ctrl+c")
+        self._keyboard.send("ctrl+c")
         time.sleep(0.15)
 
         try:
-            text = pyperclip.paste()
+            text = self._clipboard.paste()
         except Exception:
             text = ""
 
         # Restore the user's original clipboard content
         try:
-            pyperclip.copy(old_clipboard)
+            self._clipboard.copy(old_clipboard)
         except Exception:
             logger.debug("Failed to restore clipboard contents")
 
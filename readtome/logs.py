@@ -0,0 +1,62 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+from pathlib import Path
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+
+# readtome.log is rotated at this size, keeping this many old files
+# (readtome.log.1 ... readtome.log.3)
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves all formatting to the listener thread.
+
+    The stock handler renders ``msg % args`` (and any traceback) before
+    queueing, so records can be pickled to another process. Our queue
+    stays in-process, so the record is passed on untouched.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def setup_logging(log_file: Path, level: int, console: bool = False) -> logging.handlers.QueueListener:
+    """Route all logging through a queue to a rotating file (and console).
+
+    Loggers only put records on an in-memory queue; a listener thread does
+    all formatting and disk writes, so logging from the synthesis and
+    playback loops never waits on I/O. The listener is stopped (and the
+    queue drained) at exit.
+    """
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers: list[logging.Handler] = [
+        logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT,
+            encoding="utf-8",
+        ),
+    ]
+    # If launched from a console (e.g. cmd /k ReadToMe.exe --debug),
+    # also print to stdout so the user can see output in real time.
+    if console:
+        handlers.append(logging.StreamHandler(sys.stdout))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    # Registered after logging's own exit hook, so it runs first and the
+    # queue is flushed before the handlers are closed
+    atexit.register(listener.stop)
+
+    logging.basicConfig(
+        level=level,
+        handlers=[_DeferredQueueHandler(log_queue)],
+        force=True,
+    )
+    return listener
@@ -0,0 +1,86 @@
+import ctypes
+import sys
+
+
+def _windows_counters():
+    """PROCESS_MEMORY_COUNTERS for the current process (Windows only)."""
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    handle = ctypes.windll.kernel32.GetCurrentProcess()
+    ctypes.windll.psapi.GetProcessMemoryInfo(
+        handle, ctypes.byref(counters), counters.cb,
+    )
+    return counters
+
+
+def _proc_status_kb(field: str) -> int:
+    """Read a ``kB`` field from /proc/self/status (Linux)."""
+    with open("/proc/self/status", encoding="ascii") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+    return 0
+
+
+def get_rss() -> int:
+    """Current resident set size of this process, in bytes (0 if unknown)."""
+    try:
+        if sys.platform == "win32":
+            return _windows_counters().WorkingSetSize
+        if sys.platform.startswith("linux"):
+            return _proc_status_kb("VmRSS") * 1024
+    except Exception:
+        pass
+    return 0
+
+
+def get_peak_rss() -> int:
+    """Peak resident set size of this process so far, in bytes (0 if unknown)."""
+    try:
+        if sys.platform == "win32":
+            return _windows_counters().PeakWorkingSetSize
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is kilobytes on Linux, bytes on macOS
+        return peak if sys.platform == "darwin" else peak * 1024
+    except Exception:
+        return 0
+
+
+def release_free_memory():
+    """Ask the allocator / OS to give freed memory back after a big release.
+
+    glibc keeps freed arenas mapped until trimmed; Windows keeps pages in
+    the working set until it is emptied.
+    """
+    try:
+        if sys.platform == "win32":
+            handle = ctypes.windll.kernel32.GetCurrentProcess()
+            ctypes.windll.kernel32.SetProcessWorkingSetSize(
+                handle, ctypes.c_size_t(-1), ctypes.c_size_t(-1),
+            )
+        elif sys.platform.startswith("linux"):
+            ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except Exception:
+        pass
+
+
+def format_mb(num_bytes: int) -> str:
+    return f"{num_bytes / (1024 * 1024):.0f} MB"
@@ -0,0 +1,167 @@
+import functools
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# Rules in the order they are applied. Every pattern below is matched in a
+# single left-to-right pass with bounded backtracking, so normalizing is
+# linear in the length of the text (multi-MB selections included).
+RULES = ("code_blocks", "log_prefixes", "urls", "markdown", "symbols", "repeated_lines")
+
+# Lines opening or closing a fenced code block
+_FENCE = re.compile(r"[ \t]*(```|~~~)")
+
+# Log line prefixes: timestamps followed by a level, or a bracketed level,
+# then any [thread] / [module] tags: "2024-05-01 12:00:03,120 INFO [main] ",
+# "[12:00:03] [WARN] ", "[ERROR]: ". A timestamp or level word alone is
+# left alone, so "2024-05-01 was the launch day." and "ERROR: disk full"
+# keep their first word. A date and time separated by a space count as two
+# timestamps, so a line of timestamps with no level fails in linear time.
+_LOG_TIME = r"\d\d:\d\d(?::\d\d(?:[.,]\d+)?)?(?:Z|[+-]\d\d:?\d\d)?"
+_LOG_LEVEL = r"(?:TRACE|DEBUG|INFO|NOTICE|WARN|WARNING|ERROR|CRITICAL|FATAL)"
+_LOG_PREFIX = re.compile(
+    r"^[ \t]*(?:"
+    r"(?:[\[(]?(?:\d{4}-\d\d-\d\d(?:T" + _LOG_TIME + r")?|" + _LOG_TIME + r")"
+    r"[\])]?[ \t]+(?:-[ \t]+)?)+"
+    r"[\[(]?" + _LOG_LEVEL + r"[\])]?:?"
+    r"|\[" + _LOG_LEVEL + r"\]:?"
+    r")[ \t]+(?:-[ \t]+)?"
+    r"(?:\[[^\]\n]{0,40}\][ \t]*:?[ \t]*)*",
+    re.MULTILINE,
+)
+
+# URLs are shortened to their host name; trailing sentence punctuation and
+# closing brackets stay with the text
+_URL = re.compile(
+    r"\b(?:https?://|www\.)(?:www\.)?([^\s/?#:<>\"'()\[\]]+)"
+    r"(?:[^\s<>\"']*[^\s<>\"'.,;:!?)\]])?",
+    re.IGNORECASE,
+)
+
+_MD_IMAGE_OR_LINK = re.compile(r"!?\[([^\[\]\n]*)\]\([^()\s]*\)")
+_MD_LINE_MARKUP = re.compile(
+    r"^[ \t]*(?:#{1,6}[ \t]+|>+[ \t]?|[-*+][ \t]+(?:\[[ xX]\][ \t]+)?)",
+    re.MULTILINE,
+)
+_MD_EMPHASIS = re.compile(r"(\*{1,3}|~~)(?=\S)([^*~\n]+?)(?<=\S)\1")
+_MD_INLINE_CODE = re.compile(r"`([^`\n]*)`")
+# HTML tags: a known or custom (hyphenated) element with name=value
+# attributes, or any other name followed by at least one such attribute.
+# Prose such as "if a<b and c>d" has neither shape and is left alone.
+_HTML_ELEMENTS = (
+    "a|abbr|article|aside|audio|b|blockquote|body|br|button|caption|center|cite|code|col|colgroup"
+    "|dd|del|details|div|dl|dt|em|figcaption|figure|font|footer|form|h[1-6]|head|header|hr|html"
+    "|i|iframe|img|input|ins|kbd|label|li|link|main|mark|meta|nav|ol|option|p|pre|q|s|samp"
+    "|script|section|select|small|source|span|strong|style|sub|summary|sup|svg|table|tbody|td"
+    "|textarea|tfoot|th|thead|time|title|tr|u|ul|var|video|wbr"
+)
+_HTML_ATTR = r"\s+[\w:.-]+\s*=\s*(?:\"[^\"\n]{0,200}\"|'[^'\n]{0,200}'|[^\s\"'<>=`]{1,200})"
+_HTML_TAG = re.compile(
+    r"</?(?:(?:" + _HTML_ELEMENTS + r"|[a-zA-Z]\w{0,40}-[\w-]{0,40})(?![\w-])(?:" + _HTML_ATTR + r"){0,20}"
+    r"|[a-zA-Z][\w-]{0,40}(?:" + _HTML_ATTR + r"){1,20})\s*/?>",
+    re.IGNORECASE,
+)
+
+# Four or more symbols in a row (rules, box drawing, emoji strings, "!!!!")
+_SYMBOL_RUN = re.compile(r"(?:[^\w\s]|_){4,}")
+
+_SPACES = re.compile(r"[ \t]{2,}")
+_TRAILING_SPACES = re.compile(r"[ \t]+$", re.MULTILINE)
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+@functools.lru_cache(maxsize=8)
+def parse_rules(spec: str) -> frozenset:
+    """Rule names from a comma-separated config value ("" = none)."""
+    names = {name.strip() for name in spec.split(",") if name.strip()}
+    unknown = names - set(RULES)
+    if unknown:
+        logger.warning(
+            "Unknown text normalization rules ignored: %s (known: %s)",
+            ", ".join(sorted(unknown)), ", ".join(RULES),
+        )
+    return frozenset(names & set(RULES))
+
+
+def normalize_text(text: str, rules: str | frozenset) -> str:
+    """Remove or shorten content that is slow to speak and useless to hear.
+
+    ``rules`` is a set of names from RULES or the comma-separated config
+    value. Code blocks are dropped, log timestamps/levels stripped, URLs
+    reduced to their host, markdown and HTML markup removed (keeping link
+    and emphasis text), long runs of symbols cut and lines repeating the
+    line before them skipped. Whitespace left behind is collapsed.
+    """
+    if isinstance(rules, str):
+        rules = parse_rules(rules)
+    if not rules or not text:
+        return text
+
+    if "code_blocks" in rules:
+        text = _drop_code_blocks(text)
+    if "log_prefixes" in rules:
+        text = _LOG_PREFIX.sub("", text)
+    if "urls" in rules:
+        text = _URL.sub(_url_host, text)
+    if "markdown" in rules:
+        text = _MD_IMAGE_OR_LINK.sub(r"\1", text)
+        text = _MD_LINE_MARKUP.sub("", text)
+        text = _MD_EMPHASIS.sub(r"\2", text)
+        text = _MD_INLINE_CODE.sub(r"\1", text)
+        text = _HTML_TAG.sub(" ", text)
+    if "symbols" in rules:
+        text = _SYMBOL_RUN.sub(_symbol_run, text)
+    if "repeated_lines" in rules:
+        text = _drop_repeated_lines(text)
+
+    text = _TRAILING_SPACES.sub("", _SPACES.sub(" ", text))
+    return _BLANK_LINES.sub("\n\n", text).strip()
+
+
+def _url_host(match: re.Match) -> str:
+    return match.group(1).lower()
+
+
+def _symbol_run(match: re.Match) -> str:
+    # Keep a sentence end so the text is still split in the same place, but
+    # only where the run ends a word or line ("Wait!!!!"), not inside a
+    # path or other token ("../../etc")
+    end = match.end()
+    if end < len(match.string) and not match.string[end].isspace():
+        return " "
+    run = match.group(0)
+    for end in ".!?":
+        if end in run:
+            return end + " "
+    return " "
+
+
+def _drop_code_blocks(text: str) -> str:
+    lines = text.split("\n")
+    kept = []
+    fence = None
+    for line in lines:
+        match = _FENCE.match(line)
+        if fence is None:
+            if match:
+                fence = match.group(1)
+            else:
+                kept.append(line)
+        elif match and match.group(1) == fence:
+            fence = None
+    return "\n".join(kept)
+
+
+def _drop_repeated_lines(text: str) -> str:
+    # Only runs of identical lines (log spam, a line pasted twice) collapse;
+    # a repeat further on, like a chorus or a second "Yes.", is still read
+    kept = []
+    previous = None
+    for line in text.split("\n"):
+        key = line.strip()
+        if key and key == previous:
+            continue
+        previous = key
+        kept.append(line)
+    return "\n".join(kept)
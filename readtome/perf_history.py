@@ -0,0 +1,262 @@
+import logging
+import queue
+import sqlite3
+import statistics
+import threading
+import time
+from pathlib import Path
+
+from readtome import __version__
+
+logger = logging.getLogger(__name__)
+
+DB_FILE = Path.home() / ".readtome" / "perf_history.sqlite3"
+
+# Retention: rows older than this, or beyond the newest _MAX_ROWS, are pruned
+_MAX_AGE_DAYS = 180
+_MAX_ROWS = 50_000
+# Prune after this many inserts (and once at startup)
+_PRUNE_EVERY = 200
+
+COLUMNS = (
+    "ts",                 # Unix time the utterance started
+    "version",            # readtome.__version__
+    "voice",              # Voice file stem
+    "speed",
+    "text_chars",
+    "chunks",
+    "capture_ms",         # Hotkey press to text captured
+    "hotkey_to_audio_ms", # Hotkey press to first chunk ready
+    "first_chunk_ms",     # Synthesis start to first chunk ready
+    "synth_ms",           # Time spent in inference (reused sentences excluded)
+    "total_ms",           # Synthesis start to end of playback
+    "audio_seconds",      # Audio synthesized, before trimming/stretching
+    "rtf",                # Freshly synthesized audio / synthesis seconds (NULL if all reused)
+    "stopped",            # 1 if interrupted
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS utterances (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    version TEXT NOT NULL,
+    voice TEXT NOT NULL,
+    speed REAL,
+    text_chars INTEGER,
+    chunks INTEGER,
+    capture_ms REAL,
+    hotkey_to_audio_ms REAL,
+    first_chunk_ms REAL,
+    synth_ms REAL,
+    total_ms REAL,
+    audio_seconds REAL,
+    rtf REAL,
+    stopped INTEGER
+);
+CREATE INDEX IF NOT EXISTS utterances_ts ON utterances (ts);
+"""
+
+
+class PerfHistory:
+    """Append-only store of per-utterance timings in a local SQLite file.
+
+    ``record()`` only puts the row on a queue; a writer thread (started on
+    first use) owns the connection, inserts rows and applies the retention
+    limits, so the speaking thread never waits on the database.
+    """
+
+    def __init__(self, db_file: Path = DB_FILE):
+        self._db_file = db_file
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def record(self, **row):
+        """Queue one utterance's timings (keys from COLUMNS)."""
+        row.setdefault("ts", time.time())
+        row.setdefault("version", __version__)
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        self._queue.put(row)
+
+    def close(self, timeout: float = 2.0):
+        """Write queued rows and stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout)
+
+    def _run(self):
+        try:
+            conn = connect(self._db_file)
+        except sqlite3.Error as e:
+            logger.error("Performance history disabled, cannot open %s: %s", self._db_file, e)
+            return
+        inserted = 0
+        try:
+            self._prune(conn)
+            while True:
+                row = self._queue.get()  # Blocks; no polling while idle
+                if row is None:
+                    return
+                rows = [row]
+                # Take whatever else is already queued in the same transaction
+                while True:
+                    try:
+                        row = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if row is None:
+                        self._insert(conn, rows)
+                        return
+                    rows.append(row)
+                self._insert(conn, rows)
+                inserted += len(rows)
+                if inserted >= _PRUNE_EVERY:
+                    self._prune(conn)
+                    inserted = 0
+        except sqlite3.Error as e:
+            logger.error("Performance history write failed: %s", e)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, rows: list[dict]):
+        with conn:
+            conn.executemany(
+                f"INSERT INTO utterances ({', '.join(COLUMNS)}) "
+                f"VALUES ({', '.join(':' + c for c in COLUMNS)})",
+                [{c: row.get(c) for c in COLUMNS} for row in rows],
+            )
+
+    @staticmethod
+    def _prune(conn: sqlite3.Connection):
+        with conn:
+            conn.execute(
+                "DELETE FROM utterances WHERE ts < ?",
+                (time.time() - _MAX_AGE_DAYS * 86400,),
+            )
+            conn.execute(
+                "DELETE FROM utterances WHERE id <= "
+                "(SELECT id FROM utterances ORDER BY id DESC LIMIT 1 OFFSET ?)",
+                (_MAX_ROWS,),
+            )
+
+
+def connect(db_file: Path = DB_FILE) -> sqlite3.Connection:
+    db_file.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_file)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+# ── perf-report ──────────────────────────────────────────────────────
+
+# A version is flagged when its median is this much worse than the previous one
+_REGRESSION_THRESHOLD = 0.10
+
+
+def _percentiles(values: list[float]) -> tuple[float, float, float]:
+    """p50, p95, p99 of the values."""
+    if len(values) == 1:
+        return values[0], values[0], values[0]
+    q = statistics.quantiles(values, n=100, method="inclusive")
+    return q[49], q[94], q[98]
+
+
+def _version_key(version: str):
+    return tuple(int(p) if p.isdigit() else 0 for p in version.split("."))
+
+
+def _fmt(value: float | None, unit: str = "ms") -> str:
+    if value is None:
+        return "-"
+    return f"{value:.0f}{unit}" if unit == "ms" else f"{value:.2f}{unit}"
+
+
+def report(days: int = 7, db_file: Path = DB_FILE) -> str:
+    """Percentiles, per-voice weekly trends and version-to-version regressions."""
+    if not db_file.exists():
+        return f"No performance history yet ({db_file})"
+    conn = connect(db_file)
+    conn.row_factory = sqlite3.Row
+    try:
+        rows = conn.execute("SELECT * FROM utterances ORDER BY ts").fetchall()
+    finally:
+        conn.close()
+    if not rows:
+        return "No utterances recorded yet"
+
+    since = time.time() - days * 86400
+    recent = [r for r in rows if r["ts"] >= since]
+    lines = [f"{len(rows)} utterances recorded, {len(recent)} in the last {days} days", ""]
+
+    lines.append(f"{f'Last {days} days':28} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for label, column, unit in (
+        ("Hotkey to audio", "hotkey_to_audio_ms", "ms"),
+        ("First chunk", "first_chunk_ms", "ms"),
+        ("Capture", "capture_ms", "ms"),
+        ("Speed (x realtime)", "rtf", "x"),
+    ):
+        values = [r[column] for r in recent if r[column] is not None]
+        if values:
+            p50, p95, p99 = _percentiles(values)
+            lines.append(f"  {label:26} {_fmt(p50, unit):>8} {_fmt(p95, unit):>8} {_fmt(p99, unit):>8}")
+
+    lines += ["", "Per voice, weekly median first chunk / speed (oldest to newest week)"]
+    voices = sorted({r["voice"] for r in rows})
+    now = time.time()
+    for voice in voices:
+        weeks = []
+        for week in range(3, -1, -1):
+            start, end = now - (week + 1) * 7 * 86400, now - week * 7 * 86400
+            in_week = [r for r in rows if r["voice"] == voice and start <= r["ts"] < end]
+            first = [r["first_chunk_ms"] for r in in_week if r["first_chunk_ms"] is not None]
+            rtf = [r["rtf"] for r in in_week if r["rtf"]]
+            weeks.append(
+                f"{_fmt(statistics.median(first) if first else None)}/"
+                f"{_fmt(statistics.median(rtf) if rtf else None, 'x')}"
+            )
+        lines.append(f"  {voice:32} " + "  ".join(f"{w:>14}" for w in weeks))
+
+    lines += ["", "Per version (median first chunk / speed)"]
+    regressions = []
+    for voice in voices:
+        by_version: dict[str, list] = {}
+        for r in rows:
+            if r["voice"] == voice:
+                by_version.setdefault(r["version"], []).append(r)
+        previous = None
+        for version in sorted(by_version, key=_version_key):
+            vrows = by_version[version]
+            first = [r["first_chunk_ms"] for r in vrows if r["first_chunk_ms"] is not None]
+            rtf = [r["rtf"] for r in vrows if r["rtf"]]
+            stats = (
+                statistics.median(first) if first else None,
+                statistics.median(rtf) if rtf else None,
+            )
+            lines.append(
+                f"  {voice:32} {version:>10} {_fmt(stats[0]):>8} {_fmt(stats[1], 'x'):>8}"
+                f"  ({len(vrows)} utterances)"
+            )
+            if previous is not None:
+                prev_version, prev = previous
+                if prev[0] and stats[0] and stats[0] > prev[0] * (1 + _REGRESSION_THRESHOLD):
+                    regressions.append(
+                        f"  {voice}: first chunk {_fmt(prev[0])} in {prev_version} -> "
+                        f"{_fmt(stats[0])} in {version}"
+                    )
+                if prev[1] and stats[1] and stats[1] < prev[1] * (1 - _REGRESSION_THRESHOLD):
+                    regressions.append(
+                        f"  {voice}: speed {_fmt(prev[1], 'x')} in {prev_version} -> "
+                        f"{_fmt(stats[1], 'x')} in {version}"
+                    )
+            previous = (version, stats)
+
+    lines += ["", "Regressions between versions"]
+    lines += regressions or ["  None"]
+    return "\n".join(lines)
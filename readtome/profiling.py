@@ -0,0 +1,174 @@
+import contextlib
+import cProfile
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+PROFILE_DIR = Path.home() / ".readtome" / "profiles"
+
+# Utterances whose profiles are kept; older ones are deleted
+_KEEP_SESSIONS = 20
+# Stack sampling period for the collapsed-stack (flamegraph) output
+_SAMPLE_INTERVAL = 0.005
+
+_NULL_STAGE = contextlib.nullcontext()
+
+
+def no_stage(name: str):
+    """Stand-in for ``ProfileSession.stage`` when profiling is off."""
+    return _NULL_STAGE
+
+
+class ProfileSession:
+    """Profiles of one utterance, split by pipeline stage.
+
+    Each stage gets its own cProfile profiler. Stages may nest (playback
+    feed wraps inference, for example); only the innermost stage's profiler
+    runs, so time is attributed to exactly one stage. A sampling thread
+    also records the profiled thread's Python stack, tagged with the
+    current stage, for flamegraphs.
+    """
+
+    def __init__(self):
+        self._profiles: dict[str, cProfile.Profile] = {}
+        self._wall: Counter = Counter()
+        self._stack: list[str] = []
+        self._thread_id: int | None = None
+        self._samples: Counter = Counter()
+        self._sampling = threading.Event()
+        self._sampler: threading.Thread | None = None
+        self.started = time.time()
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        if self._stack:
+            self._profiles[self._stack[-1]].disable()
+        else:
+            self._start_sampling()
+        profile = self._profiles.setdefault(name, cProfile.Profile())
+        self._stack.append(name)
+        t0 = time.perf_counter()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            self._wall[name] += time.perf_counter() - t0
+            self._stack.pop()
+            if self._stack:
+                self._profiles[self._stack[-1]].enable()
+            else:
+                self._stop_sampling()
+
+    def _start_sampling(self):
+        self._thread_id = threading.get_ident()
+        self._sampling.set()
+        self._sampler = threading.Thread(target=self._sample_loop, daemon=True)
+        self._sampler.start()
+
+    def _stop_sampling(self):
+        self._sampling.clear()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+    def _sample_loop(self):
+        while self._sampling.is_set():
+            frame = sys._current_frames().get(self._thread_id)
+            stack = list(self._stack)
+            if frame is not None and stack:
+                names = []
+                while frame is not None:
+                    code = frame.f_code
+                    names.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                self._samples[";".join([stack[-1]] + names[::-1])] += 1
+            time.sleep(_SAMPLE_INTERVAL)
+
+    def stage_times(self) -> dict[str, float]:
+        """Wall time per stage, including any stages nested inside it."""
+        return dict(self._wall)
+
+    def save(self, out_dir: Path) -> list[Path]:
+        """Write ``.pstats`` per stage plus one ``.collapsed`` stack file."""
+        out_dir.mkdir(parents=True, exist_ok=True)
+        prefix = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.started))
+        prefix += f"-{int(self.started * 1000) % 1000:03d}"
+        paths = []
+        for name, profile in self._profiles.items():
+            path = out_dir / f"{prefix}-{name}.pstats"
+            profile.dump_stats(str(path))
+            paths.append(path)
+        if self._samples:
+            path = out_dir / f"{prefix}.collapsed"
+            lines = [f"{stack} {count}" for stack, count in self._samples.items()]
+            path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            paths.append(path)
+        return paths
+
+
+class Profiler:
+    """Hands out per-utterance profile sessions while profiling is enabled.
+
+    Only one session is active at a time; an utterance that starts while
+    another is being profiled (e.g. an interrupt) is not profiled. When
+    disabled nothing is created, so the pipeline pays only for a no-op
+    context manager per stage.
+    """
+
+    def __init__(self, out_dir: Path = PROFILE_DIR, enabled: bool = False):
+        self._out_dir = out_dir
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._active: ProfileSession | None = None
+        self._pending: ProfileSession | None = None
+
+    def begin(self) -> ProfileSession | None:
+        """Start profiling a new utterance (at text capture)."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            if self._active is not None:
+                return None
+            self._active = self._pending = ProfileSession()
+            return self._active
+
+    def take_pending(self) -> ProfileSession | None:
+        """Claim the session begun at capture for the speaking thread."""
+        with self._lock:
+            session, self._pending = self._pending, None
+            return session
+
+    def discard(self, session: ProfileSession | None):
+        with self._lock:
+            if session is not None and session is self._active:
+                self._active = None
+                self._pending = None
+
+    def finish(self, session: ProfileSession | None):
+        """Write a finished session's files and rotate old ones."""
+        if session is None:
+            return
+        try:
+            paths = session.save(self._out_dir)
+            times = ", ".join(f"{k} {v:.3f}s" for k, v in session.stage_times().items())
+            logger.info("Profile written (%s): %s", times, paths[0].parent if paths else "-")
+            self._rotate()
+        except OSError as e:
+            logger.error("Failed to write profile: %s", e)
+        finally:
+            self.discard(session)
+
+    def _rotate(self):
+        """Keep only the newest _KEEP_SESSIONS utterances' files."""
+        files = sorted(self._out_dir.glob("*.pstats")) + sorted(self._out_dir.glob("*.collapsed"))
+        # Files of one session share the "YYYYmmdd-HHMMSS-mmm" prefix
+        sessions = sorted({f.name[:19] for f in files})
+        for old in sessions[:-_KEEP_SESSIONS]:
+            for f in self._out_dir.glob(f"{old}*"):
+                f.unlink(missing_ok=True)
@@ -0,0 +1,181 @@
+import json
+import logging
+import multiprocessing
+import time
+from pathlib import Path
+
+import numpy as np
+
+from readtome.config import Config
+from readtome.memstats import get_peak_rss, get_rss
+
+logger = logging.getLogger(__name__)
+
+# Sentences synthesized by both variants for the quality/RTF report
+_REPORT_SENTENCES = [
+    "The quick brown fox jumps over the lazy dog.",
+    "Highlight text anywhere on your screen, press a keyboard shortcut, "
+    "and hear it spoken back to you.",
+    "No internet connection is required, because the neural voice runs "
+    "entirely on this machine, even on small virtual machines.",
+]
+
+
+def quantize_voice(model_path: str | Path) -> Path:
+    """Write an int8 copy of a Piper voice next to the original.
+
+    Uses ONNX Runtime dynamic quantization (int8 weights, activations
+    quantized at run time), which needs no calibration data. The voice's
+    ``.onnx.json`` is copied alongside so Piper can load the variant on
+    its own. Returns the path of the new ``.int8.onnx`` file.
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    model_path = Path(model_path)
+    out_path = Config.quantized_variant(model_path)
+    logger.info("Quantizing %s -> %s", model_path.name, out_path.name)
+    t0 = time.perf_counter()
+    quantize_dynamic(str(model_path), str(out_path), weight_type=QuantType.QInt8)
+    logger.info("Quantized in %.1fs", time.perf_counter() - t0)
+
+    config = json.loads(Path(f"{model_path}.json").read_text(encoding="utf-8"))
+    config["readtome_quantized_from"] = model_path.name
+    Path(f"{out_path}.json").write_text(json.dumps(config, indent=2), encoding="utf-8")
+    return out_path
+
+
+def _probe(model_path: str, sentences: list[str]) -> dict:
+    """Load a voice and synthesize the report sentences (run in a subprocess)."""
+    from piper.config import SynthesisConfig
+    from piper.voice import PiperVoice
+
+    rss_before = get_rss()
+    t0 = time.perf_counter()
+    voice = PiperVoice.load(model_path)
+    load_seconds = time.perf_counter() - t0
+    rss_loaded = get_rss()
+
+    # No sampling noise, so fp32 and int8 output can be compared directly
+    syn_config = SynthesisConfig(noise_scale=0.0, noise_w_scale=0.0)
+    for _ in voice.synthesize(sentences[0], syn_config=syn_config):
+        pass  # Warm-up
+
+    audio = []
+    t0 = time.perf_counter()
+    for sentence in sentences:
+        chunks = [c.audio_float_array for c in voice.synthesize(sentence, syn_config=syn_config)]
+        audio.append(np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.float32))
+    synth_seconds = time.perf_counter() - t0
+    sr = voice.config.sample_rate
+    audio_seconds = sum(len(a) for a in audio) / sr
+
+    return {
+        "file": Path(model_path).name,
+        "file_mb": round(Path(model_path).stat().st_size / 1e6, 1),
+        "load_seconds": round(load_seconds, 3),
+        "rss_model_mb": round((rss_loaded - rss_before) / 1e6, 1),
+        "peak_rss_mb": round(get_peak_rss() / 1e6, 1),
+        "rtf": round(audio_seconds / synth_seconds, 2) if synth_seconds else 0.0,
+        "sample_rate": sr,
+        "audio": audio,
+    }
+
+
+def _spectral_distance_db(a: np.ndarray, b: np.ndarray) -> float:
+    """Mean absolute log-magnitude difference between two signals, in dB."""
+    n = min(len(a), len(b))
+    frame, hop = 1024, 256
+    if n < frame:
+        return 0.0
+
+    def spectrogram(x):
+        frames = np.lib.stride_tricks.sliding_window_view(x[:n], frame)[::hop]
+        mag = np.abs(np.fft.rfft(frames * np.hanning(frame), axis=1))
+        return 20 * np.log10(mag + 1e-5)
+
+    return float(np.mean(np.abs(spectrogram(a) - spectrogram(b))))
+
+
+def compare_variants(model_path: str | Path) -> dict:
+    """Benchmark a voice against its int8 variant and write a report.
+
+    Each variant is measured in a fresh process so load time and RSS are
+    not skewed by the other. The report lands next to the int8 model as
+    ``<name>.int8.report.json`` and is also returned.
+    """
+    model_path = Path(model_path)
+    variant = Config.quantized_variant(model_path)
+    ctx = multiprocessing.get_context("spawn")
+    results = {}
+    for label, path in (("fp32", model_path), ("int8", variant)):
+        with ctx.Pool(1) as pool:
+            results[label] = pool.apply(_probe, (str(path), _REPORT_SENTENCES))
+
+    fp32_audio = results["fp32"].pop("audio")
+    int8_audio = results["int8"].pop("audio")
+    duration_ratio = sum(map(len, int8_audio)) / max(1, sum(map(len, fp32_audio)))
+    report = {
+        "model": model_path.name,
+        "fp32": results["fp32"],
+        "int8": results["int8"],
+        "quality": {
+            "spectral_distance_db": round(float(np.mean([
+                _spectral_distance_db(a, b) for a, b in zip(fp32_audio, int8_audio)
+            ])), 2),
+            "duration_ratio": round(duration_ratio, 3),
+        },
+    }
+    report_path = variant.with_name(variant.name.removesuffix(".onnx") + ".report.json")
+    report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    logger.info("Wrote quantization report to %s", report_path)
+    return report
+
+
+def format_report(report: dict) -> str:
+    fp32, int8 = report["fp32"], report["int8"]
+    rows = [
+        ("File size (MB)", "file_mb"),
+        ("Load time (s)", "load_seconds"),
+        ("Model RSS (MB)", "rss_model_mb"),
+        ("Peak RSS (MB)", "peak_rss_mb"),
+        ("Speed (x realtime)", "rtf"),
+    ]
+    lines = [f"{report['model']}", f"  {'':20} {'fp32':>10} {'int8':>10}"]
+    for label, key in rows:
+        lines.append(f"  {label:20} {fp32[key]:>10} {int8[key]:>10}")
+    quality = report["quality"]
+    lines.append(
+        f"  Spectral distance {quality['spectral_distance_db']} dB, "
+        f"duration ratio {quality['duration_ratio']}"
+    )
+    return "\n".join(lines)
+
+
+def run(model_paths: list[str], report: bool = True) -> int:
+    """Entry point for ``readtome quantize``. Returns a process exit code."""
+    if not model_paths:
+        config = Config.load()
+        config.resolve_model_paths(Config.get_base_dir())
+        model_paths = [config.model_path]
+
+    failed = []
+    for model_path in model_paths:
+        try:
+            out_path = quantize_voice(model_path)
+        except Exception as e:
+            logger.error("Failed to quantize %s: %s", model_path, e)
+            failed.append(model_path)
+            continue
+        print(f"Wrote {out_path}")
+        if report:
+            # The int8 model is already written, so a failed comparison
+            # only loses the report
+            try:
+                print(format_report(compare_variants(model_path)))
+            except Exception as e:
+                logger.error("Failed to compare %s with its int8 variant: %s", model_path, e)
+                failed.append(model_path)
+    if failed:
+        logger.error("%d of %d voices failed: %s", len(failed), len(model_paths), ", ".join(map(str, failed)))
+        return 1
+    return 0
@@ -0,0 +1,141 @@
+import functools
+from fractions import Fraction
+
+import numpy as np
+
+# Filter half-width in input samples at unity ratio; 16 zero crossings each
+# side keeps aliasing and passband ripple well below what int16 can show
+_HALF_TAPS = 16
+_KAISER_BETA = 8.6
+# Passband edge as a fraction of the lower of the two Nyquist frequencies
+_CUTOFF = 0.95
+# Filter phases tabulated per input sample. The ratio itself is kept
+# exact; an output falling between two phases blends their taps, which is
+# accurate to about -100 dB at this spacing
+_PHASES = 512
+# Source rates are taken as fractions with at most this denominator (voice
+# rate x pitch is exact for every preset)
+_MAX_RATE_DENOMINATOR = 1000
+# Output samples computed per vectorized step
+_SLICE = 2048
+
+
+@functools.lru_cache(maxsize=16)
+def _filter_bank(bandwidth: float) -> tuple[np.ndarray, np.ndarray, int]:
+    """Polyphase windowed-sinc filters passing ``bandwidth`` of the input band.
+
+    ``bandwidth`` is output rate / input rate when decimating and 1
+    otherwise. Row ``p`` holds the taps for an output sample that falls
+    ``p / _PHASES`` of the way between two input samples (row _PHASES is
+    the next input sample). Returns ``(bank, slopes, width)``: ``slopes``
+    is the difference of each row to the next, and ``width`` the number of
+    input samples each output sample reads.
+    """
+    scale = bandwidth * _CUTOFF  # Lower the cutoff when decimating
+    half = int(np.ceil(_HALF_TAPS / bandwidth))
+    offsets = np.arange(-half + 1, half + 1)  # Input samples around the output time
+    phases = np.arange(_PHASES + 1)[:, None] / _PHASES
+    t = phases - offsets[None, :]
+    window = np.i0(_KAISER_BETA * np.sqrt(np.clip(1 - (t / half) ** 2, 0, None))) / np.i0(_KAISER_BETA)
+    bank = scale * np.sinc(scale * t) * window
+    # Normalize each phase to unity DC gain so there is no ripple at its rate
+    bank /= bank.sum(axis=1, keepdims=True)
+    return bank[:-1].astype(np.float32), np.diff(bank, axis=0).astype(np.float32), 2 * half
+
+
+class Resampler:
+    """Streaming polyphase resampler from any rate to a fixed output rate.
+
+    Pitch is applied by treating the voice's audio as if it were recorded
+    at ``voice rate * pitch`` and resampling that to the output rate, which
+    is what playing it at the changed rate used to do - without reopening
+    the output stream. ``process()`` takes int16 blocks of any length and
+    returns the output that is complete so far, keeping filter history
+    between calls so block boundaries are seamless; ``flush()`` returns the
+    rest at the end of the stream. ``retuned()`` switches to another source
+    rate mid-stream, keeping that history.
+    """
+
+    def __init__(self, src_rate: float, dst_rate: int):
+        self.src_rate = src_rate
+        self.dst_rate = dst_rate
+        # Output samples step through the input in exact 1/up units
+        ratio = Fraction(src_rate).limit_denominator(_MAX_RATE_DENOMINATOR) / dst_rate
+        self._up, self._down = ratio.denominator, ratio.numerator
+        self._bank, self._slopes, self._width = _filter_bank(
+            round(min(1.0, dst_rate / src_rate), 4),
+        )
+        self._taps = np.arange(self._width)
+        # Input not yet fully consumed, starting with the history of zeros
+        # in front of the first sample
+        self._buf = np.zeros(self._ref, dtype=np.float32)
+        # Time of the next output sample, in 1/up input samples, relative
+        # to the input sample at _buf[_ref]
+        self._t = 0
+
+    @property
+    def _ref(self) -> int:
+        return self._width // 2 - 1
+
+    @property
+    def actual_src_rate(self) -> float:
+        """The source rate the ratio was taken from (exact for any preset)."""
+        return self.dst_rate * self._down / self._up
+
+    def retuned(self, src_rate: float) -> "Resampler":
+        """A resampler at ``src_rate`` that carries on where this one is.
+
+        The input not yet consumed, filter history included, and the
+        position between input samples move over, so changing pitch
+        mid-stream leaves no gap or dip.
+        """
+        new = Resampler(src_rate, self.dst_rate)
+        # Line the history up on the same reference sample; a wider filter
+        # sees zeros beyond what this one kept
+        shift = new._ref - self._ref
+        if shift >= 0:
+            new._buf = np.concatenate((np.zeros(shift, dtype=np.float32), self._buf))
+        else:
+            new._buf = self._buf[-shift:]
+        new._t = self._t * new._up // self._up
+        return new
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        self._buf = np.concatenate((self._buf, samples.astype(np.float32)))
+        return self._run()
+
+    def flush(self) -> np.ndarray:
+        """Remaining output, padded with the filter's trailing context."""
+        # Only output samples that fall before the end of the real input
+        end = (len(self._buf) - self._ref) * self._up
+        keep = max(0, -(-(end - self._t) // self._down))
+        self._buf = np.concatenate((self._buf, np.zeros(self._width, dtype=np.float32)))
+        return self._run()[:keep]
+
+    def _run(self) -> np.ndarray:
+        up, down = self._up, self._down
+        # Output n reads _buf[idx : idx + width] with idx = (t + n*down) // up
+        limit = (len(self._buf) - self._width + 1) * up - self._t
+        count = max(0, -(-limit // down))
+        if count == 0:
+            return np.zeros(0, dtype=np.int16)
+        times = self._t + np.arange(count, dtype=np.int64) * down
+        index, offset = np.divmod(times, up)
+        # Between tabulated phases phase and phase + 1, weight of the second
+        phase, rest = np.divmod(offset * _PHASES, up)
+        weight = (rest / up).astype(np.float32)
+        out = np.empty(count, dtype=np.float32)
+        # In slices, so the (outputs x taps) gather stays in cache
+        for i in range(0, count, _SLICE):
+            frames = self._buf[index[i:i + _SLICE, None] + self._taps]
+            rows = phase[i:i + _SLICE]
+            out[i:i + _SLICE] = (
+                np.einsum("ij,ij->i", frames, self._bank[rows])
+                + weight[i:i + _SLICE] * np.einsum("ij,ij->i", frames, self._slopes[rows])
+            )
+
+        self._t += count * down
+        consumed = self._t // up
+        self._buf = self._buf[consumed:]
+        self._t -= consumed * up
+        return np.clip(np.rint(out), -32768, 32767).astype(np.int16)
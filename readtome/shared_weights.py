@@ -0,0 +1,115 @@
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from readtome.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Weights are laid out at multiples of this in the data file. ONNX Runtime
+# maps external data straight from the file (instead of reading it into
+# private memory) only when a tensor's offset is a multiple of the
+# allocation granularity: 64 KB on Windows, a multiple of the page size on
+# Linux and macOS.
+_ALIGNMENT = 64 * 1024
+# Smaller initializers (shapes, scalars) stay inside the graph
+_MIN_EXTERNAL_BYTES = 16 * 1024
+
+
+def _optimize(model_path: Path, out_path: Path):
+    """Save ONNX Runtime's optimized graph, so loading needs no rewriting.
+
+    Graph optimizations fold and fuse initializers into new private
+    tensors; doing them once here lets instances load the shared file with
+    optimization off and use its weights as they are on disk.
+    """
+    import onnxruntime
+
+    options = onnxruntime.SessionOptions()
+    # EXTENDED (not ALL) keeps the saved graph portable across CPUs
+    options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+    options.optimized_model_filepath = str(out_path)
+    onnxruntime.InferenceSession(
+        str(model_path), sess_options=options, providers=["CPUExecutionProvider"],
+    )
+
+
+def share_voice(model_path: str | Path) -> Path:
+    """Write a shared-weights copy of a Piper voice next to the original.
+
+    The copy is the optimized graph (``<voice>.shared.onnx``) with its
+    large weights moved to ``<voice>.shared.onnx.data``, each at an
+    aligned offset. Instances loading it with ``shared_weights`` map the
+    data file read-only, so the operating system keeps one copy of the
+    weights in memory for every user on the machine. Returns the path of
+    the new ``.shared.onnx`` file.
+    """
+    import onnx
+    from onnx import numpy_helper
+
+    model_path = Path(model_path)
+    out_path = Config.shared_variant(model_path)
+    data_path = Path(f"{out_path}.data")
+    logger.info("Sharing weights of %s -> %s", model_path.name, out_path.name)
+    t0 = time.perf_counter()
+
+    with tempfile.TemporaryDirectory(dir=out_path.parent) as tmp:
+        optimized = Path(tmp) / "optimized.onnx"
+        _optimize(model_path, optimized)
+        model = onnx.load(str(optimized))
+
+        tmp_data = Path(tmp) / data_path.name
+        external = 0
+        with open(tmp_data, "wb") as f:
+            for tensor in model.graph.initializer:
+                array = numpy_helper.to_array(tensor)
+                if array.nbytes < _MIN_EXTERNAL_BYTES:
+                    continue
+                offset = -(-f.tell() // _ALIGNMENT) * _ALIGNMENT
+                f.write(b"\0" * (offset - f.tell()))
+                f.write(array.tobytes())
+                # Replace typed or raw data with a reference into the file
+                tensor.CopyFrom(numpy_helper.from_array(array, tensor.name))
+                tensor.ClearField("raw_data")
+                tensor.data_location = onnx.TensorProto.EXTERNAL
+                for key, value in (
+                    ("location", data_path.name),
+                    ("offset", str(offset)),
+                    ("length", str(array.nbytes)),
+                ):
+                    entry = tensor.external_data.add()
+                    entry.key, entry.value = key, value
+                external += array.nbytes
+
+        tmp_model = Path(tmp) / out_path.name
+        onnx.save(model, str(tmp_model))
+        # Data first: a graph is never left pointing at the wrong data file.
+        # Running instances keep the files they mapped (Linux); on Windows
+        # a mapped file can't be replaced until they exit.
+        os.replace(tmp_data, data_path)
+        os.replace(tmp_model, out_path)
+
+    logger.info(
+        "Moved %.1f MB of weights to %s in %.1fs",
+        external / 1e6, data_path.name, time.perf_counter() - t0,
+    )
+    return out_path
+
+
+def run(model_paths: list[str]) -> int:
+    """Entry point for ``readtome share-weights``. Returns a process exit code."""
+    if not model_paths:
+        config = Config.load()
+        config.resolve_model_paths(Config.get_base_dir())
+        model_paths = [config.model_file_for(config.model_path)]
+
+    for model_path in model_paths:
+        try:
+            out_path = share_voice(model_path)
+        except Exception as e:
+            logger.error("Failed to share weights of %s: %s", model_path, e)
+            return 1
+        print(f"Wrote {out_path}")
+    return 0
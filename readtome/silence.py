@@ -0,0 +1,131 @@
+from typing import Iterator
+
+import numpy as np
+
+# Energy is measured over 10 ms frames; anything quieter than this many dB
+# below the chunk's peak frame counts as silence.
+_FRAME_SECONDS = 0.010
+_THRESHOLD_DB = -40.0
+
+# Audio kept in front of the first voiced frame so onsets aren't clipped.
+_LEAD_PAD_SECONDS = 0.010
+
+
+def trim_silence(
+    samples: np.ndarray,
+    sample_rate: int,
+    gap_ms: int,
+    max_pause_ms: int = 0,
+    lead: bool = True,
+    tail: bool = True,
+) -> tuple[np.ndarray, int]:
+    """Trim a chunk's edge silence and optionally clamp long inner pauses.
+
+    Leading silence is cut down to a few milliseconds and trailing silence
+    to ``gap_ms``, which becomes the pause heard between sentences. If
+    ``max_pause_ms`` is non-zero, silent runs inside the chunk are shortened
+    to that length. ``lead`` / ``tail`` set to False leave that edge alone,
+    for chunks that start or end in the middle of a sentence. A chunk with
+    no sound at all is cut to the ``gap_ms`` pause alone. Returns
+    ``(trimmed_samples, samples_removed)``.
+    """
+    frame = max(1, int(sample_rate * _FRAME_SECONDS))
+    n_frames = len(samples) // frame
+    if n_frames == 0:
+        return samples, 0
+
+    # Per-frame energy in one pass over a (n_frames, frame) view
+    framed = samples[:n_frames * frame].reshape(n_frames, frame).astype(np.float32)
+    energy = np.einsum("ij,ij->i", framed, framed) / frame
+    keep = _keep_frames(energy, gap_ms, max_pause_ms, lead, tail)
+
+    # Keep whole frames, plus the partial frame at the end if still inside
+    sample_keep = np.repeat(keep, frame)
+    if keep[-1]:
+        sample_keep = np.concatenate([
+            sample_keep, np.ones(len(samples) - len(sample_keep), dtype=bool),
+        ])
+        trimmed = samples[sample_keep]
+    else:
+        trimmed = samples[:len(sample_keep)][sample_keep]
+    return trimmed, len(samples) - len(trimmed)
+
+
+def trim_silence_blocks(
+    read_blocks,
+    sample_rate: int,
+    gap_ms: int,
+    max_pause_ms: int = 0,
+    lead: bool = True,
+    tail: bool = True,
+) -> tuple[Iterator[np.ndarray], int]:
+    """trim_silence() for audio that is read block by block, like an AudioStore.
+
+    ``read_blocks`` returns a fresh iterator of blocks each time it is
+    called (``AudioStore.blocks``). It is read twice: once to measure the
+    frames, then again as the trimmed blocks are consumed, so the audio is
+    never held whole. Returns ``(trimmed_blocks, samples_removed)``.
+    """
+    frame = max(1, int(sample_rate * _FRAME_SECONDS))
+    energies = []
+    carry = np.zeros(0, dtype=np.float32)
+    length = 0
+    for block in read_blocks():
+        length += len(block)
+        # Frames may straddle blocks; the remainder waits for the next one
+        samples = np.concatenate((carry, block.astype(np.float32)))
+        n = len(samples) // frame
+        framed = samples[:n * frame].reshape(n, frame)
+        energies.append(np.einsum("ij,ij->i", framed, framed) / frame)
+        carry = samples[n * frame:]
+    energy = np.concatenate(energies) if energies else np.zeros(0, dtype=np.float32)
+    if len(energy) == 0:
+        return read_blocks(), 0
+
+    keep = _keep_frames(energy, gap_ms, max_pause_ms, lead, tail)
+    # The partial frame at the end goes with the last whole frame
+    kept = int(keep.sum()) * frame + (len(carry) if keep[-1] else 0)
+
+    def trimmed():
+        pos = 0
+        for block in read_blocks():
+            frames = np.minimum(np.arange(pos, pos + len(block)) // frame, len(keep) - 1)
+            pos += len(block)
+            yield block[keep[frames]]
+
+    return trimmed(), length - kept
+
+
+def _keep_frames(
+    energy: np.ndarray, gap_ms: int, max_pause_ms: int, lead: bool, tail: bool,
+) -> np.ndarray:
+    """Which frames to keep, given each frame's mean energy."""
+    n_frames = len(energy)
+    tail_pad = int(gap_ms / 1000 / _FRAME_SECONDS)
+    peak = energy.max()
+    if peak <= 0:
+        # Nothing voiced: still keep the pause the chunk would have ended in
+        keep = np.zeros(n_frames, dtype=bool)
+        keep[:tail_pad if tail else n_frames] = True
+        return keep
+    voiced = energy > peak * 10 ** (_THRESHOLD_DB / 10)
+
+    voiced_idx = np.flatnonzero(voiced)
+    first, last = voiced_idx[0], voiced_idx[-1]
+    lead_pad = int(_LEAD_PAD_SECONDS / _FRAME_SECONDS)
+    start_frame = max(0, first - lead_pad) if lead else 0
+    end_frame = min(n_frames, last + 1 + tail_pad) if tail else n_frames
+
+    keep = np.zeros(n_frames, dtype=bool)
+    keep[start_frame:end_frame] = True
+
+    if max_pause_ms > 0:
+        max_run = max(1, int(max_pause_ms / 1000 / _FRAME_SECONDS))
+        inner = ~voiced[first:last + 1]
+        # Position of each silent frame within its run of silent frames
+        run_start = np.maximum.accumulate(
+            np.where(inner, 0, np.arange(len(inner)) + 1)
+        )
+        pos_in_run = np.arange(len(inner)) - run_start + 1
+        keep[first:last + 1] &= ~(inner & (pos_in_run > max_run))
+    return keep
@@ -0,0 +1,209 @@
+import abc
+import logging
+import threading
+import time
+import wave
+from pathlib import Path
+
+import numpy as np
+
+from readtome.config import SINK_NAMES
+
+logger = logging.getLogger(__name__)
+
+
+class AudioSink(abc.ABC):
+    """Destination for int16 mono audio written by AudioPlayer.
+
+    A sink is opened once per utterance, receives blocks through
+    ``write()`` (which may block to pace the caller, like a sound card
+    buffer), and is then either drained or aborted and closed. A sink with
+    a ``native_rate`` is always opened at that rate; AudioPlayer resamples
+    to it.
+    """
+
+    # Rate the output works best at (e.g. the sound card's mixing rate);
+    # None to accept whatever rate the audio comes in
+    native_rate: int | None = None
+
+    @abc.abstractmethod
+    def open(self, sample_rate: int):
+        """Start a stream at ``sample_rate`` for the next utterance."""
+
+    @abc.abstractmethod
+    def write(self, samples: np.ndarray):
+        """Queue int16 samples for output."""
+
+    def drain(self):
+        """Block until everything written so far has been played."""
+
+    def abort(self):
+        """Discard anything written but not yet played."""
+
+    def close(self):
+        pass
+
+    def release(self):
+        """Free anything ``close()`` kept for reuse (the sink is being replaced)."""
+
+
+class SoundDeviceSink(AudioSink):
+    """Plays through the default output device via sounddevice.
+
+    Audio is played at the device's default rate, and the stream is kept
+    open (stopped) between utterances, so starting to speak doesn't reopen
+    the device and the host never has to resample.
+    """
+
+    def __init__(self):
+        import sounddevice as sd
+
+        self._sd = sd
+        self._stream = None
+        try:
+            device = sd.query_devices(kind="output")
+            self.native_rate = int(device["default_samplerate"])
+        except Exception as e:
+            logger.warning("Could not query the output device's sample rate: %s", e)
+            self.native_rate = None
+
+    def open(self, sample_rate: int):
+        if self._stream is not None and self._stream.samplerate != sample_rate:
+            self.release()
+        if self._stream is None:
+            self._stream = self._sd.OutputStream(
+                samplerate=sample_rate, channels=1, dtype="int16",
+            )
+            logger.debug("Opened output stream at %d Hz", sample_rate)
+        if not self._stream.active:
+            self._stream.start()
+
+    def write(self, samples: np.ndarray):
+        self._stream.write(samples.reshape(-1, 1))
+
+    def drain(self):
+        self._stream.stop()
+
+    def abort(self):
+        self._stream.abort()
+
+    def close(self):
+        # Drained or aborted, i.e. stopped; kept open for the next utterance
+        pass
+
+    def release(self):
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+
+class WavFileSink(AudioSink):
+    """Writes each opened stream to its own numbered WAV file."""
+
+    def __init__(self, out_dir: str | Path):
+        self._out_dir = Path(out_dir)
+        self._out_dir.mkdir(parents=True, exist_ok=True)
+        self._count = 0
+        self._wav: wave.Wave_write | None = None
+
+    def open(self, sample_rate: int):
+        self._count += 1
+        path = self._out_dir / f"utterance-{self._count:04d}.wav"
+        self._wav = wave.open(str(path), "wb")
+        self._wav.setnchannels(1)
+        self._wav.setsampwidth(2)
+        self._wav.setframerate(sample_rate)
+        logger.debug("Writing audio to %s", path)
+
+    def write(self, samples: np.ndarray):
+        self._wav.writeframes(samples.tobytes())
+
+    def close(self):
+        if self._wav is not None:
+            self._wav.close()
+            self._wav = None
+
+
+class NullSink(AudioSink):
+    """Discards audio, optionally consuming it at real-time pace.
+
+    In real-time mode ``write()`` blocks the way a sound card would, letting
+    the caller run at most ``buffer_seconds`` ahead of "playback".
+    """
+
+    def __init__(self, realtime: bool = True, buffer_seconds: float = 0.1):
+        self._realtime = realtime
+        self._buffer_seconds = buffer_seconds
+        self._sample_rate = 0
+        self._t_start = 0.0
+        self._written = 0
+        self._aborted = threading.Event()
+
+    def open(self, sample_rate: int):
+        self._sample_rate = sample_rate
+        self._t_start = time.perf_counter()
+        self._written = 0
+        self._aborted.clear()
+
+    def write(self, samples: np.ndarray):
+        self._written += len(samples)
+        if self._realtime:
+            self._wait_until(self._written / self._sample_rate - self._buffer_seconds)
+
+    def drain(self):
+        if self._realtime:
+            self._wait_until(self._written / self._sample_rate)
+
+    def abort(self):
+        self._aborted.set()
+
+    def _wait_until(self, audio_time: float):
+        delay = self._t_start + audio_time - time.perf_counter()
+        if delay > 0:
+            self._aborted.wait(delay)
+
+
+class CaptureSink(AudioSink):
+    """Keeps everything written in memory, one array per opened stream.
+
+    Each entry in ``streams`` is ``(sample_rate, samples, t_first_write)``,
+    where the timestamp is ``time.perf_counter()`` at the first write.
+    Nothing is ever released, so it is for tests and benchmarks only and
+    can't be picked as the app's ``audio_sink``.
+    """
+
+    def __init__(self):
+        self.streams: list[tuple[int, np.ndarray, float | None]] = []
+        self._blocks: list[np.ndarray] = []
+        self._sample_rate = 0
+        self._t_first: float | None = None
+
+    def open(self, sample_rate: int):
+        self._sample_rate = sample_rate
+        self._blocks = []
+        self._t_first = None
+
+    def write(self, samples: np.ndarray):
+        if self._t_first is None:
+            self._t_first = time.perf_counter()
+        self._blocks.append(samples.copy())
+
+    def close(self):
+        if self._sample_rate:
+            audio = (np.concatenate(self._blocks) if self._blocks
+                     else np.zeros(0, dtype=np.int16))
+            self.streams.append((self._sample_rate, audio, self._t_first))
+            self._sample_rate = 0
+
+
+def create_sink(name: str, path: str = "") -> AudioSink:
+    """Build a sink from its config/CLI name."""
+    if name == "sounddevice":
+        return SoundDeviceSink()
+    if name == "wav":
+        return WavFileSink(path or Path.home() / ".readtome" / "audio")
+    if name == "null":
+        return NullSink(realtime=True)
+    if name == "null-fast":
+        return NullSink(realtime=False)
+    raise ValueError(f"Unknown audio sink: {name!r} (expected one of {', '.join(SINK_NAMES)})")
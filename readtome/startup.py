@@ -0,0 +1,134 @@
+import builtins
+import logging
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Milestones of a normal start, in the order they are reported
+MILESTONES = ("hotkey", "tray", "ready")
+
+_LABELS = {
+    "hotkey": "time-to-hotkey-registered",
+    "tray": "time-to-tray",
+    "ready": "time-to-ready",
+}
+
+# Imports below this are left out of the breakdown
+_MIN_IMPORT_SECONDS = 0.002
+# A start that hasn't reached every milestone by then is reported as it is
+_TIMEOUT_SECONDS = 120.0
+
+
+class StartupTimer:
+    """Time-to-tray / time-to-hotkey / time-to-ready, plus where imports went.
+
+    Times are measured from ``t0`` (taken as early as possible in
+    ``__main__``). With ``track_imports`` every first import of a module
+    that is not itself nested in another first import is timed, so the
+    breakdown sums to the wall time spent importing on each thread. Once
+    all milestones are in, the report is printed and logged and the import
+    hook removed. If a start fails, ``finish()`` (or the timeout) does the
+    same with the milestones reached so far.
+    """
+
+    def __init__(self, t0: float, track_imports: bool = False):
+        self._t0 = t0
+        self._lock = threading.Lock()
+        self._marks: dict[str, float] = {}
+        self._imports: dict[str, float] = {}
+        self._local = threading.local()
+        self._import = None
+        self._finished = False
+        self._reason = None
+        if track_imports:
+            self._import = builtins.__import__
+            builtins.__import__ = self._timed_import
+        self._timeout = threading.Timer(
+            _TIMEOUT_SECONDS, self.finish, args=(f"not ready after {_TIMEOUT_SECONDS:.0f}s",),
+        )
+        self._timeout.daemon = True
+        self._timeout.start()
+
+    def mark(self, name: str):
+        """Record a milestone (the first time only)."""
+        with self._lock:
+            if name in self._marks:
+                return
+            self._marks[name] = time.perf_counter() - self._t0
+            done = all(m in self._marks for m in MILESTONES)
+        if done:
+            self.finish()
+
+    def finish(self, reason: str | None = None):
+        """Remove the import hook and print the report (the first time only).
+
+        ``reason`` says why a start ended before every milestone was in.
+        """
+        with self._lock:
+            if self._finished:
+                return
+            self._finished = True
+            self._reason = reason
+            if self._import is not None:
+                builtins.__import__ = self._import
+                self._import = None
+        self._timeout.cancel()
+        report = self.report()
+        logger.info("%s", report)
+        print(report, flush=True)
+
+    def report(self) -> str:
+        with self._lock:
+            marks = dict(self._marks)
+            imports = sorted(self._imports.items(), key=lambda kv: kv[1], reverse=True)
+            reason = self._reason
+        lines = ["Startup report (ms since launch)"]
+        if reason:
+            lines[0] += f" - incomplete: {reason}"
+        for name in MILESTONES:
+            if name in marks:
+                lines.append(f"  {_LABELS[name]:28} {marks[name] * 1000:8.0f}")
+            elif reason:
+                lines.append(f"  {_LABELS[name]:28} {'-':>8}")
+        if imports:
+            lines.append("Imports (ms, all threads)")
+            shown = [(m, s) for m, s in imports if s >= _MIN_IMPORT_SECONDS]
+            for module, seconds in shown:
+                lines.append(f"  {module:28} {seconds * 1000:8.1f}")
+            rest = sum(s for _, s in imports) - sum(s for _, s in shown)
+            if rest > 0:
+                lines.append(f"  {'(other)':28} {rest * 1000:8.1f}")
+            lines.append(f"  {'total':28} {sum(s for _, s in imports) * 1000:8.1f}")
+        return "\n".join(lines)
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._import
+        # Only the outermost first-time import on this thread is timed;
+        # relative imports and modules already loaded go straight through
+        if original is None or level or name in sys.modules or getattr(self._local, "busy", False):
+            return (original or builtins.__import__)(name, globals, locals, fromlist, level)
+        self._local.busy = True
+        t = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - t
+            self._local.busy = False
+            # Our own modules by full name, third-party ones by package
+            key = name if name.startswith("readtome.") else name.partition(".")[0]
+            with self._lock:
+                self._imports[key] = self._imports.get(key, 0.0) + elapsed
+
+
+class _NullStartupTimer:
+    def mark(self, name: str):
+        pass
+
+    def finish(self, reason: str | None = None):
+        pass
+
+
+# Used when --startup-report is not given
+NO_REPORT = _NullStartupTimer()
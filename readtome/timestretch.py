@@ -0,0 +1,137 @@
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Frame length for WSOLA analysis/synthesis, in seconds. ~40 ms frames with
+# 50% overlap are a good fit for speech: long enough to hold a couple of
+# pitch periods, short enough that transients don't smear.
+_FRAME_SECONDS = 0.040
+
+
+class TimeStretcher:
+    """Streaming WSOLA time-stretcher (changes tempo, keeps pitch).
+
+    Feed int16 blocks through ``process()`` with the current stretch rate;
+    a rate of 2.0 plays twice as fast, 0.5 half as fast. The rate may change
+    on every call, so speed changes take effect on the very next block
+    instead of the next utterance. Call ``flush()`` at the end of a stream
+    to drain the last overlap.
+    """
+
+    def __init__(self, sample_rate: int):
+        self._sample_rate = sample_rate
+        self._hop = max(64, int(sample_rate * _FRAME_SECONDS) // 2)
+        self._frame = self._hop * 2
+        self._tolerance = self._hop // 2
+        # Periodic Hann sums to exactly 1.0 at 50% overlap
+        n = np.arange(self._frame)
+        self._window = (0.5 - 0.5 * np.cos(2 * np.pi * n / self._frame)).astype(np.float32)
+        self.reset()
+
+    def reset(self):
+        """Drop all buffered state (e.g. on interrupt)."""
+        self._buf = np.zeros(0, dtype=np.float32)
+        self._buf_start = 0        # absolute input index of self._buf[0]
+        self._pos = 0.0            # nominal input position of next frame
+        self._prev: int | None = None  # chosen input start of previous frame
+        self._tail = np.zeros(self._hop, dtype=np.float32)
+        self._active = False
+
+    @property
+    def sample_rate(self) -> int:
+        return self._sample_rate
+
+    @property
+    def is_active(self) -> bool:
+        """True once any audio has been stretched (state must be flushed)."""
+        return self._active
+
+    def process(self, samples: np.ndarray, rate: float) -> np.ndarray:
+        """Stretch a block of int16 samples by ``rate``. Returns int16."""
+        if not self._active and abs(rate - 1.0) < 1e-3:
+            # Nothing buffered and no stretch needed: pass straight through
+            return samples
+        self._active = True
+        self._buf = np.concatenate([self._buf, samples.astype(np.float32)])
+        return self._run(rate, final=False)
+
+    def flush(self) -> np.ndarray:
+        """Emit everything still buffered and reset for the next stream."""
+        if not self._active:
+            return np.zeros(0, dtype=np.int16)
+        # Pad so the remaining input is fully covered by frames
+        self._buf = np.concatenate([
+            self._buf, np.zeros(self._frame + self._tolerance * 2, dtype=np.float32),
+        ])
+        out = self._run(1.0, final=True)
+        tail = self._to_int16(self._tail)
+        self.reset()
+        return np.concatenate([out, tail])
+
+    def _run(self, rate: float, final: bool) -> np.ndarray:
+        hop, frame, tol = self._hop, self._frame, self._tolerance
+        analysis_hop = hop * rate
+        buf_end = self._buf_start + len(self._buf)
+        # Input already consumed when flushing: stop once past real samples
+        stop_at = buf_end - frame - tol * 2 if final else None
+        out_blocks = []
+
+        while True:
+            nominal = int(round(self._pos))
+            if self._prev is None:
+                start = nominal
+                if start + frame > buf_end:
+                    break
+            else:
+                lo = max(nominal - tol, self._buf_start)
+                natural = self._prev + hop
+                if lo + frame + 2 * tol > buf_end or natural + frame > buf_end:
+                    break
+                if final and nominal >= stop_at:
+                    break
+                start = lo + self._best_offset(lo - self._buf_start, natural - self._buf_start)
+
+            seg = self._buf[start - self._buf_start:start - self._buf_start + frame]
+            acc = seg * self._window
+            acc[:hop] += self._tail
+            out_blocks.append(acc[:hop])
+            self._tail = acc[hop:].copy()
+            self._prev = start
+            self._pos += analysis_hop
+
+        # Drop input no future frame can reach
+        keep_from = min(int(self._pos) - tol, (self._prev + hop) if self._prev is not None else int(self._pos))
+        drop = max(0, keep_from - self._buf_start)
+        if drop:
+            self._buf = self._buf[drop:]
+            self._buf_start += drop
+
+        if not out_blocks:
+            return np.zeros(0, dtype=np.int16)
+        return self._to_int16(np.concatenate(out_blocks))
+
+    def _best_offset(self, lo: int, natural: int) -> int:
+        """Offset in [0, 2*tol] whose frame best continues the previous one.
+
+        All candidate positions are scored at once with a strided view and a
+        single matrix-vector product (normalized cross-correlation).
+        """
+        hop, tol = self._hop, self._tolerance
+        target = self._buf[natural:natural + hop]
+        region = self._buf[lo:lo + hop + 2 * tol]
+        candidates = np.lib.stride_tricks.sliding_window_view(region, hop)
+        scores = candidates @ target
+        energy = np.sqrt(np.einsum("ij,ij->i", candidates, candidates)) + 1e-6
+        return int(np.argmax(scores / energy))
+
+    @staticmethod
+    def _to_int16(samples: np.ndarray) -> np.ndarray:
+        return np.clip(samples, -32768, 32767).astype(np.int16)
+
+
+def iter_blocks(samples: np.ndarray, block_size: int):
+    """Yield consecutive views of ``samples`` at most ``block_size`` long."""
+    for i in range(0, len(samples), block_size):
+        yield samples[i:i + block_size]
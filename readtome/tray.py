@@ -6,6 +6,7 @@ from PIL import Image, ImageDraw, ImageFont
 import pystray
 
 from readtome.config import Config, PITCH_PRESETS, SPEED_PRESETS
+from readtome.voice_index import voice_key
 
 logger = logging.getLogger(__name__)
 
@@ -21,12 +22,18 @@ class TrayIcon:
         on_change_pitch,
         on_toggle_startup,
         on_check_update,
+        on_download_voice,
+        on_refresh_voice_catalog,
+        on_toggle_profiling,
         is_paused,
+        is_profiling,
         get_status,
         get_voices,
         get_current_voice,
         get_current_speed,
         get_current_pitch,
+        get_downloadable_voices,
+        get_voice_label,
     ):
         self._on_quit = on_quit
         self._on_toggle_pause = on_toggle_pause
@@ -36,13 +43,23 @@ class TrayIcon:
         self._on_change_pitch = on_change_pitch
         self._on_toggle_startup = on_toggle_startup
         self._on_check_update = on_check_update
+        self._on_download_voice = on_download_voice
+        self._on_refresh_voice_catalog = on_refresh_voice_catalog
         self._is_paused = is_paused
+        self._on_toggle_profiling = on_toggle_profiling
+        self._is_profiling = is_profiling
         self._get_status = get_status
         self._get_voices = get_voices
         self._get_current_voice = get_current_voice
         self._get_current_speed = get_current_speed
         self._get_current_pitch = get_current_pitch
+        self._get_downloadable_voices = get_downloadable_voices
+        self._get_voice_label = get_voice_label
         self._icon: pystray.Icon | None = None
+        self._title = "ReadToMe TTS"
+        # Built off the main thread once the icon is up: listing downloadable
+        # voices imports the download code and parses the cached catalog
+        self._download_menu: pystray.Menu | None = None
 
     def _create_icon_image(self) -> Image.Image:
         if getattr(sys, "frozen", False):
@@ -75,25 +92,68 @@ class TrayIcon:
             )
 
         items = []
-        for voice_path in voices:
-            name = voice_path.stem
-            path_str = str(voice_path)
+        for voice in voices:
+            name = self._get_voice_label(voice.path)
 
             def make_action(p):
                 return lambda icon, item: self._on_change_voice(p)
 
-            def make_checked(p):
-                return lambda item: Path(self._get_current_voice()).resolve() == Path(p).resolve()
+            def make_checked(key):
+                # Keys are precomputed so each menu render is a string compare
+                return lambda item: self._get_current_voice() == key
 
             items.append(
                 pystray.MenuItem(
                     name,
-                    make_action(path_str),
-                    checked=make_checked(path_str),
+                    make_action(voice.path),
+                    checked=make_checked(voice_key(voice.path)),
                 )
             )
         return pystray.Menu(*items)
 
+    def _build_download_menu(self):
+        """Build submenu of voices that can be downloaded from the catalog."""
+        voices = self._get_downloadable_voices()
+        refresh = pystray.MenuItem(
+            "Refresh Voice List",
+            lambda icon, item: self._on_refresh_voice_catalog(),
+        )
+        if voices is None:
+            return pystray.Menu(
+                pystray.MenuItem(
+                    "Fetch Voice List",
+                    lambda icon, item: self._on_refresh_voice_catalog(),
+                ),
+            )
+        if not voices:
+            return pystray.Menu(
+                pystray.MenuItem("All voices installed", None, enabled=False),
+                pystray.Menu.SEPARATOR,
+                refresh,
+            )
+
+        items = []
+        for voice in voices:
+            size_mb = sum(
+                f.get("size_bytes", 0) for f in voice.get("files", {}).values()
+            ) / 1e6
+            label = f"{voice['key']} ({size_mb:.0f} MB)"
+            if voice.get("downloading"):
+                label += " - downloading..."
+
+            def make_action(k):
+                return lambda icon, item: self._on_download_voice(k)
+
+            items.append(
+                pystray.MenuItem(
+                    label,
+                    make_action(voice["key"]),
+                    enabled=not voice.get("downloading"),
+                )
+            )
+        items += [pystray.Menu.SEPARATOR, refresh]
+        return pystray.Menu(*items)
+
     def _build_speed_menu(self):
         """Build submenu of speed presets."""
         items = []
@@ -139,6 +199,12 @@ class TrayIcon:
             ),
             pystray.Menu.SEPARATOR,
             pystray.MenuItem("Voice", self._build_voice_menu()),
+            pystray.MenuItem(
+                "Download Voice",
+                self._download_menu or pystray.Menu(
+                    pystray.MenuItem("Loading...", None, enabled=False),
+                ),
+            ),
             pystray.MenuItem("Speed", self._build_speed_menu()),
             pystray.MenuItem("Pitch", self._build_pitch_menu()),
             pystray.Menu.SEPARATOR,
@@ -148,6 +214,11 @@ class TrayIcon:
                 checked=lambda item: self._is_paused(),
             ),
             pystray.MenuItem("Configure Shortcut", self._on_configure_shortcut),
+            pystray.MenuItem(
+                "Profile Speech",
+                self._on_toggle_profiling,
+                checked=lambda item: self._is_profiling(),
+            ),
             pystray.MenuItem(
                 "Start on Login",
                 self._on_toggle_startup,
@@ -158,27 +229,41 @@ class TrayIcon:
             pystray.MenuItem("Quit", self._on_quit),
         )
 
-    def run(self):
-        """Blocking call. Runs the tray icon event loop on the main thread."""
+    def run(self, on_visible=None):
+        """Blocking call. Runs the tray icon event loop on the main thread.
+
+        ``on_visible`` is called (from pystray's setup thread) once the
+        icon has been shown.
+        """
         self._icon = pystray.Icon(
             name="ReadToMe",
             icon=self._create_icon_image(),
-            title="ReadToMe TTS",
+            title=self._title,
             menu=self._build_menu(),
         )
-        self._icon.run()
+
+        def setup(icon):
+            icon.visible = True
+            if on_visible is not None:
+                on_visible()
+            self.update_menu()  # Fills in the Download Voice submenu
+
+        self._icon.run(setup=setup)
 
     def stop(self):
         if self._icon:
             self._icon.stop()
 
     def update_tooltip(self, text: str):
+        # Windows tray tooltips have a 128 character limit. Kept for run()
+        # too, as the voice starts loading before the icon exists
+        self._title = text[:127]
         if self._icon:
-            # Windows tray tooltips have a 128 character limit
-            self._icon.title = text[:127]
+            self._icon.title = self._title
 
     def update_menu(self):
         """Rebuild the menu (e.g. after voice list changes)."""
+        self._download_menu = self._build_download_menu()
         if self._icon:
             self._icon.menu = self._build_menu()
             self._icon.update_menu()
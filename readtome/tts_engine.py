@@ -1,35 +1,235 @@
+import gc
+import hashlib
+import json
 import logging
+import threading
 import time
+from pathlib import Path
 
 import numpy as np
 
+from readtome.audio_store import AudioStore
 from readtome.config import Config
+from readtome.memstats import release_free_memory
+from readtome.profiling import no_stage
+from readtome.watchdog import LatencyWatchdog
 
 logger = logging.getLogger(__name__)
 
+# Chunked decode: sentences shorter than twice this many phonemes are not
+# split, and no clause is made shorter than it (very short pieces lose
+# their intonation).
+_MIN_CLAUSE_PHONEMES = 40
+# A clause longer than this with no punctuation is split at a word boundary
+_MAX_CLAUSE_PHONEMES = 160
+_CLAUSE_BREAKS = frozenset(",;:")
+_CROSSFADE_SECONDS = 0.010
+
+# Audio of the last utterance kept for re-reads (about 2.6 MB per minute at
+# 22050 Hz before buffer_compression)
+_SENTENCE_CACHE_SECONDS = 600
+
+# Wait after a failed fallback voice load before trying it again
+_FALLBACK_RETRY_SECONDS = 60.0
+
+
+def split_clauses(phonemes: list[str]) -> list[list[str]]:
+    """Split a sentence's phonemes after clause punctuation.
+
+    Each piece can be synthesized on its own, so the first clause of a
+    long sentence can play while the rest is still being synthesized.
+    Punctuation stays with the clause it ends, so the model still
+    produces the pause and continuation intonation.
+    """
+    if len(phonemes) < 2 * _MIN_CLAUSE_PHONEMES:
+        return [phonemes]
+    pieces = []
+    start = last_space = 0
+    for i, phoneme in enumerate(phonemes):
+        length = i + 1 - start
+        remaining = len(phonemes) - (i + 1)
+        if remaining < _MIN_CLAUSE_PHONEMES:
+            break
+        if phoneme == " ":
+            last_space = i
+        if phoneme in _CLAUSE_BREAKS and length >= _MIN_CLAUSE_PHONEMES:
+            pieces.append(phonemes[start:i + 1])
+            start = i + 1
+        elif length >= _MAX_CLAUSE_PHONEMES and last_space - start >= _MIN_CLAUSE_PHONEMES:
+            pieces.append(phonemes[start:last_space + 1])
+            start = last_space + 1
+    pieces.append(phonemes[start:])
+    return pieces
+
+
+def crossfade(head: np.ndarray, samples: np.ndarray) -> np.ndarray:
+    """Blend ``head`` (the held-back end of a clause) into the start of ``samples``."""
+    n = len(head)
+    if n == 0 or len(samples) < n:
+        return np.concatenate([head, samples])
+    ramp = np.linspace(0.0, 1.0, n, endpoint=False, dtype=np.float32)
+    blended = head * (1.0 - ramp) + samples[:n] * ramp
+    return np.concatenate([np.round(blended).astype(samples.dtype), samples[n:]])
+
 
 class TTSEngine:
     def __init__(self, config: Config):
         self._config = config
         self._voice = None
         self._loaded = False
+        # Lighter voice the watchdog switches to under CPU contention
+        self._watchdog = LatencyWatchdog(
+            config.rtf_degrade_below, config.rtf_recover_above,
+        )
+        self._fallback_path: str | None = None
+        self._fallback_voice = None
+        self._fallback_retry_at = 0.0
+        self._fallback_lock = threading.Lock()
+        # Previous utterance's sentence audio, reused when text is re-read
+        self._sentence_cache: dict[tuple, list] = {}
+        self._cached_samples = 0
+        # Inference time and the audio it produced for the current/last
+        # stream (reused audio excluded from both)
+        self.stream_synth_seconds = 0.0
+        self.stream_synth_audio_seconds = 0.0
 
     def load_model(self, model_path: str | None = None):
-        from piper.voice import PiperVoice
-
-        path = model_path or self._config.model_path
+        path = self._config.model_file_for(model_path or self._config.model_path)
         logger.info("Loading Piper voice from %s", path)
         t0 = time.perf_counter()
-        self._voice = PiperVoice.load(path)
+        self._voice = self._open_voice(path)
         t_load = time.perf_counter() - t0
         self._loaded = True
         if model_path:
             self._config.model_path = model_path
+        self._fallback_voice = None
+        self._fallback_path = None
+        self._fallback_retry_at = 0.0
+        self.clear_sentence_cache()
         logger.info(
             "Voice loaded in %.2fs (sample_rate=%d)",
             t_load, self._voice.config.sample_rate,
         )
 
+    def _open_voice(self, path: str):
+        from piper.voice import PiperVoice
+
+        try:
+            return self._load_voice(path)
+        except TypeError:
+            # PiperVoice constructor differs in this piper version
+            logger.debug("Falling back to PiperVoice.load for %s", path)
+            return PiperVoice.load(path)
+
+    def _load_voice(self, path: str):
+        """Build a PiperVoice around our own ONNX Runtime session.
+
+        The first load saves the optimized graph to the cache directory;
+        later loads (e.g. after an idle unload) read that file with graph
+        optimization turned off, which skips most of the load time. With
+        shared_weights, a ``<voice>.shared.onnx`` copy is used instead when
+        one exists.
+        """
+        import onnxruntime
+        from piper.config import PiperConfig
+        from piper.voice import PiperVoice
+
+        with open(f"{path}.json", "r", encoding="utf-8") as f:
+            config_dict = json.load(f)
+
+        session = None
+        if self._config.shared_weights:
+            session = self._shared_session(path)
+
+        cached = self._optimized_graph_path(path)
+        if session is None and cached.exists():
+            options = self._session_options()
+            options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL
+            try:
+                session = onnxruntime.InferenceSession(
+                    str(cached), sess_options=options, providers=["CPUExecutionProvider"],
+                )
+                logger.debug("Using cached optimized graph %s", cached.name)
+            except Exception as e:
+                logger.warning("Discarding unusable optimized graph %s: %s", cached.name, e)
+                cached.unlink(missing_ok=True)
+
+        if session is None:
+            options = self._session_options()
+            # EXTENDED (not ALL) keeps the saved graph portable across CPUs
+            options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            options.optimized_model_filepath = str(cached)
+            session = onnxruntime.InferenceSession(
+                path, sess_options=options, providers=["CPUExecutionProvider"],
+            )
+        return PiperVoice(config=PiperConfig.from_dict(config_dict), session=session)
+
+    def _shared_session(self, path: str):
+        """Session over a voice's shared-weights copy, or None if unusable.
+
+        The copy is already optimized and its weights are aligned in a
+        separate data file, which ONNX Runtime maps read-only instead of
+        reading into this process. Prepacking is turned off because it
+        would make a private, reordered copy of each weight matrix.
+        """
+        import onnxruntime
+
+        shared = Config.shared_variant(path)
+        if not shared.exists():
+            logger.info("No shared-weights copy of %s; run `readtome share-weights`", Path(path).name)
+            return None
+        if shared.stat().st_mtime_ns < Path(path).stat().st_mtime_ns:
+            logger.warning("Ignoring %s, which is older than the voice file", shared.name)
+            return None
+        options = self._session_options()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL
+        options.add_session_config_entry("session.disable_prepacking", "1")
+        try:
+            session = onnxruntime.InferenceSession(
+                str(shared), sess_options=options, providers=["CPUExecutionProvider"],
+            )
+        except Exception as e:
+            logger.warning("Loading %s privately, shared copy unusable: %s", Path(path).name, e)
+            return None
+        logger.debug("Using shared weights from %s", shared.name)
+        return session
+
+    def _session_options(self):
+        import onnxruntime
+
+        options = onnxruntime.SessionOptions()
+        if self._config.memory_budget_mb:
+            # No arena: freed tensors go back to the OS instead of being
+            # kept for reuse. No memory pattern: no pre-planned peak buffer.
+            options.enable_cpu_mem_arena = False
+            options.enable_mem_pattern = False
+        return options
+
+    @staticmethod
+    def _optimized_graph_path(path: str) -> Path:
+        """Cache file for a model's optimized graph, keyed by file identity."""
+        import onnxruntime
+
+        stat = Path(path).stat()
+        key = f"{Path(path).resolve()}|{stat.st_size}|{stat.st_mtime_ns}|{onnxruntime.__version__}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+        return Config.get_cache_dir() / f"{Path(path).stem}.{digest}.opt.onnx"
+
+    def unload(self):
+        """Release the voice and its ONNX Runtime session."""
+        if self._voice is None:
+            return
+        self._voice = None
+        self._fallback_voice = None
+        self._fallback_path = None
+        self._fallback_retry_at = 0.0
+        self._loaded = False
+        self.clear_sentence_cache()
+        gc.collect()
+        release_free_memory()
+        logger.info("Voice unloaded")
+
     @property
     def is_loaded(self) -> bool:
         return self._loaded
@@ -40,53 +240,229 @@ class TTSEngine:
             return self._voice.config.sample_rate
         return 22050
 
-    def _get_playback_rate(self) -> int:
-        """Apply pitch adjustment to the sample rate for playback."""
-        base_sr = self.sample_rate
-        return int(base_sr * self._config.pitch)
-
-    def _make_syn_config(self):
+    def _make_syn_config(self, speed: float | None = None):
         """Create a SynthesisConfig with speed applied."""
         from piper.config import SynthesisConfig
 
         return SynthesisConfig(
-            length_scale=1.0 / self._config.speed,
+            length_scale=1.0 / (speed or self._config.speed),
         )
 
     def synthesize(self, text: str) -> tuple:
-        """Synchronous synthesis. Returns (samples_ndarray, sample_rate)."""
+        """Synchronous synthesis. Returns (AudioStore, sample_rate).
+
+        Sentences are appended to the store as they are synthesized, so a
+        long text is never concatenated into one array. The rate is the
+        voice's own; pitch is applied at playback.
+        """
         if not self._voice:
             raise RuntimeError("Model not loaded")
         logger.debug("Synthesizing %d chars with speed=%.1f", len(text), self._config.speed)
         t0 = time.perf_counter()
 
         syn_config = self._make_syn_config()
-        chunks = []
+        samples = AudioStore(self._config.buffer_compression)
         for audio_chunk in self._voice.synthesize(text, syn_config=syn_config):
-            chunks.append(audio_chunk.audio_int16_array)
+            samples.append(audio_chunk.audio_int16_array)
 
-        if not chunks:
+        if not len(samples):
             logger.warning("No audio generated for text")
-            return np.array([], dtype=np.int16), self._get_playback_rate()
+            return samples, self.sample_rate
 
-        samples = np.concatenate(chunks)
-        sr = self._get_playback_rate()
+        sr = self.sample_rate
         t_synth = time.perf_counter() - t0
         duration = len(samples) / sr
         logger.debug(
-            "Synthesized %d samples in %.2fs (%.1fx realtime, pitch=%.2f)",
+            "Synthesized %d samples in %.2fs (%.1fx realtime, %.1f MB held)",
             len(samples), t_synth, duration / t_synth if t_synth > 0 else 0,
-            self._config.pitch,
+            samples.nbytes / 1e6,
         )
         return samples, sr
 
-    def synthesize_stream(self, text: str):
-        """Generator yielding (samples_ndarray, sample_rate) per sentence."""
+    def synthesize_stream(self, text: str, speed: float | None = None, stage=no_stage):
+        """Generator yielding (samples_ndarray, sample_rate, sentence_end).
+
+        ``sample_rate`` is the rate of the voice that spoke the piece;
+        pitch is applied at playback.
+
+        Normally each item is one whole sentence. With ``chunked_decode``
+        on, long sentences are synthesized clause by clause and each clause
+        is yielded as soon as it is ready, with ``sentence_end`` False
+        for all but the sentence's last piece.
+
+        Sentences that were also in the previous utterance (same phonemes,
+        voice and speed) are replayed from its audio instead of being
+        synthesized again, so re-reading edited text only synthesizes the
+        sentences that changed. Replayed pieces are yielded as the
+        AudioStore they are kept in (which has a length, and decodes block by
+        block through ``blocks()``) instead of an ndarray.
+
+        ``speed`` overrides the configured speed for this stream, so callers
+        know exactly which speed the chunks were synthesized at. Each
+        piece's synthesis speed feeds the latency watchdog; while it reports
+        the primary voice can't keep up, the remaining sentences are
+        synthesized with the lighter fallback voice instead. ``stage`` is a
+        ProfileSession.stage when the utterance is being profiled.
+        """
         if not self._voice:
             raise RuntimeError("Model not loaded")
         logger.debug("Starting streaming synthesis for %d chars", len(text))
 
-        syn_config = self._make_syn_config()
-        sr = self._get_playback_rate()
-        for audio_chunk in self._voice.synthesize(text, syn_config=syn_config):
-            yield audio_chunk.audio_int16_array, sr
+        syn_config = self._make_syn_config(speed)
+        primary = self._voice
+        primary_key = self._config.model_path
+        fallback_path = self._config.resolve_fallback_voice()
+        with stage("phonemize"):
+            sentences = primary.phonemize(text)
+
+        # Audio of the previous utterance's sentences, keyed by phonemes,
+        # voice and synthesis settings; only this utterance's sentences
+        # are carried over to the next one
+        previous, self._sentence_cache = self._sentence_cache, {}
+        self._cached_samples = 0
+        self.stream_synth_seconds = 0.0
+        self.stream_synth_audio_seconds = 0.0
+        reused = 0
+        try:
+            for phonemes in sentences:
+                if not phonemes:
+                    # Punctuation-only lines phonemize to nothing, as in
+                    # PiperVoice.synthesize
+                    continue
+                # Voices are only swapped between sentences, never mid-sentence
+                voice, key = primary, primary_key
+                if fallback_path and self._watchdog.evaluate(primary_key, fallback_path):
+                    fallback = self._get_fallback_voice(fallback_path)
+                    if fallback is not None:
+                        voice, key = fallback, fallback_path
+
+                cache_key = (key, syn_config.length_scale, self._config.chunked_decode, tuple(phonemes))
+                chunks = previous.get(cache_key)
+                if chunks is None:
+                    # Repeated within this utterance
+                    chunks = self._sentence_cache.get(cache_key)
+                if chunks is None:
+                    chunks = []
+                    for chunk in self._synthesize_sentence(voice, key, phonemes, syn_config, stage):
+                        chunks.append(chunk)
+                        samples, sr, sentence_end = chunk
+                        yield samples, sr, sentence_end
+                else:
+                    reused += 1
+                    # Yielded compressed; the player's pipeline decodes
+                    # each block just before it is played
+                    yield from chunks
+                self._remember_sentence(cache_key, chunks)
+        finally:
+            if reused:
+                logger.info("Reused audio for %d unchanged sentence(s)", reused)
+
+    def _synthesize_sentence(self, voice, key: str, phonemes: list[str], syn_config, stage):
+        """Yield (samples, voice_sample_rate, sentence_end) for one sentence."""
+        pieces = split_clauses(phonemes) if self._config.chunked_decode else [phonemes]
+        # Clauses of a sentence are normalized against the loudest one
+        # so far, so a quiet clause isn't boosted to full scale
+        peak = 0.0
+        tail = None
+        for i, piece in enumerate(pieces):
+            t0 = time.perf_counter()
+            with stage("inference"):
+                samples, peak = self._phonemes_to_audio(voice, piece, syn_config, peak)
+            t_synth = time.perf_counter() - t0
+            self.stream_synth_seconds += t_synth
+            sr = voice.config.sample_rate
+            self.stream_synth_audio_seconds += len(samples) / sr
+            rtf = self._watchdog.record(key, len(samples) / sr, t_synth)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "%s synthesized in %.2fs (rolling %.1fx realtime, %s)",
+                    "Sentence" if len(pieces) == 1 else f"Clause {i + 1}/{len(pieces)}",
+                    t_synth, rtf, Path(key).stem,
+                )
+
+            if tail is not None:
+                samples = crossfade(tail, samples)
+                tail = None
+            sentence_end = i == len(pieces) - 1
+            if not sentence_end:
+                # Hold back the end of the clause to blend with the next
+                fade = min(len(samples) // 2, int(sr * _CROSSFADE_SECONDS))
+                samples, tail = samples[:len(samples) - fade], samples[len(samples) - fade:]
+            yield samples, sr, sentence_end
+
+    def _remember_sentence(self, cache_key: tuple, chunks: list):
+        """Keep a sentence's audio for the next utterance, within the size cap.
+
+        Freshly synthesized pieces are compressed into AudioStores; pieces
+        that were replayed from the cache already are.
+        """
+        n = sum(len(samples) for samples, _, _ in chunks)
+        sr = chunks[0][1] if chunks else 1
+        if self._cached_samples + n <= _SENTENCE_CACHE_SECONDS * sr:
+            codec = self._config.buffer_compression
+            self._sentence_cache[cache_key] = [
+                (samples if isinstance(samples, AudioStore) else AudioStore.from_array(samples, codec),
+                 sr, sentence_end)
+                for samples, sr, sentence_end in chunks
+            ]
+            self._cached_samples += n
+
+    def clear_sentence_cache(self):
+        self._sentence_cache = {}
+        self._cached_samples = 0
+
+    @staticmethod
+    def _phonemes_to_audio(voice, phonemes: list[str], syn_config,
+                           peak: float = 0.0) -> tuple[np.ndarray, float]:
+        """Run phonemes through a voice. Returns (int16 samples, peak).
+
+        Mirrors the per-sentence steps of PiperVoice.synthesize, so a
+        sentence can be routed to either voice. When normalizing, audio is
+        scaled by the larger of its own peak and ``peak`` (the loudest
+        earlier clause of the same sentence); the peak used is returned.
+        """
+        phoneme_ids = voice.phonemes_to_ids(phonemes)
+        audio = voice.phoneme_ids_to_audio(phoneme_ids, syn_config)
+        if syn_config.normalize_audio:
+            peak = max(peak, float(np.max(np.abs(audio))) if len(audio) else 0.0)
+            audio = audio / peak if peak > 1e-8 else np.zeros_like(audio)
+        if syn_config.volume != 1.0:
+            audio = audio * syn_config.volume
+        return (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16), peak
+
+    def _get_fallback_voice(self, path: str):
+        """The loaded fallback voice, starting a background load if needed.
+
+        The fallback is only loaded the first time it is needed. Returns None
+        until it is ready, so the primary voice keeps speaking meanwhile. A
+        failed load is retried after _FALLBACK_RETRY_SECONDS.
+        """
+        with self._fallback_lock:
+            if self._fallback_path == path:
+                return self._fallback_voice
+            if time.monotonic() < self._fallback_retry_at:
+                return None
+            self._fallback_path = path
+            self._fallback_voice = None
+        threading.Thread(target=self._load_fallback, args=(path,), daemon=True).start()
+        return None
+
+    def _load_fallback(self, path: str):
+        try:
+            voice = self._open_voice(self._config.model_file_for(path))
+        except Exception as e:
+            logger.error(
+                "Failed to load fallback voice %s (retrying in %.0fs): %s",
+                path, _FALLBACK_RETRY_SECONDS, e,
+            )
+            with self._fallback_lock:
+                if self._fallback_path == path:
+                    self._fallback_path = None
+                    self._fallback_retry_at = time.monotonic() + _FALLBACK_RETRY_SECONDS
+            # Nothing to degrade to, so stay on the primary voice meanwhile
+            self._watchdog.recover()
+            return
+        with self._fallback_lock:
+            if self._fallback_path == path:
+                self._fallback_voice = voice
+                logger.info("Fallback voice ready: %s", Path(path).stem)
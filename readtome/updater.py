@@ -2,13 +2,17 @@ import ctypes
 import json
 import logging
 import os
+import re
 import subprocess
 import sys
 import tempfile
+import urllib.error
 import urllib.request
 import webbrowser
+from pathlib import Path
 
 from readtome import __version__, GITHUB_REPO
+from readtome.downloads import download_resumable
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +20,12 @@ logger = logging.getLogger(__name__)
 _API_URL = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
 _RELEASES_URL = f"https://github.com/{GITHUB_REPO}/releases/latest"
 
+# Release metadata is cached with its ETag so repeat checks cost a 304
+_CACHE_FILE = Path.home() / ".readtome" / "update_cache.json"
+
+# One sha256sum output line: "<digest>  <name>" or "<digest> *<name>"
+_CHECKSUM_LINE = re.compile(r"([0-9a-fA-F]{64})(?:\s+(\S.*))?$")
+
 # Windows MessageBox styles
 _MB_OK = 0x00000000
 _MB_YESNO = 0x00000004
@@ -43,18 +53,65 @@ def _message_box(title: str, text: str, style: int) -> int:
         return 0
 
 
+def _load_cache() -> dict:
+    """The update cache, or an empty one if it is missing or corrupt."""
+    try:
+        cache = json.loads(_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    # Drop entries that don't have the shape fetch_release() writes
+    return {
+        url: entry for url, entry in cache.items()
+        if isinstance(entry, dict) and isinstance(entry.get("etag"), str) and "data" in entry
+    }
+
+
+def _save_cache(cache: dict) -> None:
+    try:
+        _CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _CACHE_FILE.write_text(json.dumps(cache), encoding="utf-8")
+    except OSError as e:
+        logger.debug("Could not write update cache: %s", e)
+
+
+def fetch_release(api_url: str = _API_URL) -> dict:
+    """Fetch release metadata, revalidating the cached copy by ETag.
+
+    A 304 Not Modified response reuses the cached JSON, so repeat checks
+    only transfer headers.
+    """
+    cache = _load_cache()
+    entry = cache.get(api_url, {})
+    headers = {"Accept": "application/vnd.github.v3+json",
+               "User-Agent": "ReadToMe-TTS"}
+    if entry:
+        headers["If-None-Match"] = entry["etag"]
+
+    req = urllib.request.Request(api_url, headers=headers)
+    try:
+        with urllib.request.urlopen(req, timeout=10) as resp:
+            data = json.loads(resp.read().decode("utf-8"))
+            etag = resp.headers.get("ETag")
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            logger.info("Release metadata not modified (ETag %s)", entry["etag"])
+            return entry["data"]
+        raise
+
+    if etag:
+        cache[api_url] = {"etag": etag, "data": data}
+        _save_cache(cache)
+    return data
+
+
 def check_for_update() -> None:
     """Check GitHub for a newer release and prompt the user if one is found."""
     logger.info("Checking for updates at %s", _API_URL)
 
     try:
-        req = urllib.request.Request(
-            _API_URL,
-            headers={"Accept": "application/vnd.github.v3+json",
-                      "User-Agent": "ReadToMe-TTS"},
-        )
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
+        data = fetch_release()
     except Exception as e:
         logger.error("Update check failed: %s", e)
         _message_box(
@@ -137,7 +194,9 @@ def _prompt_and_install(
         return
 
     # Download and launch the installer
-    _download_and_launch(installer_asset)
+    _download_and_launch(
+        installer_asset, _expected_sha256(release_data, installer_asset),
+    )
 
 
 def _find_installer_asset(release_data: dict) -> dict | None:
@@ -149,31 +208,75 @@ def _find_installer_asset(release_data: dict) -> dict | None:
     return None
 
 
-def _download_and_launch(asset: dict) -> None:
+def _expected_sha256(release_data: dict, asset: dict) -> str | None:
+    """Find the published SHA-256 for an asset, if the release has one.
+
+    Uses the ``digest`` field GitHub reports for uploaded assets, falling
+    back to a ``<asset>.sha256`` or ``SHA256SUMS`` file in the release.
+    """
+    digest = asset.get("digest") or ""
+    if digest.startswith("sha256:"):
+        return digest.split(":", 1)[1].lower()
+
+    name = asset.get("name", "")
+    for candidate in release_data.get("assets", []):
+        if candidate.get("name") not in (f"{name}.sha256", "SHA256SUMS"):
+            continue
+        try:
+            req = urllib.request.Request(
+                candidate.get("browser_download_url", ""),
+                headers={"User-Agent": "ReadToMe-TTS"},
+            )
+            with urllib.request.urlopen(req, timeout=10) as resp:
+                text = resp.read().decode("utf-8", "replace")
+        except Exception as e:
+            logger.warning("Could not fetch checksum file %s: %s", candidate.get("name"), e)
+            continue
+        digest = _find_checksum(text, name, bare_ok=candidate.get("name") != "SHA256SUMS")
+        if digest:
+            return digest
+    return None
+
+
+def _find_checksum(text: str, name: str, bare_ok: bool = False) -> str | None:
+    """The SHA-256 listed for ``name`` in sha256sum output.
+
+    Lines must read ``<64 hex digits> <file name>`` (``*name`` for binary
+    mode). A ``<asset>.sha256`` file may instead hold just the digest
+    (``bare_ok``), but only as its sole entry.
+    """
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    for line in lines:
+        match = _CHECKSUM_LINE.match(line)
+        if not match:
+            continue
+        digest, listed = match.groups()
+        if listed is None:
+            if bare_ok and len(lines) == 1:
+                return digest.lower()
+        elif listed.lstrip("*") == name:
+            return digest.lower()
+    return None
+
+
+def _download_and_launch(asset: dict, expected_sha256: str | None = None) -> None:
     """Download the installer to %TEMP% and launch it, then exit."""
     download_url = asset.get("browser_download_url", "")
     file_name = asset.get("name", "ReadToMe_Setup.exe")
     dest_path = os.path.join(tempfile.gettempdir(), file_name)
 
     logger.info("Downloading update: %s -> %s", download_url, dest_path)
+    if not expected_sha256:
+        logger.warning("Release publishes no SHA-256 for %s, skipping verification", file_name)
 
     try:
-        req = urllib.request.Request(
-            download_url,
-            headers={"User-Agent": "ReadToMe-TTS"},
-        )
-        with urllib.request.urlopen(req, timeout=120) as resp:
-            with open(dest_path, "wb") as f:
-                while True:
-                    chunk = resp.read(65536)
-                    if not chunk:
-                        break
-                    f.write(chunk)
+        download_resumable(download_url, dest_path, expected_sha256)
     except Exception as e:
         logger.error("Download failed: %s", e)
         _message_box(
             "ReadToMe - Update Failed",
-            f"Failed to download the update.\n\n{e}",
+            f"Failed to download the update.\n\n{e}\n\n"
+            f"Try again later — the download will resume where it stopped.",
             _MB_OK | _MB_ICONERROR,
         )
         return
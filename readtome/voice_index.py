@@ -0,0 +1,166 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from readtome.config import QUALITY_TIERS, QUANTIZED_SUFFIX, SHARED_SUFFIX, Config
+
+logger = logging.getLogger(__name__)
+
+_INDEX_FILE = Config.get_cache_dir() / "voice_index.json"
+# Bump when VoiceInfo's fields change so stale indexes are rebuilt
+_INDEX_VERSION = 1
+
+
+def voice_key(path: str | Path) -> str:
+    """Canonical string for comparing voice paths without touching the disk."""
+    return os.path.normcase(os.path.abspath(path))
+
+
+@dataclass
+class VoiceInfo:
+    path: str
+    name: str            # File stem, e.g. en_US-amy-medium
+    speaker: str
+    language: str        # Language code, e.g. en_US
+    language_name: str
+    quality: str
+    sample_rate: int
+    size: int            # .onnx file size in bytes
+    config_hash: str     # SHA-256 of the .onnx.json
+    has_quantized: bool  # A <name>.int8.onnx variant is installed
+    # Invalidation: the entry is re-read when any of these change
+    model_mtime_ns: int
+    config_mtime_ns: int
+
+    @property
+    def display_name(self) -> str:
+        speaker = self.speaker.replace("_", " ").title()
+        return f"{speaker} ({self.language}, {self.quality})" if self.quality else speaker
+
+
+class VoiceIndex:
+    """Metadata for every voice in models/, persisted between runs.
+
+    Listing is one directory scan; a voice's ``.onnx.json`` is only parsed
+    (and hashed) again when its model or config mtime changed since the
+    last scan, so large voice collections stay cheap to list. The index is
+    saved to the cache directory whenever an entry changes.
+    """
+
+    def __init__(self, models_dir: Path, index_file: Path = _INDEX_FILE):
+        self._models_dir = models_dir
+        self._index_file = index_file
+        self._lock = threading.Lock()
+        self._entries: dict[str, VoiceInfo] = self._load()
+
+    def _load(self) -> dict[str, VoiceInfo]:
+        try:
+            data = json.loads(self._index_file.read_text(encoding="utf-8"))
+            if data.get("version") != _INDEX_VERSION:
+                return {}
+            return {key: VoiceInfo(**entry) for key, entry in data["voices"].items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}
+
+    def _save(self):
+        data = {
+            "version": _INDEX_VERSION,
+            "voices": {key: asdict(info) for key, info in self._entries.items()},
+        }
+        self._index_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._index_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, indent=1), encoding="utf-8")
+        os.replace(tmp, self._index_file)
+
+    def refresh(self) -> list[VoiceInfo]:
+        """Rescan models/ and return all voices, sorted for display."""
+        with self._lock:
+            try:
+                with os.scandir(self._models_dir) as it:
+                    files = {entry.name: entry for entry in it if entry.is_file()}
+            except OSError:
+                files = {}
+
+            entries: dict[str, VoiceInfo] = {}
+            changed = 0
+            for name, entry in files.items():
+                if not name.endswith(".onnx") or name.endswith((QUANTIZED_SUFFIX, SHARED_SUFFIX)):
+                    continue
+                key = voice_key(entry.path)
+                model_stat = entry.stat()
+                config_entry = files.get(name + ".json")
+                config_mtime = config_entry.stat().st_mtime_ns if config_entry else 0
+                has_quantized = Config.quantized_variant(name).name in files
+
+                info = self._entries.get(key)
+                if (
+                    info is None
+                    or info.model_mtime_ns != model_stat.st_mtime_ns
+                    or info.config_mtime_ns != config_mtime
+                    or info.size != model_stat.st_size
+                ):
+                    info = self._read_voice(entry.path, model_stat, config_mtime)
+                    changed += 1
+                elif info.has_quantized != has_quantized:
+                    changed += 1
+                info.has_quantized = has_quantized
+                entries[key] = info
+
+            removed = len(self._entries.keys() - entries.keys())
+            self._entries = entries
+            if changed or removed:
+                logger.debug(
+                    "Voice index: %d voices, %d re-read, %d removed",
+                    len(entries), changed, removed,
+                )
+                try:
+                    self._save()
+                except OSError as e:
+                    logger.warning("Failed to save voice index: %s", e)
+            return sorted(entries.values(), key=_sort_key)
+
+    def get(self, path: str | Path) -> VoiceInfo | None:
+        """Indexed metadata for a voice file, as of the last refresh."""
+        with self._lock:
+            return self._entries.get(voice_key(path))
+
+    @staticmethod
+    def _read_voice(path: str, model_stat: os.stat_result, config_mtime: int) -> VoiceInfo:
+        # Piper voice files are named <language>-<speaker>-<quality>.onnx;
+        # the .onnx.json is authoritative when it has the field.
+        stem = Path(path).stem
+        language, _, rest = stem.partition("-")
+        speaker, _, quality = rest.rpartition("-")
+        config, config_hash = {}, ""
+        if config_mtime:
+            try:
+                raw = Path(f"{path}.json").read_bytes()
+                config_hash = hashlib.sha256(raw).hexdigest()
+                config = json.loads(raw)
+            except (OSError, ValueError) as e:
+                logger.warning("Unreadable voice config for %s: %s", stem, e)
+        lang = config.get("language", {})
+        audio = config.get("audio", {})
+        return VoiceInfo(
+            path=path,
+            name=stem,
+            speaker=config.get("dataset") or speaker or stem,
+            language=lang.get("code") or language,
+            language_name=lang.get("name_english", ""),
+            quality=audio.get("quality") or quality,
+            sample_rate=int(audio.get("sample_rate", 0)),
+            size=model_stat.st_size,
+            config_hash=config_hash,
+            has_quantized=False,
+            model_mtime_ns=model_stat.st_mtime_ns,
+            config_mtime_ns=config_mtime,
+        )
+
+
+def _sort_key(info: VoiceInfo):
+    tier = QUALITY_TIERS.index(info.quality) if info.quality in QUALITY_TIERS else len(QUALITY_TIERS)
+    return info.language, info.speaker, tier, info.name
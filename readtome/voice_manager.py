@@ -0,0 +1,182 @@
+import json
+import logging
+import os
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from readtome.downloads import download_resumable
+
+logger = logging.getLogger(__name__)
+
+# Piper's published voice catalog: every voice with its files, sizes and
+# MD5 digests. File paths in the catalog are relative to _BASE_URL.
+_BASE_URL = "https://huggingface.co/rhasspy/piper-voices/resolve/main"
+_CATALOG_FILE = Path.home() / ".readtome" / "voices_catalog.json"
+
+# Concurrent connections used for model downloads
+_MAX_WORKERS = 4
+
+# Staging directory inside models/, so the final rename is on the same
+# filesystem (atomic) and nothing half-written matches models/*.onnx.
+_STAGING_DIR = ".download"
+
+
+class AlreadyDownloading(Exception):
+    """The voice is being downloaded by an earlier, unfinished request."""
+
+
+class VoiceManager:
+    """Fetches Piper's voice catalog and installs voices into models/.
+
+    Each voice is an ``.onnx`` model plus its ``.onnx.json`` config. Files
+    are downloaded concurrently into a staging directory (resuming any
+    partial files from an earlier attempt), checked against the catalog's
+    sizes and MD5 digests, and only then moved into the models directory —
+    config first, model last — so the voice index never
+    sees an incomplete voice.
+    """
+
+    def __init__(self, models_dir: Path, base_url: str = _BASE_URL,
+                 max_workers: int = _MAX_WORKERS):
+        self._models_dir = Path(models_dir)
+        self._base_url = base_url.rstrip("/")
+        self._max_workers = max_workers
+        self._catalog: dict | None = None
+        self._lock = threading.Lock()
+        self._in_progress: set[str] = set()
+
+    # ── Catalog ──────────────────────────────────────────────────────────
+
+    def fetch_catalog(self) -> dict:
+        """Download the voice catalog and cache it on disk."""
+        url = f"{self._base_url}/voices.json"
+        logger.info("Fetching voice catalog from %s", url)
+        req = urllib.request.Request(url, headers={"User-Agent": "ReadToMe-TTS"})
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            catalog = json.loads(resp.read().decode("utf-8"))
+        try:
+            _CATALOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+            _CATALOG_FILE.write_text(json.dumps(catalog), encoding="utf-8")
+        except OSError as e:
+            logger.debug("Could not cache voice catalog: %s", e)
+        self._catalog = catalog
+        return catalog
+
+    def cached_catalog(self) -> dict | None:
+        """Return the last fetched catalog without touching the network."""
+        if self._catalog is None:
+            try:
+                self._catalog = json.loads(_CATALOG_FILE.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return None
+        return self._catalog
+
+    def available_voices(self, language: str | None = None) -> list[dict]:
+        """Catalog entries not yet installed, optionally for one language."""
+        catalog = self.cached_catalog() or {}
+        voices = []
+        for key, entry in sorted(catalog.items()):
+            if language and entry.get("language", {}).get("code") != language:
+                continue
+            if (self._models_dir / f"{key}.onnx").exists():
+                continue
+            voices.append(entry | {"key": key})
+        return voices
+
+    def is_downloading(self, key: str) -> bool:
+        with self._lock:
+            return key in self._in_progress
+
+    # ── Downloads ────────────────────────────────────────────────────────
+
+    def download(self, keys: list[str]) -> dict[str, Exception | None]:
+        """Install the given voices. Blocks until all are done.
+
+        Returns a mapping of voice key to the error that stopped it, or
+        None if it was installed. Voices another call is still downloading
+        are not fetched twice; they map to AlreadyDownloading.
+        """
+        catalog = self.cached_catalog() or self.fetch_catalog()
+        staging = self._models_dir / _STAGING_DIR
+
+        results: dict[str, Exception | None] = {}
+        # Under the same lock as the cleanup, so the staging directory
+        # can't be removed between creating it and registering the keys
+        with self._lock:
+            for key in keys:
+                if key in self._in_progress:
+                    results[key] = AlreadyDownloading(f"Voice {key!r} is already downloading")
+            keys = [k for k in keys if k not in self._in_progress]
+            self._in_progress.update(keys)
+            staging.mkdir(parents=True, exist_ok=True)
+
+        try:
+            # One task per file, so a single large model doesn't hold back
+            # the rest and the pool bound applies across voices.
+            jobs = []
+            for key in keys:
+                entry = catalog.get(key)
+                if entry is None:
+                    results[key] = KeyError(f"Voice {key!r} is not in the catalog")
+                    continue
+                for rel_path, meta in entry.get("files", {}).items():
+                    if rel_path.endswith((".onnx", ".onnx.json")):
+                        jobs.append((key, rel_path, meta))
+
+            with ThreadPoolExecutor(max_workers=self._max_workers,
+                                    thread_name_prefix="voice-dl") as pool:
+                futures = [(key, pool.submit(self._download_file, staging, rel, meta))
+                           for key, rel, meta in jobs]
+                for key, future in futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error("Voice download failed for %s: %s", key, e)
+                        results.setdefault(key, e)
+
+            for key in keys:
+                if key in results:
+                    continue
+                try:
+                    self._install(staging, key)
+                    results[key] = None
+                    logger.info("Installed voice %s", key)
+                except OSError as e:
+                    results[key] = e
+        finally:
+            with self._lock:
+                self._in_progress.difference_update(keys)
+                if not self._in_progress:
+                    self._cleanup_staging(staging)
+        return results
+
+    def _download_file(self, staging: Path, rel_path: str, meta: dict):
+        dest = staging / Path(rel_path).name
+        size = meta.get("size_bytes")
+        if dest.exists() and dest.stat().st_size == size:
+            return  # Verified by an earlier, interrupted install
+        download_resumable(
+            f"{self._base_url}/{rel_path}", dest,
+            expected_digest=meta.get("md5_digest"), algorithm="md5",
+            expected_size=size,
+        )
+
+    def _install(self, staging: Path, key: str):
+        """Move a fully downloaded voice from staging into models/."""
+        for name in (f"{key}.onnx.json", f"{key}.onnx"):
+            os.replace(staging / name, self._models_dir / name)
+
+    @staticmethod
+    def _cleanup_staging(staging: Path):
+        """Remove the staging directory once nothing is left in it.
+
+        Called with the lock held and no download in progress, so no other
+        download is writing into it.
+        """
+        try:
+            staging.rmdir()
+        except OSError:
+            pass  # Partial files kept so the next attempt can resume
+
@@ -0,0 +1,118 @@
+import logging
+import threading
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# Sentences per voice in the rolling RTF window
+_WINDOW = 4
+# Sentences measured before the primary voice may be judged too slow
+_MIN_SAMPLES = 2
+# Sentences spent degraded before the primary voice is retried anyway, in
+# case its best RTF was itself measured under contention
+_PROBE_INTERVAL = 30
+
+
+class LatencyWatchdog:
+    """Tracks rolling synthesis speed per voice and decides when to degrade.
+
+    RTF here is seconds of audio produced per second of synthesis (the
+    "x realtime" figure in the logs), so below 1.0 playback outruns
+    synthesis and speech stutters. When the primary voice's rolling RTF
+    falls under ``degrade_below`` the watchdog switches to the lighter
+    fallback voice. Its first sentences on the fallback, run under the same
+    load, calibrate how much faster the fallback is than the primary; from
+    then on the primary's RTF is estimated from the fallback's, and the
+    watchdog switches back once that estimate clears ``recover_above`` (or,
+    failing that, every so often as a probe).
+    """
+
+    def __init__(self, degrade_below: float, recover_above: float):
+        self._degrade_below = degrade_below
+        self._recover_above = recover_above
+        self._lock = threading.Lock()
+        self._samples: dict[str, deque] = {}
+        self._degraded = False
+        self._degraded_sentences = 0
+        self._primary_slow_rtf = 0.0
+        self._speedup: float | None = None  # fallback RTF / primary RTF
+
+    @property
+    def degraded(self) -> bool:
+        return self._degraded
+
+    def record(self, voice: str, audio_seconds: float, synth_seconds: float) -> float:
+        """Add one sentence's timing and return the voice's rolling RTF."""
+        with self._lock:
+            window = self._samples.setdefault(voice, deque(maxlen=_WINDOW))
+            window.append((audio_seconds, synth_seconds))
+            return self._rolling(window)
+
+    def rtf(self, voice: str) -> float | None:
+        with self._lock:
+            window = self._samples.get(voice)
+            return self._rolling(window) if window else None
+
+    def evaluate(self, primary: str, fallback: str) -> bool:
+        """Update the degrade state. Returns True if the fallback should be used."""
+        with self._lock:
+            if not self._degraded:
+                window = self._samples.get(primary)
+                if window and len(window) >= _MIN_SAMPLES:
+                    rtf = self._rolling(window)
+                    if rtf < self._degrade_below:
+                        self._degraded = True
+                        self._degraded_sentences = 0
+                        self._primary_slow_rtf = rtf
+                        self._speedup = None
+                        self._samples.pop(fallback, None)
+                        logger.warning(
+                            "Synthesis RTF %.2fx is below %.2fx, switching to lighter voice %s",
+                            rtf, self._degrade_below, fallback,
+                        )
+                return self._degraded
+
+            self._degraded_sentences += 1
+            window = self._samples.get(fallback)
+            if not window or len(window) < _MIN_SAMPLES:
+                return True
+            fallback_rtf = self._rolling(window)
+            if self._speedup is None:
+                self._speedup = max(1.0, fallback_rtf / max(self._primary_slow_rtf, 1e-6))
+                logger.debug("Fallback voice runs %.1fx faster than primary", self._speedup)
+            predicted = fallback_rtf / self._speedup
+            if predicted >= self._recover_above:
+                logger.info(
+                    "Headroom is back (fallback RTF %.2fx, primary predicted %.2fx), "
+                    "switching back to %s",
+                    fallback_rtf, predicted, primary,
+                )
+            elif self._degraded_sentences >= _PROBE_INTERVAL:
+                logger.info(
+                    "Retrying %s after %d sentences on the fallback (fallback RTF %.2fx)",
+                    primary, self._degraded_sentences, fallback_rtf,
+                )
+            else:
+                return True
+            self._degraded = False
+            # Forget the slow samples so they can't re-trigger right away
+            self._samples.pop(primary, None)
+            return False
+
+    def recover(self):
+        """Leave the degraded state, e.g. when the fallback can't be loaded.
+
+        All samples are forgotten, so the primary voice is measured afresh
+        before it can be judged too slow again.
+        """
+        with self._lock:
+            if self._degraded:
+                logger.info("No fallback voice available, staying on the primary voice")
+            self._degraded = False
+            self._samples.clear()
+
+    @staticmethod
+    def _rolling(window) -> float:
+        audio = sum(a for a, _ in window)
+        synth = sum(s for _, s in window)
+        return audio / synth if synth > 0 else 0.0
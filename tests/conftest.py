@@ -0,0 +1,71 @@
+import http.server
+import threading
+
+import pytest
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """Serves ``server.files`` with Range and ETag support that tests can break."""
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, self.headers.get("Range")))
+        server.if_none_match.append(self.headers.get("If-None-Match"))
+        name = self.path.lstrip("/")
+        data = server.files.get(name)
+        if data is None:
+            self.send_error(404)
+            return
+        etag = server.etags.get(name)
+        if etag is not None and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        range_header = self.headers.get("Range")
+        start = 0
+        if range_header and not server.ignore_range:
+            start = int(range_header.removeprefix("bytes=").split("-")[0])
+            if start >= len(data):
+                self.send_error(416)
+                return
+            sent_start = start + server.range_skew
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {sent_start}-{len(data) - 1}/{len(data)}")
+            start = sent_start
+        else:
+            self.send_response(200)
+        body = data[start:]
+        if etag is not None:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if server.drop_after is not None:
+            # Send part of the body, then hang up (once)
+            self.wfile.write(body[:server.drop_after])
+            server.drop_after = None
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    """A local HTTP server; put bytes in ``.files`` and fetch ``.url(name)``."""
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.files = {}
+    server.requests = []
+    server.if_none_match = []    # The If-None-Match header of each request
+    server.etags = {}            # ETag per file name; honours If-None-Match
+    server.ignore_range = False  # Answer Range requests with a full 200
+    server.range_skew = 0        # Start 206 responses this many bytes off
+    server.drop_after = None     # Close the next response after this many bytes
+    server.url = lambda name: f"http://127.0.0.1:{server.server_address[1]}/{name}"
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from readtome.audio_player import AudioPlayer
+from readtome.sinks import AudioSink
+
+
+class RecordingSink(AudioSink):
+    def __init__(self):
+        self.calls = []
+
+    def open(self, sample_rate):
+        self.calls.append("open")
+
+    def write(self, samples):
+        self.calls.append("write")
+
+    def drain(self):
+        self.calls.append("drain")
+
+    def abort(self):
+        self.calls.append("abort")
+
+    def close(self):
+        self.calls.append("close")
+
+
+def test_finished_stream_is_drained():
+    sink = RecordingSink()
+    AudioPlayer(sink=sink).play_stream([(np.ones(100, dtype=np.int16), 22050)])
+    assert sink.calls == ["open", "write", "drain", "close"]
+
+
+def test_failing_block_source_aborts_the_stream():
+    def blocks():
+        yield np.ones(100, dtype=np.int16), 22050
+        raise RuntimeError("synthesis failed")
+
+    sink = RecordingSink()
+    player = AudioPlayer(sink=sink)
+    with pytest.raises(RuntimeError, match="synthesis failed"):
+        player.play_stream(blocks())
+    assert sink.calls == ["open", "write", "abort", "close"]
+    assert not player.is_playing
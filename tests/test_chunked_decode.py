@@ -0,0 +1,150 @@
+import types
+
+import numpy as np
+
+from readtome.config import Config
+from readtome.tts_engine import _CROSSFADE_SECONDS, TTSEngine, crossfade, split_clauses
+
+SAMPLE_RATE = 22050
+TEXT = (
+    "When the storm finally passed over the valley late in the evening, "
+    "the farmers who had been waiting anxiously in their kitchens since noon "
+    "walked out into the soaked fields, counted the broken fences and fallen "
+    "branches one by one, and decided, after a long and tired discussion, "
+    "that the harvest could still be saved if everyone started early tomorrow."
+)
+
+_PHONEME_SAMPLES = 400
+
+# Same tolerances as benchmarks/bench_chunked_decode.py
+_MAX_DURATION_DIFF = 0.10
+_MAX_LEVEL_DIFF_DB = 1.5
+_MAX_LTAS_DIFF_DB = 3.0
+
+
+class StubVoice:
+    """Stands in for a PiperVoice whose output depends on context.
+
+    Like a real model, each phoneme's sound depends on its neighbours and
+    the level falls over the utterance (declination), so decoding clause
+    by clause really differs from decoding the whole sentence. Output is
+    smooth within an utterance, but one utterance ends wherever its
+    waveform happens to be. Clause punctuation is a short pause.
+    """
+
+    config = types.SimpleNamespace(sample_rate=SAMPLE_RATE)
+
+    def __init__(self):
+        self.calls = []
+
+    def phonemize(self, text):
+        return [list(sentence.strip()) for sentence in text.split(".") if sentence.strip()]
+
+    def phonemes_to_ids(self, phonemes):
+        return [ord(p) for p in phonemes]
+
+    def phoneme_ids_to_audio(self, ids, syn_config):
+        self.calls.append(ids)
+        context = [0] + ids + [0]
+        freq = np.empty(len(ids))
+        level = np.empty(len(ids))
+        for k, i in enumerate(ids):
+            prev, nxt = context[k], context[k + 2]
+            freq[k] = 200 + (prev * 7 + i * 13 + nxt * 3) % 30 * 40
+            if chr(i) in ",;:":
+                level[k] = 0.0
+            else:
+                level[k] = (0.05 if i == ord(" ") else 0.5) * (1 - 0.4 * k / len(ids))
+        # Smooth and phase-continuous within an utterance, like speech
+        envelope = np.convolve(np.repeat(level, _PHONEME_SAMPLES), np.ones(40) / 40, mode="same")
+        phase = np.cumsum(2 * np.pi * np.repeat(freq, _PHONEME_SAMPLES) / SAMPLE_RATE)
+        return (envelope * np.sin(phase)).astype(np.float32)
+
+
+def _engine(chunked: bool, voice=None) -> TTSEngine:
+    engine = TTSEngine(Config(chunked_decode=chunked, latency_fallback=""))
+    engine._voice = voice or StubVoice()
+    engine._loaded = True
+    engine._make_syn_config = lambda speed=None: types.SimpleNamespace(
+        length_scale=1.0, normalize_audio=True, volume=1.0,
+    )
+    return engine
+
+
+def _decode(chunked: bool) -> tuple[np.ndarray, list[int]]:
+    """The stream's audio, and the length of each piece."""
+    pieces = [samples for samples, _, _ in _engine(chunked).synthesize_stream(TEXT)]
+    return np.concatenate(pieces).astype(np.float32), [len(piece) for piece in pieces]
+
+
+def _longest_quiet_run(audio: np.ndarray) -> int:
+    quiet = np.concatenate(([False], np.abs(audio) < 300, [False]))
+    edges = np.flatnonzero(np.diff(quiet.astype(np.int8)))
+    return int(np.max(edges[1::2] - edges[::2])) if len(edges) else 0
+
+
+def _ltas_db(audio, frame=1024):
+    frames = np.lib.stride_tricks.sliding_window_view(audio, frame)[::frame // 2]
+    power = np.mean(np.abs(np.fft.rfft(frames * np.hanning(frame), axis=1)) ** 2, axis=0)
+    return 10 * np.log10(power + 1e-9)
+
+
+def _rms_db(audio):
+    return 20 * np.log10(np.sqrt(np.mean(audio ** 2)) + 1e-9)
+
+
+def test_split_clauses_keeps_every_phoneme_in_order():
+    phonemes = list(TEXT)
+    pieces = split_clauses(phonemes)
+    assert len(pieces) > 1
+    assert sum(pieces, []) == phonemes
+    # Every piece but the last ends at clause punctuation or a space
+    assert all(piece[-1] in ", ;:" for piece in pieces[:-1])
+
+
+def test_crossfade_is_continuous():
+    head = np.full(200, 1000, dtype=np.int16)
+    samples = np.full(1000, -1000, dtype=np.int16)
+    out = crossfade(head, samples)
+    assert len(out) == len(samples)
+    assert out[0] == 1000 and out[-1] == -1000
+    assert np.all(np.diff(out[:200].astype(int)) <= 0)
+
+
+def test_chunked_decode_matches_full_decode():
+    full, full_pieces = _decode(chunked=False)
+    chunked, chunked_pieces = _decode(chunked=True)
+    assert len(full_pieces) == 1 and len(chunked_pieces) > 1
+
+    assert abs(len(chunked) - len(full)) / len(full) <= _MAX_DURATION_DIFF
+    assert abs(_rms_db(chunked) - _rms_db(full)) <= _MAX_LEVEL_DIFF_DB
+    assert np.mean(np.abs(_ltas_db(chunked) - _ltas_db(full))) <= _MAX_LTAS_DIFF_DB
+
+
+def test_clause_joins():
+    full, _ = _decode(chunked=False)
+    chunked, lengths = _decode(chunked=True)
+    clauses = split_clauses(StubVoice().phonemize(TEXT)[0])
+    fade = int(SAMPLE_RATE * _CROSSFADE_SECONDS)
+
+    # Every clause but the last holds back its final 10 ms, which is
+    # blended over the start of the next clause
+    expected = [len(clause) * _PHONEME_SAMPLES for clause in clauses]
+    assert lengths == [n - fade for n in expected[:-1]] + [expected[-1]]
+
+    window = int(SAMPLE_RATE * 0.1)
+    for join in np.cumsum(lengths)[:-1]:
+        around = slice(join - window, join + window)
+        # The pause at the join is the one the full decode has there; a
+        # gap between clauses would lengthen it
+        assert _longest_quiet_run(chunked[around]) <= _longest_quiet_run(full[around]) + fade // 2
+
+
+def test_empty_sentences_are_skipped():
+    voice = StubVoice()
+    voice.phonemize = lambda text: [[], list("a short sentence"), []]
+    engine = _engine(chunked=True, voice=voice)
+    pieces = list(engine.synthesize_stream("... a short sentence ..."))
+    assert len(pieces) == 1
+    assert voice.calls == [[ord(p) for p in "a short sentence"]]
+    assert len(engine._sentence_cache) == 1
@@ -0,0 +1,101 @@
+import hashlib
+import os
+
+import pytest
+
+from readtome import downloads
+from readtome.downloads import download_resumable
+from readtome.updater import _expected_sha256, _find_checksum
+
+DATA = os.urandom(300_000)
+DIGEST = hashlib.sha256(DATA).hexdigest()
+
+
+@pytest.fixture
+def dest(tmp_path):
+    return tmp_path / "setup.exe"
+
+
+@pytest.fixture(autouse=True)
+def sleeps(monkeypatch):
+    """Retry delays requested, without waiting for them."""
+    delays = []
+    monkeypatch.setattr(downloads.time, "sleep", delays.append)
+    return delays
+
+
+def test_resumes_from_partial_file(http_server, dest):
+    http_server.files["setup.exe"] = DATA
+    (dest.parent / "setup.exe.part").write_bytes(DATA[:100_000])
+
+    assert download_resumable(http_server.url("setup.exe"), dest, DIGEST) == len(DATA)
+    assert dest.read_bytes() == DATA
+    assert http_server.requests == [("/setup.exe", "bytes=100000-")]
+
+
+def test_resumes_after_dropped_connection(http_server, dest):
+    http_server.files["setup.exe"] = DATA
+    http_server.drop_after = 70_000
+
+    download_resumable(http_server.url("setup.exe"), dest, DIGEST)
+    assert dest.read_bytes() == DATA
+    assert http_server.requests[-1] == ("/setup.exe", "bytes=70000-")
+
+
+def test_restarts_when_server_ignores_range(http_server, dest):
+    http_server.files["setup.exe"] = DATA
+    http_server.ignore_range = True
+    (dest.parent / "setup.exe.part").write_bytes(DATA[:100_000])
+
+    download_resumable(http_server.url("setup.exe"), dest, DIGEST)
+    assert dest.read_bytes() == DATA
+
+
+def test_restarts_when_content_range_starts_elsewhere(http_server, dest):
+    http_server.files["setup.exe"] = DATA
+    http_server.range_skew = -1000
+    (dest.parent / "setup.exe.part").write_bytes(DATA[:100_000])
+
+    download_resumable(http_server.url("setup.exe"), dest, DIGEST)
+    assert dest.read_bytes() == DATA
+    assert http_server.requests[-1] == ("/setup.exe", None)
+
+
+def test_checksum_mismatch_discards_download(http_server, dest):
+    http_server.files["setup.exe"] = DATA
+
+    with pytest.raises(ValueError, match="Checksum mismatch"):
+        download_resumable(http_server.url("setup.exe"), dest, "0" * 64)
+    assert not dest.exists()
+    assert not (dest.parent / "setup.exe.part").exists()
+
+
+def test_expected_sha256_from_sums_file(http_server):
+    http_server.files["SHA256SUMS"] = (
+        f"{'a' * 64}  other.exe\n{DIGEST} *ReadToMe_Setup_1.0.exe\n"
+    ).encode()
+    asset = {"name": "ReadToMe_Setup_1.0.exe"}
+    release = {"assets": [
+        asset, {"name": "SHA256SUMS", "browser_download_url": http_server.url("SHA256SUMS")},
+    ]}
+    assert _expected_sha256(release, asset) == DIGEST
+
+
+def test_checksum_lines_must_name_the_file():
+    name = "ReadToMe_Setup_1.0.exe"
+    assert _find_checksum(f"{DIGEST}  {name}", name) == DIGEST
+    assert _find_checksum(f"{DIGEST}  other.exe", name) is None
+    assert _find_checksum("not-a-digest", name, bare_ok=True) is None
+    assert _find_checksum(f"{DIGEST}", name) is None
+    assert _find_checksum(f"{DIGEST}", name, bare_ok=True) == DIGEST
+    assert _find_checksum(f"{DIGEST}\n{'b' * 64}", name, bare_ok=True) is None
+
+
+def test_retries_back_off(http_server, dest, sleeps):
+    # Nothing listens on the port once the server is gone
+    url = http_server.url("setup.exe")
+    http_server.shutdown()
+    http_server.server_close()
+    with pytest.raises(OSError):
+        download_resumable(url, dest)
+    assert sleeps == [1.0, 2.0, 4.0, 8.0]
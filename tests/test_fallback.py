@@ -0,0 +1,72 @@
+import threading
+
+from readtome import tts_engine
+from readtome.config import Config
+from readtome.tts_engine import TTSEngine
+from readtome.watchdog import LatencyWatchdog
+
+PRIMARY = "primary.onnx"
+FALLBACK = "fallback.onnx"
+
+
+def _degraded_watchdog() -> LatencyWatchdog:
+    watchdog = LatencyWatchdog(degrade_below=1.2, recover_above=1.8)
+    for _ in range(2):
+        watchdog.record(PRIMARY, audio_seconds=1.0, synth_seconds=2.0)
+    assert watchdog.evaluate(PRIMARY, FALLBACK)
+    return watchdog
+
+
+def test_recover_leaves_degraded_state():
+    watchdog = _degraded_watchdog()
+    watchdog.recover()
+    assert not watchdog.degraded
+    # The slow samples are gone, so the primary is measured afresh
+    assert not watchdog.evaluate(PRIMARY, FALLBACK)
+
+
+def _load_fallback(engine: TTSEngine, monkeypatch):
+    """Call _get_fallback_voice and wait for any background load it starts."""
+    started = []
+    real_thread = threading.Thread
+
+    def thread(*args, **kwargs):
+        t = real_thread(*args, **kwargs)
+        started.append(t)
+        return t
+
+    with monkeypatch.context() as m:
+        m.setattr(tts_engine.threading, "Thread", thread)
+        voice = engine._get_fallback_voice(FALLBACK)
+    for t in started:
+        t.join(5)
+    return voice, len(started)
+
+
+def test_failed_fallback_load_is_retried(monkeypatch):
+    engine = TTSEngine(Config(model_path=PRIMARY))
+    engine._watchdog = _degraded_watchdog()
+    fallback_voice = object()
+    attempts = []
+
+    def open_voice(path):
+        attempts.append(path)
+        if len(attempts) == 1:
+            raise RuntimeError("corrupt model")
+        return fallback_voice
+
+    monkeypatch.setattr(engine, "_open_voice", open_voice)
+    monkeypatch.setattr(engine._config, "model_file_for", lambda path: path)
+
+    assert _load_fallback(engine, monkeypatch) == (None, 1)
+    # The primary keeps speaking without the watchdog stuck degraded
+    assert not engine._watchdog.degraded
+
+    # Within the backoff no new load is started
+    assert _load_fallback(engine, monkeypatch) == (None, 0)
+    assert len(attempts) == 1
+
+    monkeypatch.setattr(engine, "_fallback_retry_at", 0.0)
+    assert _load_fallback(engine, monkeypatch) == (None, 1)
+    assert engine._get_fallback_voice(FALLBACK) is fallback_voice
+    assert len(attempts) == 2
@@ -0,0 +1,55 @@
+import pytest
+
+from readtome.normalize import normalize_text
+
+
+@pytest.mark.parametrize("line, expected", [
+    ("2024-05-01 12:00:03,120 INFO [main] Started", "Started"),
+    ("[2024-05-01 12:00:03] [ERROR] Disk full", "Disk full"),
+    ("12:00:03 - DEBUG - Retrying", "Retrying"),
+    ("2024-05-01T12:00:03Z WARNING: Slow reply", "Slow reply"),
+    ("[WARN]: Low disk", "Low disk"),
+])
+def test_log_prefixes_stripped(line, expected):
+    assert normalize_text(line, "log_prefixes") == expected
+
+
+@pytest.mark.parametrize("text", [
+    "2024-05-01 was the launch day.",
+    "INFO about the fix is in the notes.",
+    "ERROR: disk full",
+    "12:30 works for me.",
+])
+def test_prose_kept(text):
+    assert normalize_text(text, "log_prefixes") == text
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Wow!!!!! Next one.", "Wow! Next one."),
+    ("Wait.... What?", "Wait. What?"),
+    ("Go to ../../etc/passwd now.", "Go to etc/passwd now."),
+    ("Above ======== below", "Above below"),
+])
+def test_symbol_runs(text, expected):
+    assert normalize_text(text, "symbols") == expected
+
+
+def test_only_consecutive_repeats_collapse():
+    text = "Chorus line\nVerse one\nChorus line\nYes.\nYes.\nYes.\nDone"
+    assert normalize_text(text, "repeated_lines") == "Chorus line\nVerse one\nChorus line\nYes.\nDone"
+
+
+def test_repeated_log_lines_collapse_once_prefixes_are_stripped():
+    text = "12:00:01 WARN Retrying\n12:00:02 WARN Retrying\n12:00:03 INFO Connected"
+    assert normalize_text(text, "log_prefixes,repeated_lines") == "Retrying\nConnected"
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("<p>Hello <b>there</b></p>", "Hello there"),
+    ('See <a href="https://example.com" class=x>the docs</a>.<br/>', "See the docs ."),
+    ('<my-widget data-id="1">Custom</my-widget>', "Custom"),
+    ("if a<b and c>d then swap", "if a<b and c>d then swap"),
+    ("x <= y >= z", "x <= y >= z"),
+])
+def test_html_tags(text, expected):
+    assert normalize_text(text, "markdown") == expected
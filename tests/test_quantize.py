@@ -0,0 +1,32 @@
+from readtome import quantize
+
+
+def test_run_continues_past_failures(monkeypatch, capsys):
+    quantized = []
+
+    def quantize_voice(path):
+        if path == "broken.onnx":
+            raise RuntimeError("not a model")
+        quantized.append(path)
+        return path.replace(".onnx", ".int8.onnx")
+
+    def compare_variants(path):
+        if path == "noprobe.onnx":
+            raise RuntimeError("probe process died")
+        return {"model": path}
+
+    monkeypatch.setattr(quantize, "quantize_voice", quantize_voice)
+    monkeypatch.setattr(quantize, "compare_variants", compare_variants)
+    monkeypatch.setattr(quantize, "format_report", lambda report: f"report {report['model']}")
+
+    paths = ["a.onnx", "broken.onnx", "noprobe.onnx", "b.onnx"]
+    assert quantize.run(paths) == 1
+    assert quantized == ["a.onnx", "noprobe.onnx", "b.onnx"]
+    out = capsys.readouterr().out
+    assert "Wrote noprobe.int8.onnx" in out
+    assert "report b.onnx" in out
+
+
+def test_run_succeeds(monkeypatch):
+    monkeypatch.setattr(quantize, "quantize_voice", lambda path: path)
+    assert quantize.run(["a.onnx", "b.onnx"], report=False) == 0
@@ -0,0 +1,44 @@
+import numpy as np
+
+from readtome.resample import Resampler
+
+
+def tone(rate: float, n: int, freq: float = 440.0) -> np.ndarray:
+    return 8000 * np.sin(2 * np.pi * freq * np.arange(n) / rate)
+
+
+def snr_db(out: np.ndarray, ideal: np.ndarray) -> float:
+    error = out - ideal
+    return 10 * np.log10(np.mean(ideal ** 2) / np.mean(error ** 2))
+
+
+def test_ratio_is_exact():
+    # Rounding this ratio to a 512-phase fraction used to be ~600 ppm off
+    resampler = Resampler(16000 * 0.69, 44100)
+    assert resampler.actual_src_rate == 11040
+
+    src = np.rint(tone(11040, 11040 * 3)).astype(np.int16)
+    out = np.concatenate([resampler.process(src[i:i + 1000]) for i in range(0, len(src), 1000)]
+                         + [resampler.flush()]).astype(np.float64)
+    assert abs(len(out) - 44100 * 3) <= 1
+    mid = slice(4410, len(out) - 4410)
+    assert snr_db(out[mid], tone(44100, len(out))[mid]) > 75
+
+
+def test_retuned_is_seamless():
+    dst = 48000
+    resampler = Resampler(22050, dst)
+    src = np.rint(tone(22050, 44100)).astype(np.int16)
+    parts = [resampler.process(src[:22050])]
+    resampler = resampler.retuned(22050 * 1.2)
+    parts += [resampler.process(src[22050:]), resampler.flush()]
+    out = np.concatenate(parts).astype(np.float64)
+
+    # The output reads the input 1.2x faster from the change on, with no
+    # gap or fade where the resamplers meet
+    switch = len(parts[0])
+    steps = np.where(np.arange(len(out)) < switch, 22050 / dst, 22050 * 1.2 / dst)
+    position = np.concatenate(([0.0], np.cumsum(steps)[:-1]))
+    ideal = 8000 * np.sin(2 * np.pi * 440 * position / 22050)
+    near = slice(switch - dst // 100, switch + dst // 100)
+    assert np.max(np.abs(out[near] - ideal[near])) < 4
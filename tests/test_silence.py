@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from readtome.audio_store import AudioStore
+from readtome.silence import trim_silence, trim_silence_blocks
+
+SR = 22050
+
+
+def sentence(rng) -> np.ndarray:
+    """Voiced bursts between pauses, with silence at both ends."""
+    parts = [np.zeros(int(SR * 0.3))]
+    for seconds in (0.6, 0.9, 0.4):
+        t = np.arange(int(SR * seconds)) / SR
+        parts += [6000 * np.sin(2 * np.pi * 180 * t), np.zeros(int(SR * 0.7))]
+    audio = np.concatenate(parts)
+    return (audio + rng.normal(0, 3, len(audio))).astype(np.int16)
+
+
+@pytest.mark.parametrize("lead, tail", [(True, True), (False, True), (True, False), (False, False)])
+@pytest.mark.parametrize("codec", ["off", "lossless"])
+def test_blocks_trim_like_whole_array(lead, tail, codec):
+    samples = sentence(np.random.default_rng(0))
+    expected, expected_removed = trim_silence(samples, SR, 200, 400, lead=lead, tail=tail)
+
+    store = AudioStore.from_array(samples, codec)
+    blocks, removed = trim_silence_blocks(store.blocks, SR, 200, 400, lead=lead, tail=tail)
+    assert removed == expected_removed
+    np.testing.assert_array_equal(np.concatenate(list(blocks)), expected)
+
+
+# 200 ms is 20 whole 10 ms frames
+@pytest.mark.parametrize("tail, kept", [(True, 20 * (SR // 100)), (False, SR)])
+def test_all_silent_keeps_gap(tail, kept):
+    samples = np.zeros(SR, dtype=np.int16)
+    trimmed, removed = trim_silence(samples, SR, 200, tail=tail)
+    assert len(trimmed) == kept
+    assert removed == SR - kept
+
+    store = AudioStore.from_array(samples, "lossless")
+    blocks, removed = trim_silence_blocks(store.blocks, SR, 200, tail=tail)
+    assert removed == SR - kept
+    assert sum(len(block) for block in blocks) == kept
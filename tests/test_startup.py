@@ -0,0 +1,28 @@
+import builtins
+import time
+
+from readtome.startup import StartupTimer
+
+
+def test_complete_start_restores_import_hook(capsys):
+    original = builtins.__import__
+    timer = StartupTimer(time.perf_counter(), track_imports=True)
+    assert builtins.__import__ is not original
+    for name in ("hotkey", "tray", "ready"):
+        timer.mark(name)
+    assert builtins.__import__ is original
+    assert "incomplete" not in capsys.readouterr().out
+
+
+def test_failed_start_restores_hook_and_reports_once(capsys):
+    original = builtins.__import__
+    timer = StartupTimer(time.perf_counter(), track_imports=True)
+    timer.mark("hotkey")
+    timer.finish("voice failed to load")
+    timer.finish("exited during startup")
+    assert builtins.__import__ is original
+
+    out = capsys.readouterr().out
+    assert out.count("Startup report") == 1
+    assert "incomplete: voice failed to load" in out
+    assert "time-to-hotkey-registered" in out
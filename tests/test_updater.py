@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from readtome import updater
+
+RELEASE = {"tag_name": "v9.9.9", "name": "ReadToMe 9.9.9"}
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    path = tmp_path / "update_cache.json"
+    monkeypatch.setattr(updater, "_CACHE_FILE", path)
+    return path
+
+
+@pytest.fixture
+def release_url(http_server):
+    http_server.files["release.json"] = json.dumps(RELEASE).encode()
+    http_server.etags["release.json"] = '"abc123"'
+    return http_server.url("release.json")
+
+
+def test_first_fetch_is_cached_with_its_etag(http_server, cache_file, release_url):
+    assert updater.fetch_release(release_url) == RELEASE
+    assert http_server.if_none_match == [None]
+    cached = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert cached[release_url] == {"etag": '"abc123"', "data": RELEASE}
+
+
+def test_not_modified_returns_cached_body(http_server, cache_file, release_url):
+    updater.fetch_release(release_url)
+    # Changed on disk but not on the server's ETag: only the cache can answer
+    http_server.files["release.json"] = b"not json"
+    assert updater.fetch_release(release_url) == RELEASE
+    assert http_server.if_none_match == [None, '"abc123"']
+
+
+def test_new_etag_replaces_cached_body(http_server, cache_file, release_url):
+    updater.fetch_release(release_url)
+    newer = dict(RELEASE, tag_name="v10.0.0")
+    http_server.files["release.json"] = json.dumps(newer).encode()
+    http_server.etags["release.json"] = '"def456"'
+    assert updater.fetch_release(release_url) == newer
+    assert json.loads(cache_file.read_text(encoding="utf-8"))[release_url]["etag"] == '"def456"'
+
+
+@pytest.mark.parametrize("content", [
+    "{not json",
+    "[1, 2, 3]",
+    '{"URL": {"etag": "\\"abc123\\""}}',
+])
+def test_corrupt_cache_falls_back_to_full_fetch(http_server, cache_file, release_url, content):
+    cache_file.write_text(content.replace("URL", release_url), encoding="utf-8")
+    assert updater.fetch_release(release_url) == RELEASE
+    # No conditional request without a usable cached body
+    assert http_server.if_none_match == [None]
+    assert json.loads(cache_file.read_text(encoding="utf-8"))[release_url]["data"] == RELEASE
@@ -0,0 +1,73 @@
+import hashlib
+import json
+import threading
+
+from readtome import voice_manager
+from readtome.voice_manager import AlreadyDownloading, VoiceManager
+
+MODEL = b"onnx model bytes" * 5000
+CONFIG = json.dumps({"audio": {"sample_rate": 22050}}).encode()
+KEY = "en_US-test-medium"
+
+
+def _catalog(model=MODEL):
+    files = {}
+    for name, data in ((f"{KEY}.onnx", model), (f"{KEY}.onnx.json", CONFIG)):
+        files[f"en/en_US/test/medium/{name}"] = {
+            "size_bytes": len(data), "md5_digest": hashlib.md5(data).hexdigest(),
+        }
+    return {KEY: {"key": KEY, "language": {"code": "en_US"}, "files": files}}
+
+
+def _manager(http_server, tmp_path, monkeypatch, catalog):
+    monkeypatch.setattr(voice_manager, "_CATALOG_FILE", tmp_path / "catalog.json")
+    for rel_path in catalog[KEY]["files"]:
+        http_server.files[rel_path] = MODEL if rel_path.endswith(".onnx") else CONFIG
+    http_server.files["voices.json"] = json.dumps(catalog).encode()
+    models = tmp_path / "models"
+    models.mkdir()
+    return VoiceManager(models, base_url=http_server.url("").rstrip("/")), models
+
+
+def test_installs_voice(http_server, tmp_path, monkeypatch):
+    manager, models = _manager(http_server, tmp_path, monkeypatch, _catalog())
+
+    assert manager.download([KEY]) == {KEY: None}
+    assert (models / f"{KEY}.onnx").read_bytes() == MODEL
+    assert (models / f"{KEY}.onnx.json").read_bytes() == CONFIG
+    assert not (models / ".download").exists()
+
+
+def test_checksum_mismatch_is_reported_and_not_installed(http_server, tmp_path, monkeypatch):
+    manager, models = _manager(http_server, tmp_path, monkeypatch, _catalog(model=b"x" * len(MODEL)))
+
+    error = manager.download([KEY])[KEY]
+    assert isinstance(error, ValueError)
+    assert not (models / f"{KEY}.onnx").exists()
+
+
+def test_voice_already_downloading_is_reported_pending(http_server, tmp_path, monkeypatch):
+    manager, models = _manager(http_server, tmp_path, monkeypatch, _catalog())
+    started, release = threading.Event(), threading.Event()
+    original = manager._download_file
+
+    def slow_download(*args):
+        started.set()
+        release.wait(10)
+        original(*args)
+
+    monkeypatch.setattr(manager, "_download_file", slow_download)
+    first = {}
+    thread = threading.Thread(target=lambda: first.update(manager.download([KEY])))
+    thread.start()
+    assert started.wait(10)
+
+    second = manager.download([KEY])
+    assert isinstance(second[KEY], AlreadyDownloading)
+    # The running download's staging directory is left alone
+    assert (models / ".download").is_dir()
+
+    release.set()
+    thread.join(10)
+    assert first == {KEY: None}
+    assert (models / f"{KEY}.onnx").exists()